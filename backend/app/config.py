@@ -1,20 +1,20 @@
 from functools import lru_cache
-from typing import List, Optional
+from typing import Optional, Tuple
 
-from pydantic_settings import BaseSettings
+from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
 class Settings(BaseSettings):
+    model_config = SettingsConfigDict(env_file=".env", frozen=True)
+
     mongodb_uri: Optional[str] = None
     openai_api_key: Optional[str] = None
+    perplexity_api_key: Optional[str] = None
     gcs_bucket: str = "scraped-financial-data"
-    cors_origins: List[str] = ["http://localhost:3000"]
+    cors_origins: Tuple[str, ...] = ("http://localhost:3000",)
     environment: str = "development"
     engine_name: str = "gpt-4o"
 
-    class Config:
-        env_file = ".env"
-
 
 @lru_cache()
 def get_settings() -> Settings:
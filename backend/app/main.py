@@ -1,10 +1,9 @@
+import asyncio
 import logging
-import os
-import traceback
 from contextlib import asynccontextmanager
-from datetime import datetime
-from typing import Annotated
+from datetime import datetime, timezone
 
+import orjson
 from app.config import get_settings
 from app.models.page_rendering import SelectionRequest
 from app.models.recommendations.interactions import (
@@ -12,12 +11,14 @@ from app.models.recommendations.interactions import (
     InteractionType,
     ReadStartData,
 )
+from app.services.mongo import get_mongo_client
 from app.services.query_suggestions.database import DatabaseClient
 from app.services.query_suggestions.learning import LearningService
 from app.services.query_suggestions.llm import LLMService
 from app.services.query_suggestions.suggestions import SuggestionsService
 from app.services.recommendations.orchestrator import RecommendationOrchestrator
-from fastapi import Depends, FastAPI, HTTPException
+from app.services.recommendations.progress import BatchingSender
+from fastapi import FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.websockets import WebSocket
 
@@ -25,46 +26,61 @@ from fastapi.websockets import WebSocket
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-# Store service instances globally
-suggestions_service = None
-recommendation_orchestrator = None
+# Settings are read once at import and shared by startup and middleware
+SETTINGS = get_settings()
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan manager."""
-    global suggestions_service, recommendation_orchestrator
 
     # Startup
-    settings = get_settings()
+    if not SETTINGS.openai_api_key:
+        raise RuntimeError("OPENAI_API_KEY is required")
+
     try:
+        # One Motor client (and connection pool) shared by every service
+        mongo_client = get_mongo_client(SETTINGS.mongodb_uri)
+
         # Initialize database
-        db_client = DatabaseClient(settings.mongodb_uri)
-        await db_client.init_indexes()
+        db_client = DatabaseClient(client=mongo_client)
 
         # Initialize suggestion services (existing code)
-        llm_service = LLMService(os.getenv("OPENAI_API_KEY"), "gpt-4o-mini")
+        llm_service = LLMService(SETTINGS.openai_api_key, "gpt-4o-mini")
         learning_service = LearningService(llm_service, db_client)
         suggestions_service = SuggestionsService(
             llm_service, db_client, learning_service
         )
 
         # Initialize recommendation orchestrator (new)
-        recommendation_orchestrator = RecommendationOrchestrator(
-            mongodb_uri=settings.mongodb_uri,
-            perplexity_api_key=os.getenv("PERPLEXITY_API_KEY"),
+        orchestrator = RecommendationOrchestrator(
+            mongodb_uri=SETTINGS.mongodb_uri,
+            mongo_client=mongo_client,
+            perplexity_api_key=SETTINGS.perplexity_api_key,
             model="gpt-4o",
             max_attempts=3,
         )
 
-        # Initialize services
-        await suggestions_service.initialize()
+        # Create indexes while the services load their state
+        await asyncio.gather(db_client.init_indexes(), suggestions_service.initialize())
+
+        # Handlers read services straight off app.state
+        app.state.suggestions_service = suggestions_service
+        app.state.orchestrator = orchestrator
+
+        # Build the OpenAPI schema (cached on the app) now rather than on the
+        # first /docs or /openapi.json request
+        if app.openapi_url:
+            app.openapi()
+
         logger.info("Successfully initialized services and database")
     except Exception as e:
-        logger.error(f"Failed to initialize: {str(e)}")
+        logger.error("Failed to initialize: %s", e)
         raise
     yield
-    # Shutdown cleanup would go here
+
+    # Shutdown
+    await app.state.orchestrator.close()
 
 
 app = FastAPI(
@@ -72,107 +88,92 @@ app = FastAPI(
     description="API for personalized learning recommendations and query suggestions",
     version="1.0.0",
     lifespan=lifespan,
+    # Skip building the OpenAPI schema (and the docs pages) outside development
+    openapi_url="/openapi.json" if SETTINGS.environment == "development" else None,
 )
 
 # Add CORS middleware
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=get_settings().cors_origins,
+    allow_origins=SETTINGS.cors_origins,
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
 )
 
 
-# Dependencies
-async def get_suggestions_service() -> SuggestionsService:
-    """Dependency to get configured SuggestionsService."""
-    global suggestions_service
-    if suggestions_service is None:
-        raise RuntimeError("SuggestionsService not initialized")
-    return suggestions_service
-
-
-async def get_recommendation_orchestrator() -> RecommendationOrchestrator:
-    """Dependency to get configured RecommendationOrchestrator."""
-    global recommendation_orchestrator
-    if recommendation_orchestrator is None:
-        raise RuntimeError("RecommendationOrchestrator not initialized")
-    return recommendation_orchestrator
-
-
 @app.websocket("/ws/query")
-async def websocket_query(
-    websocket: WebSocket,
-    user_id: str,
-    query: str,
-    orchestrator: Annotated[
-        RecommendationOrchestrator, Depends(get_recommendation_orchestrator)
-    ],
-    service: Annotated[SuggestionsService, Depends(get_suggestions_service)],
-):
+async def websocket_query(websocket: WebSocket, user_id: str, query: str):
     """WebSocket endpoint for query processing with progress updates."""
+    orchestrator: RecommendationOrchestrator = websocket.app.state.orchestrator
+    service: SuggestionsService = websocket.app.state.suggestions_service
+
+    # One timestamp for everything recorded while handling this query
+    request_ts = datetime.now(timezone.utc)
+
     await websocket.accept()
+    sender = BatchingSender(websocket)
 
     try:
         # Get recommendations with progress updates
         recommendations = await orchestrator.process_with_progress(
-            user_id=user_id, query=query, websocket=websocket
+            user_id=user_id, query=query, websocket=sender, at=request_ts
         )
 
-        # Tell the frontend that we're getting suggestions
-        await websocket.send_json({"step": "suggestions"})
+        # Tell the frontend that we're getting suggestions; this rides along
+        # with whatever progress updates are still queued
+        await sender.send_json({"step": "suggestions"})
 
         # Get suggestions after recommendations
         suggestions = await service.get_personalized_suggestions(user_id, query)
 
         # Send final response
-        await websocket.send_json(
+        await sender.send_json(
             {
                 "type": "complete",
                 "data": {
                     "recommendations": recommendations,
-                    "suggestions": suggestions.model_dump(),
+                    # Serialized by pydantic-core and spliced in as-is
+                    "suggestions": orjson.Fragment(suggestions.model_dump_json()),
                 },
             }
         )
 
     except Exception as e:
-        await websocket.send_json({"type": "error", "message": str(e)})
+        await sender.send_json({"type": "error", "message": str(e)})
     finally:
+        await sender.flush()
         await websocket.close()
 
 
-@app.post("/api/selection")
-async def record_selection(
-    request: SelectionRequest,
-    orchestrator: Annotated[
-        RecommendationOrchestrator, Depends(get_recommendation_orchestrator)
-    ],
-):
+@app.post("/api/selection", status_code=202)
+async def record_selection(request: Request, selection: SelectionRequest):
     """Record selected suggestion or recommendation."""
+    orchestrator: RecommendationOrchestrator = request.app.state.orchestrator
+
     try:
-        logger.info(f"Recording selection for user {request.user_id}")
+        logger.info("Recording selection for user %s", selection.user_id)
 
         # Create proper ContentInteraction instance
         interaction = ContentInteraction(
-            timestamp=datetime.now(),
-            content_id=request.selected_suggestion,  # Using URL for now as content ID
-            content_url=request.selected_suggestion,
+            timestamp=datetime.now(timezone.utc),
+            content_id=selection.selected_suggestion,  # Using URL for now as content ID
+            content_url=selection.selected_suggestion,
             interaction_type=InteractionType.read_start,
             interaction_data=ReadStartData(
                 section="introduction"
             ),  # They're starting to read
-            query_context=request.original_query,
+            query_context=selection.original_query,
             moment_context=None,  # Optional field
         )
 
-        await orchestrator.track_interaction(request.user_id, interaction)
-        return {"status": "success"}
+        # Only queues the interaction, waiting only while the write queue is
+        # full; it is written in the next batch
+        await orchestrator.track_interaction(selection.user_id, interaction)
+        return {"status": "accepted"}
 
     except Exception as e:
-        logger.error(f"Error recording selection: {str(e)}")
-        logger.error(traceback.format_exc())
+        logger.error("Error recording selection: %s", e, exc_info=True)
         raise HTTPException(
             status_code=500, detail=f"Error recording selection: {str(e)}"
         )
@@ -182,3 +183,11 @@ async def record_selection(
 async def health_check():
     """Health check endpoint."""
     return {"status": "healthy"}
+
+
+if __name__ == "__main__":
+    import uvicorn
+
+    # uvloop's event loop gives noticeably better socket throughput than the
+    # default asyncio loop for the Mongo / LLM round-trips this app is bound by
+    uvicorn.run("app.main:app", host="0.0.0.0", port=8000, loop="uvloop")
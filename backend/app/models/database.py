@@ -1,10 +1,12 @@
 from datetime import datetime
-from typing import Any, Dict, Optional
+from typing import Dict, List, Optional
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 
 class QueryDocument(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     user_id: str
     text: str
     timestamp: float
@@ -21,12 +23,12 @@ class LearningPathDocument(BaseModel):
     current_focus: str
     knowledge_gaps: list[str]
     next_suggested_topics: list[str]
-    created_at: datetime
-    updated_at: datetime
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
 
 
 class UserLearningProfileDocument(BaseModel):
     user_id: str
-    topic_knowledge: Dict[str, Any]  # Stores TopicKnowledgeDocument
-    active_learning_paths: list[Any]  # Stores LearningPathDocument
+    topic_knowledge: Dict[str, TopicKnowledgeDocument]
+    active_learning_paths: List[LearningPathDocument]
     recent_interests: list[str]
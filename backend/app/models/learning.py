@@ -1,9 +1,11 @@
 from typing import Dict, List
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class TopicKnowledge(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     topic: str = Field(description="The main topic or subject area")
     known_concepts: List[str] = Field(
         description="List of concepts and topics already understood",
@@ -1,9 +1,9 @@
-from enum import Enum
+from enum import StrEnum
 
 from pydantic import BaseModel
 
 
-class ProcessStep(str, Enum):
+class ProcessStep(StrEnum):
     INITIAL = "initial"  # Getting Perplexity response
     ANALYZING = "analyzing"  # Analyzing query lines
     KNOWLEDGE = "knowledge"  # Analyzing knowledge state
@@ -1,9 +1,11 @@
 from typing import Dict, List, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class Query(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     text: str
     timestamp: float
     response_selected: Optional[str] = None
@@ -1,7 +1,7 @@
 from datetime import datetime
 from typing import List, Optional, Union
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class CompanyMention(BaseModel):
@@ -26,6 +26,8 @@ class FinancialMetric(BaseModel):
 class ExtractedSection(BaseModel):
     """A logical section of the content."""
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     title: Optional[str] = None
     content: str
     key_points: List[str] = Field(description="Main points from this section")
@@ -1,5 +1,6 @@
 from typing import List
 
+from app.models.recommendations.scores import UnitFloat
 from pydantic import BaseModel, Field
 
 
@@ -8,7 +9,7 @@ class ContentValue(BaseModel):
 
     content_id: str
     url: str
-    value_score: float = Field(description="Overall value score (0-1)")
+    value_score: UnitFloat = Field(description="Overall value score (0-1)")
     explanation: str = Field(
         description="Clear explanation of why this content is valuable"
     )
@@ -24,7 +25,7 @@ class ContentEvaluation(BaseModel):
     is_valuable: bool = Field(description="Whether content provides genuine value")
     explanation: str = Field(description="Why content is/isn't valuable")
     relevant_sections: List[str] = Field(description="Section IDs that provide value")
-    value_score: float = Field(description="Value score if valuable (0-1)")
+    value_score: UnitFloat = Field(description="Value score if valuable (0-1)")
 
 
 class FilteredContent(BaseModel):
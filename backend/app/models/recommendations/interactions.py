@@ -1,8 +1,13 @@
-from datetime import datetime
-from enum import Enum
-from typing import List, Optional, Union
+from datetime import datetime, timezone
+from enum import StrEnum
+from functools import partial
+from typing import Annotated, List, Literal, Optional, Union
 
-from pydantic import BaseModel, Field
+from app.models.recommendations.scores import UnitFloat
+from pydantic import BaseModel, ConfigDict, Field
+
+# Bound once so each default timestamp is a single C call
+_utc_now = partial(datetime.now, timezone.utc)
 
 
 class HighlightedContent(BaseModel):
@@ -12,12 +17,15 @@ class HighlightedContent(BaseModel):
     surrounding_context: Optional[str] = Field(
         description="Text before/after highlight for context", default=None
     )
-    timestamp: datetime = Field(default_factory=datetime.now)
+    timestamp: datetime = Field(default_factory=_utc_now)
 
 
 class ReadStartData(BaseModel):
     """Data for when user starts reading content."""
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
+    kind: Literal["read_start"] = "read_start"
     section: Optional[str] = Field(
         description="Section of content where reading started", default=None
     )
@@ -26,6 +34,9 @@ class ReadStartData(BaseModel):
 class ReadEndData(BaseModel):
     """Data for when user finishes reading content."""
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
+    kind: Literal["read_end"] = "read_end"
     read_duration_seconds: int = Field(description="Time spent reading")
     completed: bool = Field(description="Whether they finished the content")
 
@@ -33,6 +44,9 @@ class ReadEndData(BaseModel):
 class HighlightData(BaseModel):
     """Data for content highlighting interaction."""
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
+    kind: Literal["highlight"] = "highlight"
     highlighted_text: str
     surrounding_context: Optional[str] = None
     section: Optional[str] = None
@@ -41,6 +55,9 @@ class HighlightData(BaseModel):
 class ReferenceClickData(BaseModel):
     """Data for when user clicks a reference/link."""
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
+    kind: Literal["click_reference"] = "click_reference"
     reference_text: str
     reference_url: str
     section: Optional[str] = None
@@ -49,28 +66,38 @@ class ReferenceClickData(BaseModel):
 class ProgressUpdateData(BaseModel):
     """Data for reading progress updates."""
 
-    progress: float = Field(ge=0.0, le=1.0)
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
+    kind: Literal["progress_update"] = "progress_update"
+    progress: UnitFloat
     current_section: Optional[str] = None
 
 
 class FollowUpQueryData(BaseModel):
     """Data for follow-up queries after reading."""
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
+    kind: Literal["follow_up_query"] = "follow_up_query"
     query: str
     related_section: Optional[str] = None
 
 
-InteractionData = Union[
-    ReadStartData,
-    ReadEndData,
-    HighlightData,
-    ReferenceClickData,
-    ProgressUpdateData,
-    FollowUpQueryData,
+# Tagged by `kind` so validation dispatches straight to the matching model
+InteractionData = Annotated[
+    Union[
+        ReadStartData,
+        ReadEndData,
+        HighlightData,
+        ReferenceClickData,
+        ProgressUpdateData,
+        FollowUpQueryData,
+    ],
+    Field(discriminator="kind"),
 ]
 
 
-class InteractionType(str, Enum):
+class InteractionType(StrEnum):
     read_start = "read_start"
     read_end = "read_end"
     highlight = "highlight"
@@ -82,7 +109,9 @@ class InteractionType(str, Enum):
 class ContentInteraction(BaseModel):
     """Raw interaction data with recommended content."""
 
-    timestamp: datetime = Field(default_factory=datetime.now)
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
+    timestamp: datetime = Field(default_factory=_utc_now)
     content_id: str = Field(description="Unique identifier for the content")
     content_url: str = Field(description="URL where content was found")
     interaction_type: InteractionType = Field(description="Type of interaction")
@@ -111,7 +140,7 @@ class RecommendationContext(BaseModel):
 class ContentSelection(BaseModel):
     """Track which recommended content was selected."""
 
-    timestamp: datetime = Field(default_factory=datetime.now)
+    timestamp: datetime = Field(default_factory=_utc_now)
     user_id: str
     content_id: str
     recommendation_context: RecommendationContext
@@ -128,6 +157,6 @@ class ContentEngagement(BaseModel):
     highlights: Optional[List[HighlightedContent]] = None
     clicked_references: Optional[List[str]] = None
     follow_up_queries: Optional[List[str]] = None
-    reading_progress: Optional[float] = Field(
-        description="Progress through content (0-1)", ge=0.0, le=1.0, default=None
+    reading_progress: Optional[UnitFloat] = Field(
+        description="Progress through content (0-1)", default=None
     )
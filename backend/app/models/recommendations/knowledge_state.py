@@ -1,10 +1,12 @@
 from typing import List
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class ConceptEvidence(BaseModel):
     """Evidence of concept understanding or exposure"""
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     source: str = Field(description="Source of evidence (e.g., 'query', 'response')")
     text: str = Field(description="The actual text showing evidence")
 
@@ -12,6 +14,8 @@ class ConceptEvidence(BaseModel):
 class ConceptUnderstanding(BaseModel):
     """Understanding of a specific concept"""
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     concept: str = Field(description="The specific concept")
     demonstrated_level: float = Field(
         description="Level of demonstrated understanding (0-1)"
@@ -1,6 +1,7 @@
 from enum import Enum
 from typing import List
 
+from app.models.recommendations.scores import UnitFloat
 from pydantic import BaseModel, Field
 
 
@@ -18,7 +19,7 @@ class MomentDetection(BaseModel):
 
     is_moment: bool = Field(description="Whether this is a valuable learning moment")
     moment_type: LearningMoment = Field(description="Type of learning moment detected")
-    confidence: float = Field(
+    confidence: UnitFloat = Field(
         description="Confidence in the detection, between 0 and 1"
     )
     reasoning: str = Field(description="Why this moment was detected")
@@ -1,5 +1,6 @@
 from typing import Dict, List
 
+from app.models.recommendations.scores import UnitFloat
 from pydantic import BaseModel, Field
 
 
@@ -25,7 +26,7 @@ class SelectionPattern(BaseModel):
     learning_signals: Dict[str, str] = Field(
         description="Signals about learning behavior"
     )
-    effectiveness_score: float = Field(
+    effectiveness_score: UnitFloat = Field(
         description="How effective selections are, between 0 and 1"
     )
     suggestions: List[str] = Field(description="Ways to improve selection impact")
@@ -34,7 +35,7 @@ class SelectionPattern(BaseModel):
 class LearningImpact(BaseModel):
     """Impact of specific learning interactions."""
 
-    impact_score: float = Field(description="Overall impact score between 0 and 1")
+    impact_score: UnitFloat = Field(description="Overall impact score between 0 and 1")
     key_learnings: List[str] = Field(description="Main concepts learned")
     skill_progress: Dict[str, float] = Field(description="Progress in specific skills")
     development_areas: List[str] = Field(description="Areas needing more focus")
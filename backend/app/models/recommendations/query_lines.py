@@ -1,8 +1,13 @@
-from datetime import datetime
+from datetime import datetime, timezone
+from functools import partial
 from typing import List
 
 from pydantic import BaseModel, Field
 
+# Same UTC clock as the interaction models; the line manager stamps lines with
+# the request's UTC timestamp, so the default has to match
+_utc_now = partial(datetime.now, timezone.utc)
+
 
 class QueryLine(BaseModel):
     """A sequence of related queries pursuing a specific goal"""
@@ -13,7 +18,7 @@ class QueryLine(BaseModel):
     timestamps: List[datetime] = Field(description="When each query was made")
     responses: List[str] = Field(description="Perplexity's responses")
     line_topic: str = Field(description="High-level topic this line explores")
-    last_updated: datetime = Field(default_factory=datetime.now)
+    last_updated: datetime = Field(default_factory=_utc_now)
 
 
 class LineAnalysis(BaseModel):
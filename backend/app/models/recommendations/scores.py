@@ -0,0 +1,7 @@
+from typing import Annotated
+
+from pydantic import Field
+
+# Scores, confidences and progress fractions in [0, 1]. Strict so the value is
+# checked by pydantic-core as-is instead of being coerced from strings first.
+UnitFloat = Annotated[float, Field(ge=0.0, le=1.0, strict=True)]
@@ -1,44 +1,138 @@
+import hashlib
+import os
 from pathlib import Path
-from typing import Dict
+from typing import Dict, List, Optional
+
+import orjson
+
+PROMPTS_DIR = Path(__file__).parent
+
+# All prompts in one file, kept with the other local caches rather than in the
+# package so copies of the source tree (e.g. Modal mounts) never carry it along.
+# Named after the prompt directory so separate checkouts don't share one file.
+COMPILED_PROMPTS_PATH = (
+    Path(
+        os.environ.get("LEARNING_AGENT_CACHE_DIR")
+        or Path.home() / ".cache" / "learning-agent"
+    )
+    / f"prompts_{hashlib.sha256(str(PROMPTS_DIR).encode()).hexdigest()[:16]}.json"
+)
+
+
+def _prompt_files(base_dir: Path) -> List[os.DirEntry]:
+    """All .txt entries in a prompt directory tree."""
+    files = []
+    with os.scandir(base_dir) as entries:
+        for entry in entries:
+            if entry.is_dir():
+                files.extend(_prompt_files(Path(entry.path)))
+            elif entry.name.endswith(".txt"):
+                files.append(entry)
+    return files
+
+
+def _fingerprint() -> str:
+    """Hash every prompt file's relative path, size and mtime.
+
+    Any added, removed, edited or re-copied prompt file changes it, so a
+    compiled file built from a different tree is never served.
+    """
+    digest = hashlib.sha256()
+    entries = []
+    for name in ("system", "user"):
+        if (PROMPTS_DIR / name).exists():
+            entries.extend(_prompt_files(PROMPTS_DIR / name))
+    for entry in sorted(entries, key=lambda entry: entry.path):
+        stat = entry.stat()
+        relative_path = os.path.relpath(entry.path, PROMPTS_DIR)
+        record = f"{relative_path}\0{stat.st_size}\0{stat.st_mtime_ns}\n"
+        digest.update(record.encode())
+    return digest.hexdigest()
+
+
+def _load_compiled_prompts(
+    fingerprint: str,
+) -> Optional[Dict[str, Dict[str, Dict[str, str]]]]:
+    """Load the compiled prompts if they were built from the current files."""
+    try:
+        compiled = orjson.loads(COMPILED_PROMPTS_PATH.read_bytes())
+    except (OSError, ValueError):
+        return None
+    if not isinstance(compiled, dict) or compiled.get("fingerprint") != fingerprint:
+        return None
+    return compiled["prompts"]
+
+
+def _save_compiled_prompts(
+    fingerprint: str, prompts: Dict[str, Dict[str, Dict[str, str]]]
+) -> None:
+    """Write the compiled prompts; failures only cost reading the files again."""
+    tmp_path = COMPILED_PROMPTS_PATH.with_suffix(f".{os.getpid()}.tmp")
+    try:
+        COMPILED_PROMPTS_PATH.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path.write_bytes(
+            orjson.dumps({"fingerprint": fingerprint, "prompts": prompts})
+        )
+        # Replaced atomically so a concurrent import never reads half a file
+        os.replace(tmp_path, COMPILED_PROMPTS_PATH)
+    except OSError:
+        # Read-only homes just load from the prompt files every time
+        pass
 
 
 def load_prompts() -> Dict[str, Dict[str, Dict[str, str]]]:
-    """Load all prompt templates from files with nested subfolder structure."""
-    prompts = {"system": {}, "user": {}}
+    """Load all prompt templates from files with nested subfolder structure.
 
-    prompts_dir = Path(__file__).parent
+    Reads the single compiled file when it was built from the current prompt
+    files; otherwise reads the prompt tree and rewrites it.
+    """
+    fingerprint = _fingerprint()
+    compiled = _load_compiled_prompts(fingerprint)
+    if compiled is not None:
+        return compiled
+
+    prompts = {"system": {}, "user": {}}
 
     def load_prompts_from_directory(base_dir: Path) -> Dict[str, Dict[str, str]]:
         """Recursively load prompts from a given base directory."""
         prompts_dict = {}
-        for file_or_folder in base_dir.iterdir():
-            if file_or_folder.is_dir():
-                # Recursively load subfolders
-                prompts_dict[file_or_folder.name] = load_prompts_from_directory(
-                    file_or_folder
-                )
-
-            elif file_or_folder.is_file() and file_or_folder.suffix == ".txt":
-                # Load text files
-                prompt_name = file_or_folder.stem
-                if prompt_name in prompts_dict:
-                    raise ValueError(
-                        f"Duplicate prompt name: {prompt_name} in {file_or_folder.parent}"  # noqa: E501
+        # scandir entries carry the file type from the directory listing, so
+        # is_dir()/is_file() don't need a stat() call per entry
+        with os.scandir(base_dir) as entries:
+            for entry in entries:
+                if entry.is_dir():
+                    # Recursively load subfolders
+                    prompts_dict[entry.name] = load_prompts_from_directory(
+                        Path(entry.path)
+                    )
+
+                elif entry.is_file() and entry.name.endswith(".txt"):
+                    # Load text files
+                    prompt_name = entry.name.removesuffix(".txt")
+                    if prompt_name in prompts_dict:
+                        raise ValueError(
+                            f"Duplicate prompt name: {prompt_name} in {base_dir}"
+                        )
+                    # Prompts are UTF-8; decode the bytes directly instead
+                    # of going through a text-mode file object
+                    prompts_dict[prompt_name] = (
+                        Path(entry.path).read_bytes().decode("utf-8").strip()
                     )
-                prompts_dict[prompt_name] = file_or_folder.read_text().strip()
 
         return prompts_dict
 
     # Load system prompts.
-    system_dir = prompts_dir / "system"
+    system_dir = PROMPTS_DIR / "system"
     if system_dir.exists():
         prompts["system"] = load_prompts_from_directory(system_dir)
 
     # Load user prompts.
-    user_dir = prompts_dir / "user"
+    user_dir = PROMPTS_DIR / "user"
     if user_dir.exists():
         prompts["user"] = load_prompts_from_directory(user_dir)
 
+    _save_compiled_prompts(fingerprint, prompts)
+
     return prompts
 
 
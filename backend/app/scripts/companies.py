@@ -1,5 +1,6 @@
 """Company information for scraping."""
 
+from collections import defaultdict
 from typing import Dict, List
 
 COMPANIES = {
@@ -500,8 +501,8 @@ COMPANIES = {
 }
 
 
-def get_all_companies() -> List[Dict]:
-    """Get flat list of all companies."""
+def _flatten_companies() -> List[Dict]:
+    """Flatten COMPANIES into one list, tagging each with sector and cap level."""
     companies = []
     for sector, cap_levels in COMPANIES.items():
         for cap_level, company_list in cap_levels.items():
@@ -510,23 +511,34 @@ def get_all_companies() -> List[Dict]:
     return companies
 
 
+# Lookup tables built once at import
+_ALL_COMPANIES = _flatten_companies()
+_COMPANIES_BY_SYMBOL = {
+    # CIKs are padded to the 10 digits SEC URLs expect
+    company["symbol"]: {**company, "cik": str(company["cik"]).zfill(10)}
+    for company in _ALL_COMPANIES
+}
+_COMPANIES_BY_SECTOR = defaultdict(list)
+for _company in _ALL_COMPANIES:
+    _COMPANIES_BY_SECTOR[_company["sector"]].append(_company)
+
+
+def get_all_companies() -> List[Dict]:
+    """Get flat list of all companies."""
+    # Copied so callers can sort it in place
+    return list(_ALL_COMPANIES)
+
+
 def get_company_by_symbol(symbol: str) -> Dict:
     """Get company info by symbol."""
-    for sector in COMPANIES.values():
-        for cap in sector.values():
-            for company in cap:
-                if company["symbol"] == symbol:
-                    # Ensure CIK is padded to 10 digits
-                    company["cik"] = str(company["cik"]).zfill(10)
-                    return company
-    return None
+    return _COMPANIES_BY_SYMBOL.get(symbol)
 
 
 def get_symbols() -> List[str]:
     """Get list of all company symbols."""
-    return [company["symbol"] for company in get_all_companies()]
+    return list(_COMPANIES_BY_SYMBOL)
 
 
 def get_companies_by_sector(sector: str) -> List[Dict]:
     """Get all companies in a sector."""
-    return [company for company in get_all_companies() if company["sector"] == sector]
+    return list(_COMPANIES_BY_SECTOR.get(sector, []))
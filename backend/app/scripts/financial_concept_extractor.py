@@ -1,37 +1,71 @@
+import heapq
 import logging
 from collections import defaultdict
+from operator import itemgetter
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, List, NamedTuple
 
-import spacy
+import numpy as np
 import yaml
+from app.scripts.nlp import get_nlp
+from spacy.matcher import PhraseMatcher
 
 logger = logging.getLogger(__name__)
 
 
+class _ConceptHits(NamedTuple):
+    """Concept hits in a document, one entry per hit across the parallel lists."""
+
+    concept_paths: List[str]
+    similarities: List[float]
+    span_starts: List[int]
+    span_ends: List[int]
+    sent_ids: List[int]
+    sentences: List[str]
+
+
 class FinancialConceptExtractor:
     """Extract financial concepts from text using a structured taxonomy."""
 
     def __init__(self, taxonomy_path: str = "taxonomies/financial_concepts.yaml"):
-        self.nlp = spacy.load("en_core_web_lg")
+        self.nlp = get_nlp()
 
         # Load taxonomy
         with open(Path(__file__).parent / taxonomy_path) as f:
             self.taxonomy = yaml.safe_load(f)
 
-        # Build concept vectors for efficient matching
+        # Build concept vectors (and exact-phrase patterns) for efficient matching
         self.concept_vectors = {}
+        self.matcher = PhraseMatcher(self.nlp.vocab, attr="LOWER")
         self._build_concept_vectors()
 
+        # The same vectors as one row-normalized matrix, so a sentence's phrases
+        # can be scored against every concept with a single matmul
+        self._concept_keys = list(self.concept_vectors)
+        if self._concept_keys:
+            matrix = np.stack(list(self.concept_vectors.values())).astype(np.float32)
+            matrix /= np.linalg.norm(matrix, axis=1, keepdims=True)
+        else:
+            matrix = np.empty((0, self.nlp.vocab.vectors_length), dtype=np.float32)
+        self._concept_matrix = matrix
+
     def _build_concept_vectors(self):
-        """Pre-compute vectors for all concepts in taxonomy."""
+        """Pre-compute vectors and phrase patterns for all concepts in taxonomy."""
+        keys = []
+        texts = []
         for category, subcategories in self.taxonomy.items():
             for subcategory, concepts in subcategories.items():
                 for concept in concepts:
-                    doc = self.nlp(concept.lower())
-                    if doc.has_vector:
-                        key = f"{category}/{subcategory}/{concept}"
-                        self.concept_vectors[key] = doc.vector
+                    keys.append(f"{category}/{subcategory}/{concept}")
+                    texts.append(concept.lower())
+
+        # Concept vectors are averaged word vectors, so tokenizing is enough;
+        # skip the rest of the pipeline and batch the concepts
+        docs = self.nlp.tokenizer.pipe(texts, batch_size=256)
+        for key, doc in zip(keys, docs):
+            self.matcher.add(key, [doc])
+            if doc.has_vector:
+                self.concept_vectors[key] = doc.vector
 
     def extract_concepts(
         self, text: str, min_similarity: float = 0.6
@@ -52,56 +86,113 @@ class FinancialConceptExtractor:
             ]
         }
         """
-        doc = self.nlp(text)
+        return self._concepts_from_doc(self.nlp(text), min_similarity)
+
+    def extract_concepts_batch(
+        self,
+        texts: List[str],
+        min_similarity: float = 0.6,
+        batch_size: int = 32,
+        n_process: int = 1,
+    ) -> List[Dict[str, List[Dict]]]:
+        """Extract financial concepts from many texts, batching spaCy inference."""
+        docs = self.nlp.pipe(texts, batch_size=batch_size, n_process=n_process)
+        return [self._concepts_from_doc(doc, min_similarity) for doc in docs]
+
+    def _concepts_from_doc(self, doc, min_similarity: float) -> Dict[str, List[Dict]]:
+        """Match a parsed document's phrases against the taxonomy concepts."""
+        hits = self._match_doc(doc, min_similarity)
+
+        # Materialize the per-hit dicts only now, grouped by category
         concepts = defaultdict(list)
+        for path, similarity, start, end, sent_id in zip(
+            hits.concept_paths,
+            hits.similarities,
+            hits.span_starts,
+            hits.span_ends,
+            hits.sent_ids,
+        ):
+            category_key, _, concept = path.rpartition("/")
+            concepts[category_key].append(
+                {
+                    "concept": concept,
+                    "context": hits.sentences[sent_id],
+                    "similarity": similarity,
+                    "span": (start, end),
+                }
+            )
+
+        return dict(concepts)
+
+    def _match_doc(self, doc, min_similarity: float) -> _ConceptHits:
+        """Collect concept hits in a parsed document as parallel arrays."""
+        hits = _ConceptHits([], [], [], [], [], [])
+        sentence_ids = {}
+
+        def sent_id(sent) -> int:
+            if sent.start not in sentence_ids:
+                sentence_ids[sent.start] = len(hits.sentences)
+                hits.sentences.append(sent.text)
+            return sentence_ids[sent.start]
+
+        # Literal (case-insensitive) mentions of taxonomy concepts, found in one
+        # linear pass over the document
+        matched_tokens = set()
+        for match_id, start, end in self.matcher(doc):
+            span = doc[start:end]
+            hits.concept_paths.append(self.nlp.vocab.strings[match_id])
+            hits.similarities.append(1.0)
+            hits.span_starts.append(span.start_char)
+            hits.span_ends.append(span.end_char)
+            hits.sent_ids.append(sent_id(span.sent))
+            matched_tokens.update(range(start, end))
 
         # Process each sentence for better context
         for sent in doc.sents:
-            # Get noun phrases and named entities
-            phrases = list(sent.noun_chunks) + list(sent.ents)
-
-            for phrase in phrases:
-                if not phrase.root.has_vector:
-                    continue
-
-                # Compare with concept vectors
-                for concept_path, concept_vector in self.concept_vectors.items():
-                    similarity = phrase.root.vector.dot(concept_vector) / (
-                        phrase.root.vector_norm * concept_vector.norm()
-                    )
-
-                    if similarity >= min_similarity:
-                        category, subcategory, concept = concept_path.split("/")
-                        key = f"{category}/{subcategory}"
-
-                        concepts[key].append(
-                            {
-                                "concept": concept,
-                                "context": sent.text,
-                                "similarity": float(similarity),
-                                "span": (phrase.start_char, phrase.end_char),
-                            }
-                        )
-
-        return dict(concepts)
+            # Get noun phrases and named entities; ones already matched
+            # literally skip the vector comparison
+            phrases = [
+                phrase
+                for phrase in list(sent.noun_chunks) + list(sent.ents)
+                if phrase.root.has_vector and phrase.root.i not in matched_tokens
+            ]
+            if not phrases:
+                continue
+
+            # Cosine similarity of every phrase against every concept
+            # Kept in float32 like the concept matrix: half precision would
+            # halve the bytes, but numpy has no BLAS path for float16 matmul
+            phrase_matrix = np.stack([phrase.root.vector for phrase in phrases])
+            phrase_matrix = phrase_matrix.astype(np.float32, copy=False)
+            phrase_matrix /= np.linalg.norm(phrase_matrix, axis=1, keepdims=True)
+            similarities = phrase_matrix @ self._concept_matrix.T
+
+            phrase_idxs, concept_idxs = np.nonzero(similarities >= min_similarity)
+            if not len(phrase_idxs):
+                continue
+
+            sentence = sent_id(sent)
+            hits.concept_paths.extend(self._concept_keys[i] for i in concept_idxs)
+            hits.similarities.extend(similarities[phrase_idxs, concept_idxs].tolist())
+            for phrase_idx in phrase_idxs:
+                phrase = phrases[phrase_idx]
+                hits.span_starts.append(phrase.start_char)
+                hits.span_ends.append(phrase.end_char)
+            hits.sent_ids.extend([sentence] * len(phrase_idxs))
+
+        return hits
 
     def get_main_concepts(self, text: str, max_concepts: int = 5) -> List[str]:
         """Get main concepts mentioned in text."""
-        all_concepts = self.extract_concepts(text)
-
-        # Flatten and sort by similarity
-        concept_list = []
-        for category_concepts in all_concepts.values():
-            concept_list.extend(category_concepts)
-
-        concept_list.sort(key=lambda x: x["similarity"], reverse=True)
-
-        # Return unique concepts
-        seen = set()
-        main_concepts = []
-        for concept in concept_list:
-            if concept["concept"] not in seen and len(main_concepts) < max_concepts:
-                seen.add(concept["concept"])
-                main_concepts.append(concept["concept"])
-
-        return main_concepts
+        hits = self._match_doc(self.nlp(text), min_similarity=0.6)
+
+        # Best similarity per concept, then the top few; only the names and scores
+        # are needed, so the per-hit dicts are never built
+        best_similarity = {}
+        for path, similarity in zip(hits.concept_paths, hits.similarities):
+            concept = path.rpartition("/")[2]
+            if similarity > best_similarity.get(concept, float("-inf")):
+                best_similarity[concept] = similarity
+
+        top = heapq.nlargest(max_concepts, best_similarity.items(), key=itemgetter(1))
+        return [concept for concept, _ in top]
@@ -2,12 +2,15 @@
 
 import asyncio
 import logging
-from typing import Any, Dict
+from typing import Any, Dict, List, Optional
 
 from app.config import Settings
-from app.scripts.gcs_utils import list_gcs_files, read_gcs_file
+from app.scripts.gcs_utils import iter_gcs_files, read_gcs_file
+from bson import ObjectId
 from motor.motor_asyncio import AsyncIOMotorClient
-from tqdm import tqdm
+from pymongo import IndexModel, InsertOne, WriteConcern
+from pymongo.errors import BulkWriteError, OperationFailure
+from tqdm.asyncio import tqdm_asyncio
 
 # Configure logging
 logging.basicConfig(
@@ -17,91 +20,221 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Files read from GCS and written to Mongo at the same time
+MAX_CONCURRENT_TRANSFERS = 32
 
-async def setup_indexes(db):
-    """Create necessary indexes for efficient querying."""
+# Marks a reader finishing in the results queue; None there is a failed read
+READER_DONE = object()
+
+# Documents buffered before they are bulk-written
+WRITE_BATCH_SIZE = 500
+
+# Acknowledged but not journaled writes for the content_analysis and
+# topic_analysis bulk inserts
+ANALYSIS_WRITE_CONCERN = WriteConcern(w=1, j=False)
+
+# Non-partial search indexes created by earlier transfers under the default
+# names. The partial indexes replacing them cover the same keys, so these are
+# dropped first to avoid an IndexOptionsConflict.
+LEGACY_INDEXES = {
+    "content_analysis": "main_concepts.name_1_main_concepts.metrics_1",
+    "topic_analysis": "primary_topic.name_1_primary_topic.category_1",
+}
+
+# Server error codes for a missing collection or index
+NAMESPACE_NOT_FOUND = 26
+INDEX_NOT_FOUND = 27
+
+
+async def setup_unique_indexes(db):
+    """Create the indexes the load itself relies on.
+
+    The unique content_id index has to exist before inserting so re-running the
+    transfer doesn't duplicate content.
+    """
     try:
-        # Content collection indexes
         await db.content.create_index("content_id", unique=True)
-        await db.content.create_index("content_type")
-        await db.content.create_index([("timestamp", -1)])
+    except Exception as e:
+        logger.error("Error creating unique indexes: %s", e)
+        raise
 
-        # Analysis collection indexes
-        await db.content_analysis.create_index([("content_id", 1), ("chunk_index", 1)])
-        await db.topic_analysis.create_index([("content_id", 1), ("chunk_index", 1)])
 
-        # Concept indexes for searching
-        await db.content_analysis.create_index(
-            [("main_concepts.name", 1), ("main_concepts.metrics", 1)]
-        )
+async def drop_legacy_indexes(db):
+    """Drop the non-partial search indexes if an earlier transfer created them."""
+    for collection, index in LEGACY_INDEXES.items():
+        try:
+            await db[collection].drop_index(index)
+            logger.info("Dropped legacy index %s on %s", index, collection)
+        except OperationFailure as e:
+            if e.code not in (NAMESPACE_NOT_FOUND, INDEX_NOT_FOUND):
+                raise
 
-        # Topic indexes for searching
-        await db.topic_analysis.create_index(
-            [("primary_topic.name", 1), ("primary_topic.category", 1)]
+
+async def setup_indexes(db):
+    """Create the query indexes.
+
+    Run after the bulk load: building each index once over the loaded data is
+    much cheaper than maintaining it on every insert. The concept and topic
+    indexes are partial, covering only analyses that have those fields.
+    """
+    try:
+        await drop_legacy_indexes(db)
+        await asyncio.gather(
+            # Content collection indexes
+            db.content.create_indexes(
+                [IndexModel("content_type"), IndexModel([("timestamp", -1)])]
+            ),
+            # Analysis collection indexes, plus concept indexes for searching
+            db.content_analysis.create_indexes(
+                [
+                    IndexModel([("content_id", 1), ("chunk_index", 1)]),
+                    IndexModel(
+                        [("main_concepts.name", 1), ("main_concepts.metrics", 1)],
+                        name="main_concepts_partial",
+                        partialFilterExpression={
+                            "main_concepts.name": {"$exists": True}
+                        },
+                    ),
+                ]
+            ),
+            # Topic collection indexes, plus topic indexes for searching
+            db.topic_analysis.create_indexes(
+                [
+                    IndexModel([("content_id", 1), ("chunk_index", 1)]),
+                    IndexModel(
+                        [("primary_topic.name", 1), ("primary_topic.category", 1)],
+                        name="primary_topic_partial",
+                        partialFilterExpression={
+                            "primary_topic.name": {"$exists": True}
+                        },
+                    ),
+                ]
+            ),
         )
 
         logger.info("Successfully created all indexes")
 
     except Exception as e:
-        logger.error(f"Error creating indexes: {str(e)}")
+        logger.error("Error creating indexes: %s", e)
         raise
 
 
-async def store_content_analyses(
-    db, content_id: str, analyses: list[Dict[str, Any]]
-) -> list[str]:
-    """Store content analyses with their chunk index."""
-    analysis_ids = []
-    for idx, analysis in enumerate(analyses):
-        analysis_doc = {"content_id": content_id, "chunk_index": idx, **analysis}
-        result = await db.content_analysis.insert_one(analysis_doc)
-        analysis_ids.append(str(result.inserted_id))
-    return analysis_ids
-
-
-async def store_topic_analyses(
-    db, content_id: str, analyses: list[Dict[str, Any]]
-) -> list[str]:
-    """Store topic analyses with their chunk index."""
-    analysis_ids = []
-    for idx, analysis in enumerate(analyses):
-        analysis_doc = {"content_id": content_id, "chunk_index": idx, **analysis}
-        result = await db.topic_analysis.insert_one(analysis_doc)
-        analysis_ids.append(str(result.inserted_id))
-    return analysis_ids
-
-
-async def upload_to_mongo(db, content: Dict[str, Any]) -> bool:
-    """Upload processed content to MongoDB with its analyses."""
+def build_documents(content: Dict[str, Any]) -> Dict[str, List[Dict[str, Any]]]:
+    """Build the documents for one processed file, keyed by collection.
+
+    Ids are assigned client-side so the content document can reference its
+    analyses without waiting for them to be inserted.
+    """
+    content_id = content["content_id"]
+    content_analyses = [
+        {"_id": ObjectId(), "content_id": content_id, "chunk_index": idx, **analysis}
+        for idx, analysis in enumerate(content["analysis"]["content_analysis"])
+    ]
+    topic_analyses = [
+        {"_id": ObjectId(), "content_id": content_id, "chunk_index": idx, **analysis}
+        for idx, analysis in enumerate(content["analysis"]["topic_analysis"])
+    ]
+
+    content_doc = {
+        "content_id": content_id,
+        "content_type": content["content_type"],
+        "metadata": content["metadata"],
+        "content_analysis_ids": [str(doc["_id"]) for doc in content_analyses],
+        "topic_analysis_ids": [str(doc["_id"]) for doc in topic_analyses],
+        "timestamp": content["metadata"].get("scraped_at"),
+    }
+    # Files processed before raw content was stored by reference carry a copy
+    if "raw_content" in content:
+        content_doc["raw_content"] = content["raw_content"]
+    else:
+        content_doc["raw_content_ref"] = content["raw_content_ref"]
+
+    return {
+        "content": [content_doc],
+        "content_analysis": content_analyses,
+        "topic_analysis": topic_analyses,
+    }
+
+
+async def read_file(
+    bucket_name: str, file_path: str
+) -> Optional[Dict[str, List[Dict[str, Any]]]]:
+    """Read one processed file from GCS and build its documents."""
     try:
-        # Store the content analyses
-        content_analysis_ids = await store_content_analyses(
-            db, content["content_id"], content["analysis"]["content_analysis"]
-        )
+        # The GCS client is synchronous, so read in a worker thread
+        content = await asyncio.to_thread(read_gcs_file, bucket_name, file_path)
+        return build_documents(content)
 
-        # Store the topic analyses
-        topic_analysis_ids = await store_topic_analyses(
-            db, content["content_id"], content["analysis"]["topic_analysis"]
-        )
+    except Exception as e:
+        logger.error("Error processing %s: %s", file_path, e)
+        return None
 
-        # Create the main content document
-        content_doc = {
-            "content_id": content["content_id"],
-            "content_type": content["content_type"],
-            "metadata": content["metadata"],
-            "content_analysis_ids": content_analysis_ids,
-            "topic_analysis_ids": topic_analysis_ids,
-            "raw_content": content["raw_content"],
-            "timestamp": content["metadata"].get("scraped_at"),
-        }
-
-        # Store the main content
-        await db.content.insert_one(content_doc)
-        return True
 
-    except Exception as e:
-        logger.error(f"Error uploading content {content['content_id']}: {str(e)}")
-        return False
+async def list_files(bucket_name: str, paths: asyncio.Queue, readers: int) -> int:
+    """Queue processed file names as the listing pages arrive.
+
+    Ends with one None per reader so they stop once the listing is done (or
+    fails). Returns the number of files listed.
+    """
+    listed = 0
+    try:
+        processed_files = iter_gcs_files(bucket_name, prefix="processed_content")
+        while file_path := await asyncio.to_thread(next, processed_files, None):
+            await paths.put(file_path)
+            listed += 1
+    finally:
+        for _ in range(readers):
+            await paths.put(None)
+    return listed
+
+
+async def read_files(
+    bucket_name: str, paths: asyncio.Queue, results: asyncio.Queue
+) -> None:
+    """Read queued files until the listing ends, queueing their documents.
+
+    Finishes by queueing READER_DONE.
+    """
+    while (file_path := await paths.get()) is not None:
+        await results.put(await read_file(bucket_name, file_path))
+    await results.put(READER_DONE)
+
+
+async def write_batch(db, batch: Dict[str, List[Dict[str, Any]]]) -> int:
+    """Bulk-write a batch to each collection concurrently.
+
+    Returns the number of content documents written.
+    """
+    # The analysis collections can be rebuilt from GCS, so they skip waiting on
+    # the journal; content keeps the database's default durability
+    bulk_db = db.with_options(write_concern=ANALYSIS_WRITE_CONCERN)
+
+    collections = [name for name, docs in batch.items() if docs]
+    results = await asyncio.gather(
+        *[
+            (db if name == "content" else bulk_db)[name].bulk_write(
+                [InsertOne(doc) for doc in batch[name]], ordered=False
+            )
+            for name in collections
+        ],
+        return_exceptions=True,
+    )
+
+    written = 0
+    for name, result in zip(collections, results):
+        if isinstance(result, BulkWriteError):
+            logger.error("Error writing to %s: %s", name, result)
+            inserted = result.details["nInserted"]
+        elif isinstance(result, Exception):
+            logger.error("Error writing to %s: %s", name, result)
+            inserted = 0
+        else:
+            inserted = result.inserted_count
+
+        if name == "content":
+            written = inserted
+
+    return written
 
 
 async def main():
@@ -113,35 +246,67 @@ async def main():
     mongo_client = AsyncIOMotorClient(settings.mongodb_uri)
     db = mongo_client.financial_content
 
-    # Set up indexes
-    await setup_indexes(db)
+    # Only the unique index is needed during the load; the rest are built after
+    await setup_unique_indexes(db)
 
-    # Get list of processed files from GCS
-    processed_files = list_gcs_files(settings.gcs_bucket, prefix="processed_content")
-    logger.info(f"Found {len(processed_files)} processed files")
+    # List, read and write as a pipeline: bounded queues between the stages cap
+    # how many file names and read documents are held in memory, and reads
+    # pause while a batch is being written instead of piling up
+    paths = asyncio.Queue(maxsize=MAX_CONCURRENT_TRANSFERS)
+    results = asyncio.Queue(maxsize=MAX_CONCURRENT_TRANSFERS)
+    listing = asyncio.create_task(
+        list_files(settings.gcs_bucket, paths, MAX_CONCURRENT_TRANSFERS)
+    )
+    readers = [
+        asyncio.create_task(read_files(settings.gcs_bucket, paths, results))
+        for _ in range(MAX_CONCURRENT_TRANSFERS)
+    ]
 
-    # Process files
+    # Write what has been read in bulk batches
     stats = {"processed": 0, "errors": 0}
 
-    for file_path in tqdm(processed_files, desc="Uploading to MongoDB"):
-        try:
-            # Read content from GCS
-            content = read_gcs_file(settings.gcs_bucket, file_path)
-
-            # Upload to MongoDB
-            success = await upload_to_mongo(db, content)
-            if success:
-                stats["processed"] += 1
-            else:
-                stats["errors"] += 1
-
-        except Exception as e:
-            logger.error(f"Error processing {file_path}: {str(e)}")
+    batch = {"content": [], "content_analysis": [], "topic_analysis": []}
+    batch_files = 0
+    running = len(readers)
+    # Redraw the progress bar at most twice a second
+    progress = tqdm_asyncio(desc="Uploading to MongoDB", mininterval=0.5)
+    while running:
+        documents = await results.get()
+        if documents is READER_DONE:
+            running -= 1
+            continue
+
+        progress.update()
+        if documents is None:
             stats["errors"] += 1
+            continue
+
+        for name, docs in documents.items():
+            batch[name].extend(docs)
+        batch_files += 1
+
+        if sum(len(docs) for docs in batch.values()) >= WRITE_BATCH_SIZE:
+            written = await write_batch(db, batch)
+            stats["processed"] += written
+            stats["errors"] += batch_files - written
+            batch = {name: [] for name in batch}
+            batch_files = 0
+    progress.close()
+
+    if batch_files:
+        written = await write_batch(db, batch)
+        stats["processed"] += written
+        stats["errors"] += batch_files - written
+
+    # Re-raises a failed listing once everything it produced is written
+    logger.info("Found %s processed files", await listing)
+
+    await setup_indexes(db)
 
     logger.info(
-        f"Transfer complete. Processed {stats['processed']} files with "
-        f"{stats['errors']} errors."
+        "Transfer complete. Processed %s files with %s errors.",
+        stats["processed"],
+        stats["errors"],
     )
 
     # Print some stats about what was stored
@@ -151,20 +316,20 @@ async def main():
         topic_analysis_count = await db.topic_analysis.count_documents({})
 
         logger.info("\nDatabase contents:")
-        logger.info(f"Total documents: {content_count}")
-        logger.info(f"Content analyses: {content_analysis_count}")
-        logger.info(f"Topic analyses: {topic_analysis_count}")
+        logger.info("Total documents: %s", content_count)
+        logger.info("Content analyses: %s", content_analysis_count)
+        logger.info("Topic analyses: %s", topic_analysis_count)
 
         # Sample some content types
         content_types = await db.content.distinct("content_type")
-        logger.info(f"\nContent types: {content_types}")
+        logger.info("\nContent types: %s", content_types)
 
         for ct in content_types:
             count = await db.content.count_documents({"content_type": ct})
-            logger.info(f"{ct}: {count} documents")
+            logger.info("%s: %s documents", ct, count)
 
     except Exception as e:
-        logger.error(f"Error getting stats: {str(e)}")
+        logger.error("Error getting stats: %s", e)
 
 
 if __name__ == "__main__":
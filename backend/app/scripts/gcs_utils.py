@@ -1,24 +1,94 @@
 import gzip
 import json
-from typing import Dict
+from functools import lru_cache
+from typing import Dict, Iterator, Optional
 
+import orjson
+import zstandard
 from google.cloud import storage
+from google.oauth2 import service_account
+
+# First bytes of every zstd frame
+ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+
+# Suffix of stored JSON documents. Older ones were written as .json.gz, first
+# gzipped and later zstd under the same name; readers go by magic bytes
+JSON_SUFFIX = ".json.zst"
+LEGACY_JSON_SUFFIX = ".json.gz"
+
+# Set by configure_credentials; None means the default credentials lookup
+_credentials: Optional[service_account.Credentials] = None
+
+
+def strip_json_suffix(path: str) -> str:
+    """Drop a stored document's suffix so old and new names of it compare equal."""
+    for suffix in (JSON_SUFFIX, LEGACY_JSON_SUFFIX):
+        if path.endswith(suffix):
+            return path[: -len(suffix)]
+    return path
+
+
+def configure_credentials(info: Dict) -> None:
+    """Use a service account key (as a dict) for GCS instead of default credentials.
+
+    The credentials are built in memory, so no key file has to be written for
+    GOOGLE_APPLICATION_CREDENTIALS.
+    """
+    global _credentials
+    _credentials = service_account.Credentials.from_service_account_info(info)
+
+    # Clients created before this used the default credentials
+    _get_client.cache_clear()
+    _get_bucket.cache_clear()
+
+
+def get_credentials() -> Optional[service_account.Credentials]:
+    """Get the configured GCS credentials, or None to use the default lookup."""
+    return _credentials
+
+
+@lru_cache()
+def _get_client() -> storage.Client:
+    """Create the GCS client once; it loads credentials and holds the session."""
+    if _credentials is None:
+        return storage.Client()
+    return storage.Client(project=_credentials.project_id, credentials=_credentials)
+
+
+@lru_cache()
+def _get_bucket(bucket_name: str) -> storage.Bucket:
+    """Get a (cached) handle to a bucket."""
+    return _get_client().bucket(bucket_name)
 
 
 def read_gcs_file(bucket_name: str, file_path: str) -> Dict:
     """Read and decompress a gzipped JSON file from GCS."""
-    client = storage.Client()
-    bucket = client.bucket(bucket_name)
+    bucket = _get_bucket(bucket_name)
     blob = bucket.blob(file_path)
-    content = blob.download_as_bytes()
-    decompressed = gzip.decompress(content)
-    return json.loads(decompressed)
+
+    # Decompress while downloading instead of holding the compressed and
+    # decompressed payloads in memory at the same time. Scraped files are
+    # gzipped; processed files are zstd, told apart by their magic bytes
+    with blob.open("rb", chunk_size=1 << 20) as raw:
+        is_zstd = raw.read(len(ZSTD_MAGIC)) == ZSTD_MAGIC
+        raw.seek(0)
+        if is_zstd:
+            with zstandard.ZstdDecompressor().stream_reader(raw) as decompressed:
+                data = decompressed.read()
+        else:
+            with gzip.GzipFile(fileobj=raw) as decompressed:
+                data = decompressed.read()
+
+    try:
+        return orjson.loads(data)
+    except orjson.JSONDecodeError:
+        # Files written with json.dumps may contain NaN/Infinity, which only
+        # the stdlib parser accepts
+        return json.loads(data)
 
 
 def write_gcs_file(bucket_name: str, file_path: str, content: Dict) -> None:
     """Write and compress content to a JSON file in GCS."""
-    client = storage.Client()
-
     # Handle bucket/path separation.
     if "/" in bucket_name:
         # If bucket_name includes a path (e.g. "bucket/test_processing")
@@ -26,28 +96,34 @@ def write_gcs_file(bucket_name: str, file_path: str, content: Dict) -> None:
         bucket_name, remaining = tokens[0], tokens[1:]
         file_path = "/".join([*remaining, file_path])
 
-    bucket = client.bucket(bucket_name)
+    bucket = _get_bucket(bucket_name)
     blob = bucket.blob(file_path)
 
-    # Convert to JSON and compress
-    json_content = json.dumps(content)
-    compressed = gzip.compress(json_content.encode())
+    # Convert to JSON (orjson produces UTF-8 bytes directly) and compress. zstd
+    # level 3 compresses both faster and smaller than gzip
+    json_content = orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+    compressed = zstandard.ZstdCompressor(level=3).compress(json_content)
 
     # Upload to GCS
-    blob.upload_from_string(compressed)
+    blob.upload_from_string(compressed, content_type="application/zstd")
 
 
 def file_exists_in_gcs(bucket_name: str, file_path: str) -> bool:
     """Check if a file exists in GCS."""
-    client = storage.Client()
-    bucket = client.bucket(bucket_name)
+    bucket = _get_bucket(bucket_name)
     blob = bucket.blob(file_path)
     return blob.exists()
 
 
+def iter_gcs_files(bucket_name: str, prefix: str = "") -> Iterator[str]:
+    """Yield the files in a GCS bucket with given prefix, one page at a time."""
+    bucket = _get_bucket(bucket_name)
+    # Only ask for the names; the full blob metadata isn't needed
+    blobs = bucket.list_blobs(prefix=prefix, fields="items(name),nextPageToken")
+    for blob in blobs:
+        yield blob.name
+
+
 def list_gcs_files(bucket_name: str, prefix: str = "") -> list[str]:
     """List all files in a GCS bucket with given prefix."""
-    client = storage.Client()
-    bucket = client.bucket(bucket_name)
-    blobs = bucket.list_blobs(prefix=prefix)
-    return [blob.name for blob in blobs]
+    return list(iter_gcs_files(bucket_name, prefix))
@@ -1,40 +1,111 @@
+import hashlib
 import logging
-from collections import defaultdict
+import os
+import tempfile
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
-import spacy
+import numpy as np
 import yaml
+from app.scripts.nlp import get_nlp, get_sentence_nlp
 
 logger = logging.getLogger(__name__)
 
+# Sentences with fewer tokens, or a weaker mean word vector, than these aren't
+# scored against the industries
+MIN_SENTENCE_TOKENS = 5
+MIN_SENTENCE_VECTOR_NORM = 1.0
+
+# Built industry vectors are cached here, keyed by taxonomy contents and model
+VECTOR_CACHE_DIR = Path(tempfile.gettempdir())
+
+
+def _flatten_industries(gics: Dict) -> List[Tuple[str, str]]:
+    """Flatten the GICS taxonomy into (sector/industry, description) pairs."""
+    industries = []
+    for sector, sector_industries in gics.items():
+        for industry, subsectors in sector_industries.items():
+            # Combine all subsector descriptions
+            description = f"{sector} {industry} " + " ".join(subsectors)
+            industries.append((f"{sector}/{industry}", description.lower()))
+    return industries
+
 
 class IndustryClassifier:
     """GICS-based industry classification using NLP."""
 
     def __init__(self, gics_path: str = "taxonomies/gics.yaml"):
-        self.nlp = spacy.load("en_core_web_lg")
-
-        # Load GICS taxonomy
-        with open(Path(__file__).parent / gics_path) as f:
-            self.gics = yaml.safe_load(f)
-
-        # Build industry vectors
-        self.industry_vectors = {}
-        self._build_industry_vectors()
+        # Only sentence boundaries and word vectors are needed, so the
+        # rule-based sentencizer stands in for the parser
+        self.nlp = get_sentence_nlp()
+
+        # Load GICS taxonomy; only its bytes are needed to find cached vectors
+        gics_bytes = (Path(__file__).parent / gics_path).read_bytes()
+
+        # Build industry vectors, or reuse the ones built for this taxonomy on a
+        # previous start, in which case the YAML is never parsed
+        cache_path = self._vector_cache_path(gics_bytes)
+        self.industry_vectors = self._load_industry_vectors(cache_path)
+        if self.industry_vectors is None:
+            self.industry_vectors = {}
+            self._build_industry_vectors(
+                _flatten_industries(yaml.safe_load(gics_bytes))
+            )
+            self._save_industry_vectors(cache_path)
+
+        # One unit-normalized (industries x dims) matrix, so a document's
+        # sentences are scored against every industry with a single matmul.
+        # Kept in float32: numpy only has BLAS kernels for float32/64, so float16
+        # or int8 products run in plain loops and are far slower, and the whole
+        # matrix (~100KB) already sits in cache
+        self._industry_keys = list(self.industry_vectors)
+        matrix = np.stack(list(self.industry_vectors.values())).astype(np.float32)
+        matrix /= np.linalg.norm(matrix, axis=1, keepdims=True) + 1e-12
+        self._industry_matrix = matrix
+
+    def _vector_cache_path(self, gics_bytes: bytes) -> Path:
+        """Cache file for vectors built from this taxonomy with the loaded model."""
+        meta = get_nlp().meta
+        digest = hashlib.sha256(gics_bytes)
+        digest.update(f"{meta['name']}-{meta['version']}".encode())
+        return VECTOR_CACHE_DIR / f"industry_vectors_{digest.hexdigest()[:16]}.npz"
+
+    def _load_industry_vectors(self, cache_path: Path) -> Optional[Dict]:
+        """Load cached industry vectors, or None if there is no usable cache."""
+        try:
+            with np.load(cache_path) as cached:
+                return dict(zip(cached["keys"].tolist(), cached["vectors"]))
+        except (OSError, ValueError, KeyError):
+            return None
+
+    def _save_industry_vectors(self, cache_path: Path):
+        """Write the industry vectors to the cache; failures only cost a rebuild."""
+        if not self.industry_vectors:
+            return
+        tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+        try:
+            with open(tmp_path, "wb") as f:
+                np.savez(
+                    f,
+                    keys=np.array(list(self.industry_vectors)),
+                    vectors=np.stack(list(self.industry_vectors.values())),
+                )
+            # Replaced atomically so a concurrent start never reads half a file
+            os.replace(tmp_path, cache_path)
+        except OSError as e:
+            logger.warning("Could not cache industry vectors: %s", e)
 
-    def _build_industry_vectors(self):
+    def _build_industry_vectors(self, industries: List[Tuple[str, str]]):
         """Pre-compute vectors for industry descriptions."""
-        for sector, industries in self.gics.items():
-            for industry, subsectors in industries.items():
-                # Combine all subsector descriptions
-                description = f"{sector} {industry} " + " ".join(
-                    [s for s in subsectors]
-                )
-                doc = self.nlp(description.lower())
-                if doc.has_vector:
-                    key = f"{sector}/{industry}"
-                    self.industry_vectors[key] = doc.vector
+        keys = [key for key, _ in industries]
+        descriptions = [description for _, description in industries]
+
+        # Industry vectors are averaged word vectors, so tokenizing is enough;
+        # skip the rest of the pipeline and batch the descriptions
+        docs = self.nlp.tokenizer.pipe(descriptions, batch_size=64)
+        for key, doc in zip(keys, docs):
+            if doc.has_vector:
+                self.industry_vectors[key] = doc.vector
 
     def classify_text(
         self, text: str, min_confidence: float = 0.6, max_industries: int = 3
@@ -53,44 +124,85 @@ class IndustryClassifier:
             ...
         ]
         """
-        doc = self.nlp(text)
-        industry_scores = defaultdict(lambda: {"score": 0.0, "evidence": []})
-
+        return self._classify_doc(self.nlp(text), min_confidence, max_industries)
+
+    def classify_texts(
+        self,
+        texts: List[str],
+        min_confidence: float = 0.6,
+        max_industries: int = 3,
+        batch_size: int = 32,
+    ) -> List[List[Dict]]:
+        """Classify many texts, batching spaCy inference."""
+        docs = self.nlp.pipe(texts, batch_size=batch_size)
+        return [self._classify_doc(doc, min_confidence, max_industries) for doc in docs]
+
+    def _classify_doc(
+        self, doc, min_confidence: float, max_industries: int
+    ) -> List[Dict]:
+        """Score a parsed document's sentences against the industry vectors."""
         # Process each sentence for context
-        for sent in doc.sents:
-            sent_vector = sent.vector
-
-            # Compare with industry vectors
-            for industry_path, industry_vector in self.industry_vectors.items():
-                similarity = sent_vector.dot(industry_vector) / (
-                    sent_vector.norm() * industry_vector.norm()
-                )
-
-                if similarity >= min_confidence:
-                    sector, industry = industry_path.split("/")
-
-                    # Update running score
-                    current = industry_scores[industry_path]
-                    current["score"] = max(current["score"], similarity)
-
-                    # Store evidence if it's a strong match
-                    if len(current["evidence"]) < 3:  # Limit evidence per industry
-                        current["evidence"].append(
-                            {"text": sent.text, "similarity": float(similarity)}
-                        )
+        sents = list(doc.sents)
+        if not sents:
+            return []
+
+        # Every token's word vector in one gather from the vectors table (zeros
+        # for tokens without one), then each sentence's summed vector in a
+        # single reduceat over its token range. A sentence vector is the mean
+        # of its tokens, but only the direction matters for cosine similarity,
+        # so the sums are normalized directly
+        vectors = doc.vocab.vectors
+        rows = np.asarray(vectors.find(keys=[token.orth for token in doc]))
+        token_matrix = np.asarray(vectors.data)[rows].astype(np.float32, copy=False)
+        token_matrix[rows < 0] = 0.0
+
+        starts = np.fromiter((sent.start for sent in sents), dtype=np.intp)
+        sent_matrix = np.add.reduceat(token_matrix, starts, axis=0)
+
+        # Skip sentences too short or too weak (mean vector norm) to say anything
+        # about an industry: dates, amounts, URLs and other boilerplate. This
+        # also drops sentences with no vectors at all
+        lengths = np.diff(starts, append=len(doc))
+        norms = np.linalg.norm(sent_matrix, axis=1)
+        keep = (lengths >= MIN_SENTENCE_TOKENS) & (
+            norms > MIN_SENTENCE_VECTOR_NORM * lengths
+        )
+        if not keep.any():
+            return []
+        if not keep.all():
+            sents = [sent for sent, kept in zip(sents, keep) if kept]
+            sent_matrix = sent_matrix[keep]
+            norms = norms[keep]
+
+        # Cosine similarity of every sentence against every industry at once
+        sent_matrix /= norms[:, None]
+        similarities = sent_matrix @ self._industry_matrix.T
+
+        # Best sentence per industry; only the top max_industries are ranked,
+        # after an O(n) partition picks them out of the matches
+        scores = similarities.max(axis=0)
+        matched = np.flatnonzero(scores >= min_confidence)
+        if 0 < max_industries < len(matched):
+            top = np.argpartition(-scores[matched], max_industries - 1)
+            matched = matched[top[:max_industries]]
+        ranked = matched[np.argsort(-scores[matched], kind="stable")]
 
         # Prepare results
         results = []
-        for industry_path, data in sorted(
-            industry_scores.items(), key=lambda x: x[1]["score"], reverse=True
-        )[:max_industries]:
-            sector, industry = industry_path.split("/")
+        for industry_idx in ranked[:max_industries]:
+            sector, industry = self._industry_keys[industry_idx].split("/")
+            column = similarities[:, industry_idx]
+            evidence_idxs = np.flatnonzero(column >= min_confidence)
             results.append(
                 {
                     "sector": sector,
                     "industry": industry,
-                    "confidence": float(data["score"]),
-                    "evidence": data["evidence"],
+                    "confidence": float(scores[industry_idx]),
+                    # Limit evidence per industry
+                    "evidence": [
+                        {"text": sents[i].text, "similarity": float(column[i])}
+                        for i in evidence_idxs[:3]
+                    ],
                 }
             )
 
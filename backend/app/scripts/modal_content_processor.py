@@ -5,10 +5,18 @@ import base64
 import json
 import logging
 import os
-from typing import Dict
+from typing import AsyncIterator, Dict
 
 import modal
-from app.scripts.gcs_utils import list_gcs_files, read_gcs_file, write_gcs_file
+from app.scripts.gcs_utils import (
+    JSON_SUFFIX,
+    configure_credentials,
+    iter_gcs_files,
+    list_gcs_files,
+    read_gcs_file,
+    strip_json_suffix,
+    write_gcs_file,
+)
 from app.services.preprocessing.chunk_processor import ChunkProcessor
 from modal import Secret
 
@@ -21,19 +29,34 @@ logging.basicConfig(
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on FileProcessor containers processing files at once
+MAX_CONTAINERS = 50
+
+# Files each container works on at once; their GCS reads and uploads overlap
+# and share the container's pooled GCS connections
+FILES_PER_CONTAINER = 8
+
 # Create Modal app
 app = modal.App("content-processor")
 
 # Create image with required dependencies
 image = modal.Image.debian_slim(python_version="3.10").pip_install(
     "beautifulsoup4",
+    "diskcache",
     "google-cloud-storage",
+    "hnswlib",
+    "lxml",
+    "numpy",
     "openai",
+    "orjson",
+    "pyahocorasick",
     "pydantic",
     "pydantic-settings",
     "python-dotenv",
     "tenacity",
+    "tiktoken",
     "tqdm",
+    "zstandard",
 )
 
 
@@ -45,10 +68,15 @@ async def process_single_file(
 ) -> bool:
     """Process a single file and return True if successful."""
     try:
-        # Read content
-        raw_data = read_gcs_file(source_bucket, file_path)
+        # Read content; GCS calls are blocking, so they run in a worker thread
+        # to let the container's other files keep going
+        raw_data = await asyncio.to_thread(read_gcs_file, source_bucket, file_path)
         content_type = file_path.split("/")[1]  # e.g., "sec_filing"
-        underlying_file_path = "/".join(file_path.split("/")[1:])
+        # Processed files are zstd, so they get its suffix whatever the raw
+        # file's name
+        underlying_file_path = (
+            strip_json_suffix("/".join(file_path.split("/")[1:])) + JSON_SUFFIX
+        )
 
         # Process content
         processed_chunks = []
@@ -57,7 +85,7 @@ async def process_single_file(
                 processed_chunks.append(chunk)
 
         if not processed_chunks:
-            logger.error(f"Failed to process {file_path}")
+            logger.error("Failed to process %s", file_path)
             return False
 
         # Prepare output
@@ -80,108 +108,138 @@ async def process_single_file(
                     for processed in processed_chunks
                 ],
             },
-            "raw_content": raw_data,  # Keep original content
+            # Point at the original content rather than copying it, which
+            # would double the bytes uploaded and stored
+            "raw_content_ref": {"bucket": source_bucket, "path": file_path},
         }
 
         # Store processed result
-        logger.info(f"Uploading {underlying_file_path} to {target_bucket}")
-        write_gcs_file(target_bucket, underlying_file_path, output)
-        logger.info(f"Successfully processed {file_path}")
+        logger.info("Uploading %s to %s", underlying_file_path, target_bucket)
+        await asyncio.to_thread(
+            write_gcs_file, target_bucket, underlying_file_path, output
+        )
+        logger.info("Successfully processed %s", file_path)
         return True
 
     except Exception as e:
-        logger.error(f"Error processing {file_path}: {str(e)}")
+        logger.error("Error processing %s: %s", file_path, e)
         return False
 
 
-@app.function(
+def setup_gcs_credentials() -> None:
+    """Build GCS credentials in memory from the credentials secret."""
+    creds_json = base64.b64decode(os.environ["credentials"])
+    configure_credentials(json.loads(creds_json))
+
+
+@app.cls(
     image=image,
     secrets=[
         Secret.from_name("gcs-credentials-json"),
         Secret.from_name("openai-api-key"),
     ],
-    timeout=7200,  # 2 hour timeout
+    timeout=1800,  # 30 minute timeout per file
     cpu=2,  # Use 2 CPUs
+    max_containers=MAX_CONTAINERS,
 )
-async def run_processing(batch_size: int = 10) -> Dict[str, int]:
-    """Process content from GCS bucket."""
-
-    # Set up GCS credentials
-    creds_json = base64.b64decode(os.environ["credentials"])
-    creds_dict = json.loads(creds_json)
-
-    # Write credentials to temp file
-    creds_path = "/tmp/gcs-credentials.json"
-    with open(creds_path, "w") as f:
-        json.dump(creds_dict, f)
-
-    os.environ["GOOGLE_APPLICATION_CREDENTIALS"] = creds_path
-
-    source_bucket = "scraped-financial-data"
-    target_bucket = "scraped-financial-data/processed_content"
-
-    try:
-        # Initialize processor
-        processor = ChunkProcessor(
+@modal.concurrent(max_inputs=FILES_PER_CONTAINER)
+class FileProcessor:
+    """Processes single files; Modal scales containers out across the file list."""
+
+    @modal.enter()
+    def setup(self):
+        """Set up credentials and the chunk processor once per container.
+
+        Everything built here (the cached GCS client, the processor's OpenAI
+        clients) lives for the container, so every file it handles reuses the
+        same pooled keep-alive connections.
+        """
+        setup_gcs_credentials()
+        self.processor = ChunkProcessor(
             api_key=os.environ["openai_api_key"], max_concurrent=10
         )
 
-        # Get files to process
-        source_files = list_gcs_files(source_bucket, prefix="raw_data")
-
-        # Filter out already processed
-        processed_files = list_gcs_files(source_bucket, prefix="processed_content")
+    @modal.method()
+    async def process(
+        self, file_path: str, source_bucket: str, target_bucket: str
+    ) -> bool:
+        """Process a single file and return True if successful."""
+        return await process_single_file(
+            file_path=file_path,
+            source_bucket=source_bucket,
+            target_bucket=target_bucket,
+            processor=self.processor,
+        )
 
-        no_prefix_source_files = [f.replace("raw_data/", "") for f in source_files]
-        no_prefix_processed_files = [
-            f.replace("processed_content/", "") for f in processed_files
-        ]
+    @modal.exit()
+    async def shutdown(self):
+        """Close the processor's OpenAI clients when the container stops."""
+        await self.processor.close()
 
-        files_to_process = [
-            os.path.join("raw_data", f)
-            for f in no_prefix_source_files
-            if f not in no_prefix_processed_files
-        ]
 
-        logger.info(
-            f"Found {len(files_to_process)} files to process. "
-            f"{len(processed_files)} already processed."
-        )
+@app.function(
+    image=image,
+    secrets=[Secret.from_name("gcs-credentials-json")],
+    timeout=7200,  # 2 hour timeout
+)
+async def run_processing(log_every: int = 10) -> Dict[str, int]:
+    """Process content from GCS bucket, fanning files out to FileProcessor."""
 
-        # Process in parallel batches
-        stats = {"processed": 0, "errors": 0}
-
-        for i in range(0, len(files_to_process), batch_size):
-            batch = files_to_process[i : i + batch_size]  # noqa
-
-            # Process batch
-            results = await asyncio.gather(
-                *[
-                    process_single_file(
-                        file_path=file_path,
-                        source_bucket=source_bucket,
-                        target_bucket=target_bucket,
-                        processor=processor,
-                    )
-                    for file_path in batch
-                ],
-                return_exceptions=False,
-            )
+    # Set up GCS credentials
+    setup_gcs_credentials()
 
-            # Update stats
-            stats["processed"] += sum(1 for r in results if r)
-            stats["errors"] += sum(1 for r in results if not r)
+    source_bucket = "scraped-financial-data"
+    target_bucket = "scraped-financial-data/processed_content"
 
-            # Log progress
-            remaining = len(files_to_process) - i - len(batch)
+    # Filter out already processed; the full set is needed before filtering,
+    # and a set keeps each membership check O(1). Names are compared without
+    # their suffix, since raw and processed files may be .json.gz or .json.zst
+    processed_files = await asyncio.to_thread(
+        list_gcs_files, source_bucket, prefix="processed_content"
+    )
+    no_prefix_processed_files = {
+        strip_json_suffix(f.replace("processed_content/", "")) for f in processed_files
+    }
+    logger.info("%s files already processed.", len(no_prefix_processed_files))
+
+    # Get files to process, handing each to the workers as soon as its listing
+    # page arrives instead of after the whole bucket has been listed
+    queued = 0
+
+    async def files_to_process() -> AsyncIterator[str]:
+        nonlocal queued
+        source_files = iter_gcs_files(source_bucket, prefix="raw_data")
+        while file_path := await asyncio.to_thread(next, source_files, None):
+            name = strip_json_suffix(file_path.replace("raw_data/", ""))
+            if name not in no_prefix_processed_files:
+                queued += 1
+                yield file_path
+
+    # Each file is processed in its own call, spread across as many
+    # containers as Modal will run; results arrive as they finish
+    stats = {"processed": 0, "errors": 0}
+
+    results = FileProcessor().process.map.aio(
+        files_to_process(),
+        kwargs={"source_bucket": source_bucket, "target_bucket": target_bucket},
+        order_outputs=False,
+        return_exceptions=True,
+    )
+    async for success in results:
+        # Update stats; failed calls come back as exceptions
+        stats["processed" if success is True else "errors"] += 1
+
+        # Log progress every log_every files
+        done = stats["processed"] + stats["errors"]
+        if done % log_every == 0:
             logger.info(
-                f"Processed {stats['processed']} files with {stats['errors']} "
-                f"errors. {remaining} files remaining."
+                "Processed %s files with %s errors. %s files queued so far.",
+                stats["processed"],
+                stats["errors"],
+                queued,
             )
 
-        return stats
-
-    finally:
-        # Cleanup
-        if os.path.exists(creds_path):
-            os.remove(creds_path)
+    logger.info(
+        "Processed %s files with %s errors.", stats["processed"], stats["errors"]
+    )
+    return stats
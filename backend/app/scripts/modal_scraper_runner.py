@@ -7,6 +7,7 @@ from datetime import datetime, timedelta
 from typing import Dict  # , List, Optional
 
 import modal
+from app.scripts.gcs_utils import configure_credentials
 from app.scripts.scrapers import (
     EarningsCallScraper,
     NewsAPIScraper,
@@ -34,8 +35,10 @@ image = (
         "beautifulsoup4",
         "feedparser",
         "google-cloud-storage",
+        "orjson",
         "spacy",
         "pyyaml",
+        "zstandard",
     )
     .run_commands(
         # Install spaCy model
@@ -76,15 +79,9 @@ async def run_scrapers(
     bucket_name = "scraped-financial-data"
 
     # Set up GCS credentials
+    # Built in memory and handed to the scrapers' GCS clients; no key file
     creds_json = base64.b64decode(os.environ["credentials"])
-    creds_dict = json.loads(creds_json)
-
-    # Write credentials to a temporary file that GCS client will use
-    creds_path = "/tmp/gcs-credentials.json"
-    with open(creds_path, "w") as f:
-        json.dump(creds_dict, f)
-
-    os.environ["GOOGLE_APPLICATION_CREDENTIALS"] = creds_path
+    configure_credentials(json.loads(creds_json))
 
     # Load API keys from secrets - using unique key names
     seeking_alpha_keys = os.environ["seeking_alpha_keys"].split(",")
@@ -118,10 +115,10 @@ async def run_scrapers(
             ),
         }
 
-        # Run scrapers with timeouts
-        for name, scraper in scrapers.items():
+        async def run_scraper(name: str, scraper) -> None:
+            """Run one scraper under its own timeout and record its result."""
             try:
-                logger.info(f"Running {name} scraper...")
+                logger.info("Running %s scraper...", name)
                 scrape_result = await asyncio.wait_for(
                     scraper.scrape(
                         start_date=start_date,
@@ -136,28 +133,31 @@ async def run_scrapers(
                 # Log GCS upload statistics
                 upload_stats = scraper.get_upload_stats()
                 logger.info(
-                    f"[GCS] {name} upload stats: "
-                    f"Success={upload_stats.get('success', 0)}, "
-                    f"Skipped={upload_stats.get('skipped', 0)}, "
-                    f"Failed={upload_stats.get('failed', 0)}"
+                    "[GCS] %s upload stats: Success=%s, Skipped=%s, Failed=%s",
+                    name,
+                    upload_stats.get("success", 0),
+                    upload_stats.get("skipped", 0),
+                    upload_stats.get("failed", 0),
                 )
 
             except asyncio.TimeoutError:
-                logger.error(f"Timeout running {name} scraper")
+                logger.error("Timeout running %s scraper", name)
                 results[name] = {"error": "Timeout"}
             except Exception as e:
-                logger.error(f"Error running {name} scraper: {str(e)}")
+                logger.error("Error running %s scraper: %s", name, e)
                 results[name] = {"error": str(e)}
 
             finally:
                 await scraper.close()
 
+        # The scrapers hit independent APIs with their own rate limits, so they
+        # run concurrently; each keeps its own timeout
+        await asyncio.gather(
+            *[run_scraper(name, scraper) for name, scraper in scrapers.items()]
+        )
+
     except Exception as e:
-        logger.error(f"Error in scraper orchestration: {str(e)}")
+        logger.error("Error in scraper orchestration: %s", e)
         return {"error": str(e)}
-    finally:
-        # Clean up credentials file
-        if os.path.exists(creds_path):
-            os.remove(creds_path)
 
     return results
@@ -0,0 +1,31 @@
+from functools import lru_cache
+
+import spacy
+from spacy.language import Language
+
+
+@lru_cache(maxsize=1)
+def get_nlp() -> Language:
+    """Get the process-wide en_core_web_lg pipeline.
+
+    The model is several hundred MB, so every extractor and classifier shares a
+    single loaded copy. The lemmatizer is disabled since nothing reads lemmas;
+    the parser (sentences, noun chunks), tagger and NER are still used.
+    """
+    return spacy.load("en_core_web_lg", disable=["lemmatizer"])
+
+
+@lru_cache(maxsize=1)
+def get_sentence_nlp() -> Language:
+    """Get a tokenizer + rule-based sentencizer sharing en_core_web_lg's vocab.
+
+    For work that only needs sentence boundaries and word vectors. The
+    sentencizer splits on punctuation in one linear pass instead of running the
+    dependency parser, so it is several times faster but less accurate on text
+    without clean sentence punctuation (lists, headlines, run-on filings). The
+    vocab, and with it the vectors, is shared with get_nlp() rather than loaded
+    twice.
+    """
+    nlp = spacy.blank("en", vocab=get_nlp().vocab)
+    nlp.add_pipe("sentencizer")
+    return nlp
@@ -0,0 +1,91 @@
+import hashlib
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Dict, List, Optional, Type, TypeVar
+
+from diskcache import Cache
+from pydantic import BaseModel
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T", bound=BaseModel)
+
+# Point every process that analyzes content (scrapers, Modal workers, local
+# runs) at the same directory to share one cache between them
+CACHE_DIR = Path(
+    os.environ.get("LEARNING_AGENT_CACHE_DIR")
+    or Path.home() / ".cache" / "learning-agent"
+)
+
+CACHE_EXPIRE_SECONDS = 30 * 24 * 60 * 60
+
+# Bump to invalidate every cached analysis, e.g. after a schema change that
+# old JSON would no longer validate against
+CACHE_VERSION = "v1"
+
+
+class AnalysisCache:
+    """Exact-match on-disk cache of structured LLM analyses.
+
+    Keyed on the model and the full request messages, so identical chunks
+    (filing footers, disclaimers, wire boilerplate) are only sent to the LLM
+    once, and editing a prompt misses the cache instead of serving stale output.
+    """
+
+    def __init__(self, name: str, size_limit: int = 2**30):
+        self.name = name
+        # diskcache stores entries in SQLite (WAL mode), so several processes
+        # can read and write the same directory safely
+        self._cache = Cache(str(CACHE_DIR / name), size_limit=size_limit)
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key(model: str, messages: List[Dict[str, str]]) -> str:
+        """Hash a request into a cache key."""
+        payload = json.dumps(
+            {"version": CACHE_VERSION, "model": model, "messages": messages},
+            sort_keys=True,
+        )
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    def get(self, key: str, model_cls: Type[T]) -> Optional[T]:
+        """Return the cached analysis for key, or None on a miss."""
+        cached = self._cache.get(key)
+        if cached is None:
+            self.misses += 1
+            return None
+
+        try:
+            analysis = model_cls.model_validate_json(cached)
+        except ValueError as e:
+            logger.warning("Discarding unreadable cache entry %s: %s", key, e)
+            self._cache.delete(key)
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return analysis
+
+    def set(self, key: str, analysis: BaseModel) -> None:
+        """Store an analysis under key."""
+        self._cache.set(key, analysis.model_dump_json(), expire=CACHE_EXPIRE_SECONDS)
+
+    def log_stats(self) -> None:
+        """Log this process's hit rate, e.g. to tune chunk boundaries."""
+        lookups = self.hits + self.misses
+        if lookups:
+            logger.info(
+                "%s cache: %s/%s hits (%.1f%%)",
+                self.name,
+                self.hits,
+                lookups,
+                100 * self.hits / lookups,
+            )
+
+    def close(self) -> None:
+        """Log the hit rate and close the underlying SQLite connection."""
+        self.log_stats()
+        self._cache.close()
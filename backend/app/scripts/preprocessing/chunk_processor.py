@@ -1,9 +1,11 @@
 import asyncio
 import logging
-from collections import defaultdict
+from collections import Counter, defaultdict
 from dataclasses import dataclass
-from typing import Any, AsyncIterator, Dict, List, Optional
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
 
+import ahocorasick
+import numpy as np
 from app.models.recommendations.content_analysis import (
     Concept,
     ConceptRelationship,
@@ -11,13 +13,22 @@ from app.models.recommendations.content_analysis import (
     ContentComplexity,
 )
 from app.models.topic_analysis import ThematicAnalysis, TopicAnalysis
+from app.scripts.preprocessing.semantic_cache import SemanticCache
+from app.services.openai_client import close_openai_client, get_openai_client
 from app.services.preprocessing.concept_extractor import ConceptExtractor
 from app.services.preprocessing.content_chunker import ContentChunk, ContentChunker
 from app.services.preprocessing.topic_analyzer import TopicAnalyzer
 from bs4 import BeautifulSoup
+from lxml import etree
+from lxml import html as lxml_html
 
 logger = logging.getLogger(__name__)
 
+EMBEDDING_MODEL = "text-embedding-3-small"
+EMBEDDING_BATCH_SIZE = 64
+
+_HTML_PARSER = lxml_html.HTMLParser(encoding="utf-8", huge_tree=True)
+
 
 @dataclass
 class ProcessedContent:
@@ -35,19 +46,32 @@ class ChunkProcessor:
         self,
         model: str = "gpt-4o-mini",
         max_concurrent: int = 10,  # Limit concurrent API calls
+        chunks_per_request: int = 8,  # Bounded by the model's output tokens
+        max_concurrent_sections: int = 4,  # Sections analyzed at once
+        min_chunk_tokens: int = 40,  # Smaller chunks aren't analyzed alone
     ):
         self.chunker = ContentChunker()
         self.concept_extractor = ConceptExtractor(model=model)
         self.topic_analyzer = TopicAnalyzer(model=model)
+        self.semantic_cache = SemanticCache()
         self.max_concurrent = max_concurrent
+        self.chunks_per_request = chunks_per_request
+        self.max_concurrent_sections = max_concurrent_sections
+        self.min_chunk_tokens = min_chunk_tokens
 
     async def split_content(
         self, content: Dict, content_type: str
     ) -> AsyncIterator[Optional[ProcessedContent]]:
-        """Split content into sections based on content type."""
+        """Split content into sections based on content type.
+
+        Sections are analyzed concurrently, up to max_concurrent_sections at a
+        time, and yielded in their original order as each one finishes.
+        """
 
         if content_type == "sec_filing":
-            texts = self._process_sec_filing(content)
+            # Parsing a multi-MB filing takes long enough to stall the other
+            # files' API calls sharing this event loop
+            texts = await asyncio.to_thread(self._process_sec_filing, content)
 
         elif content_type == "news_article":
             texts = self._process_news_article(content)
@@ -59,12 +83,24 @@ class ChunkProcessor:
             texts = self._process_company_details(content)
 
         else:
-            logger.error(f"Unsupported content type: {content_type}")
+            logger.error("Unsupported content type: %s", content_type)
             raise ValueError(f"Unsupported content type: {content_type}")
 
-        logger.info(f"Split {content_type} into {len(texts)} sections")
-        for text in texts:
-            yield await self.process_content(text)
+        logger.info("Split %s into %s sections", content_type, len(texts))
+        semaphore = asyncio.Semaphore(self.max_concurrent_sections)
+
+        async def process_section(text: str) -> Optional[ProcessedContent]:
+            async with semaphore:
+                return await self.process_content(text)
+
+        tasks = [asyncio.create_task(process_section(text)) for text in texts]
+        try:
+            for task in tasks:
+                yield await task
+        finally:
+            # The consumer stopped early or a section failed
+            for task in tasks:
+                task.cancel()
 
     def _process_sec_filing(self, content: Dict) -> List[str]:
         html_content = content.get("filing_html", "")
@@ -72,12 +108,36 @@ class ChunkProcessor:
             logger.info("No HTML content found in SEC filing")
             return []
 
+        try:
+            return [self._html_to_text(html_content)]
+        except (etree.ParserError, ValueError) as e:
+            logger.warning("lxml could not parse SEC filing, using bs4: %s", e)
+
         soup = BeautifulSoup(html_content, "html.parser")
         for element in soup(["script", "style"]):
             element.decompose()
 
         return [soup.get_text(separator="\n", strip=True)]
 
+    @staticmethod
+    def _html_to_text(html_content: str) -> str:
+        """Extract visible text with lxml, one stripped text node per line.
+
+        Matches the newline-separated, stripped BeautifulSoup get_text() used as
+        the fallback, but parses in C; filings are often megabytes of HTML.
+        """
+        # Parse bytes with a fixed encoding so an XML declaration naming a
+        # different charset is ignored rather than rejected
+        root = etree.fromstring(html_content.encode("utf-8"), _HTML_PARSER)
+        for element in list(
+            root.iter(etree.Comment, etree.ProcessingInstruction, "script", "style")
+        ):
+            element.drop_tree()
+
+        return "\n".join(
+            text for text in (node.strip() for node in root.itertext()) if text
+        )
+
     def _process_news_article(self, content: Dict) -> List[str]:
         return [
             f"Title: {content.get('title', '')}\n\n"
@@ -95,7 +155,7 @@ class ChunkProcessor:
         texts = []
 
         for statement_type, statement_data in financials.items():
-            statement_text = f"{statement_type.replace('_', ' ').title()}:\n\n"
+            parts = [f"{statement_type.replace('_', ' ').title()}:\n\n"]
             items = sorted(
                 statement_data.items(),
                 key=lambda x: (
@@ -114,9 +174,9 @@ class ChunkProcessor:
                 formatted_value = (
                     f"{value:,.2f}" if isinstance(value, (int, float)) else str(value)
                 )
-                statement_text += f"{label}: {formatted_value} {unit}\n"
+                parts.append(f"{label}: {formatted_value} {unit}\n")
 
-            texts.append(statement_text)
+            texts.append("".join(parts))
 
         return texts
 
@@ -152,28 +212,59 @@ class ChunkProcessor:
         3. Combine results intelligently
         """
         # First chunk the content
-        chunks = self.chunker.chunk_content(text)
+        chunks = self._drop_trivial_chunks(self.chunker.chunk_content(text))
+        if not chunks:
+            logger.info("No content worth analyzing")
+            return None
+
+        # Near-duplicates of chunks already analyzed reuse those analyses
+        embeddings = await self._embed_chunks(chunks)
+        if embeddings is not None:
+            cached = self.semantic_cache.lookup(embeddings)
+        else:
+            cached = [None] * len(chunks)
 
-        # Process chunks in parallel with rate limiting
+        chunk_results = [
+            {"chunk": chunk, "concepts": hit[0], "topics": hit[1]} if hit else None
+            for chunk, hit in zip(chunks, cached)
+        ]
+
+        # Analyze the remaining chunks several to a request, with batches run in
+        # parallel under the rate limit
         semaphore = asyncio.Semaphore(self.max_concurrent)
-        tasks = []
+        misses = [i for i, hit in enumerate(cached) if hit is None]
+        batches = [
+            misses[i : i + self.chunks_per_request]
+            for i in range(0, len(misses), self.chunks_per_request)
+        ]
 
-        async def process_chunk(chunk: ContentChunk):
+        async def process_batch(indices: List[int]):
+            texts = [chunks[i].text for i in indices]
             async with semaphore:
-                concept_analysis = await self.concept_extractor.extract_concepts(
-                    chunk.text
+                concept_analyses, topic_analyses = await asyncio.gather(
+                    self.concept_extractor.extract_concepts_batch(texts),
+                    self.topic_analyzer.analyze_topics_batch(texts),
                 )
-                topic_analysis = await self.topic_analyzer.analyze_topics(chunk.text)
-                return {
-                    "chunk": chunk,
-                    "concepts": concept_analysis,
-                    "topics": topic_analysis,
+            for i, concepts, topics in zip(indices, concept_analyses, topic_analyses):
+                chunk_results[i] = {
+                    "chunk": chunks[i],
+                    "concepts": concepts,
+                    "topics": topics,
                 }
 
-        for chunk in chunks:
-            tasks.append(asyncio.create_task(process_chunk(chunk)))
-
-        chunk_results = await asyncio.gather(*tasks)
+        await asyncio.gather(*(process_batch(batch) for batch in batches))
+
+        if embeddings is not None:
+            for embedding, hit, result in zip(embeddings, cached, chunk_results):
+                if hit is None and result["concepts"] and result["topics"]:
+                    self.semantic_cache.add(
+                        embedding, result["concepts"], result["topics"]
+                    )
+        logger.info(
+            "Semantic cache hits: %s/%s chunks",
+            sum(hit is not None for hit in cached),
+            len(chunks),
+        )
 
         # Combine results from all chunks
         combined_content = self._combine_content_analyses(
@@ -191,7 +282,7 @@ class ChunkProcessor:
         # Create chunk metadata
         metadata = {
             "num_chunks": len(chunks),
-            "chunk_sizes": [len(c.text) for c in chunks],
+            "chunk_sizes": [c.end_index - c.start_index for c in chunks],
             "processing_stats": self._get_processing_stats(chunk_results),
         }
 
@@ -201,6 +292,38 @@ class ChunkProcessor:
             chunk_metadata=metadata,
         )
 
+    def _drop_trivial_chunks(self, chunks: List[ContentChunk]) -> List[ContentChunk]:
+        """Drop blank chunks, and stubs under min_chunk_tokens when there's more.
+
+        A short section that is the whole content (e.g. company details) is
+        still analyzed; a few tokens left over at the end of a long document
+        are not worth an LLM call of their own.
+        """
+        chunks = [chunk for chunk in chunks if not chunk.text.isspace()]
+        substantial = [
+            chunk
+            for chunk in chunks
+            if chunk.token_end - chunk.token_start >= self.min_chunk_tokens
+        ]
+        return substantial or chunks
+
+    async def _embed_chunks(self, chunks: List[ContentChunk]) -> Optional[np.ndarray]:
+        """Embed chunk texts in batched requests; None if embedding fails."""
+        client = get_openai_client()
+        embeddings = []
+        try:
+            for i in range(0, len(chunks), EMBEDDING_BATCH_SIZE):
+                batch = chunks[i : i + EMBEDDING_BATCH_SIZE]
+                response = await client.embeddings.create(
+                    model=EMBEDDING_MODEL, input=[c.text for c in batch]
+                )
+                embeddings.extend(d.embedding for d in response.data)
+        except Exception as e:
+            logger.warning("Skipping semantic cache, embedding failed: %s", e)
+            return None
+
+        return np.asarray(embeddings, dtype=np.float32)
+
     def _combine_content_analyses(
         self, analyses: List[ContentAnalysis], chunks: List[ContentChunk]
     ) -> ContentAnalysis:
@@ -212,7 +335,8 @@ class ChunkProcessor:
         """
         all_main_concepts = []
         all_related_concepts = []
-        all_relationships = []
+        # Relationships deduplicated as they are collected, first one wins
+        relationships: Dict[Tuple[str, str, str], ConceptRelationship] = {}
         all_prerequisites = set()
 
         found_main_concepts = sum(1 for a in analyses if len(a.main_concepts) > 0)
@@ -229,7 +353,10 @@ class ChunkProcessor:
 
             all_main_concepts.extend(analysis.main_concepts)
             all_related_concepts.extend(analysis.related_concepts)
-            all_relationships.extend(analysis.relationships)
+            for rel in analysis.relationships:
+                relationships.setdefault(
+                    (rel.source, rel.target, rel.relationship), rel
+                )
             all_prerequisites.update(analysis.prerequisites)
 
         # Merge similar concepts using position information
@@ -237,16 +364,13 @@ class ChunkProcessor:
             all_main_concepts, concept_positions
         )
 
-        # Merge relationships
-        merged_relationships = self._merge_relationships(all_relationships)
-
         # Create overall complexity score
         overall_complexity = self._combine_complexity_scores(analyses)
 
         return ContentAnalysis(
             main_concepts=merged_main_concepts,
             related_concepts=self._merge_similar_concepts(all_related_concepts, {}),
-            relationships=merged_relationships,
+            relationships=list(relationships.values()),
             prerequisites=list(all_prerequisites),
             complexity=overall_complexity,
         )
@@ -258,19 +382,15 @@ class ChunkProcessor:
         - Merge subtopics
         - Combine theme analysis
         """
-        # Count topic occurrences for primary topic selection
-        topic_counts = {}
+        # Count topic occurrences for primary topic selection, keeping the first
+        # Topic seen under each name
+        topic_counts = Counter(a.primary_topic.name for a in analyses)
+        first_seen = {}
         for analysis in analyses:
-            topic_name = analysis.primary_topic.name
-            if topic_name not in topic_counts:
-                topic_counts[topic_name] = {
-                    "count": 0,
-                    "topic": analysis.primary_topic,
-                }
-            topic_counts[topic_name]["count"] += 1
+            first_seen.setdefault(analysis.primary_topic.name, analysis.primary_topic)
 
-        # Select most common topic as primary
-        primary_topic = max(topic_counts.values(), key=lambda x: x["count"])["topic"]
+        # Select most common topic as primary (ties go to the first seen)
+        primary_topic = first_seen[topic_counts.most_common(1)[0][0]]
 
         # Merge secondary topics
         all_secondary = []
@@ -304,13 +424,12 @@ class ChunkProcessor:
             return min(positions.get(concept.name, [float("inf")]))
 
         sorted_concepts = sorted(concepts, key=get_first_position)
+        similar_indices = self._find_similar_concepts(concepts)
 
         for concept in sorted_concepts:
             if concept.name not in seen:
                 # Find similar concepts
-                similar = [
-                    c for c in concepts if self._are_concepts_similar(concept, c)
-                ]
+                similar = [concepts[i] for i in similar_indices[concept.name.lower()]]
 
                 # Merge metrics and definitions
                 merged_concept = concept
@@ -322,36 +441,21 @@ class ChunkProcessor:
 
         return merged
 
-    def _merge_relationships(
-        self, relationships: List[ConceptRelationship]
-    ) -> List[ConceptRelationship]:
-        """Merge and deduplicate relationships."""
-        merged = []
-        seen = set()
-
-        for rel in relationships:
-            key = (rel.source, rel.target, rel.relationship)
-            if key not in seen:
-                merged.append(rel)
-                seen.add(key)
-
-        return merged
-
     def _combine_complexity_scores(
         self, analyses: List[ContentAnalysis]
     ) -> ContentComplexity:
         """Combine complexity analyses from chunks."""
         all_technical_terms = set()
         all_required = set()
-        scores = []
+        score_total = 0.0
 
         for analysis in analyses:
-            scores.append(analysis.complexity.score)
+            score_total += analysis.complexity.score
             all_technical_terms.update(analysis.complexity.technical_terms)
             all_required.update(analysis.complexity.required_knowledge)
 
         return ContentComplexity(
-            score=sum(scores) / len(scores),
+            score=score_total / len(analyses),
             technical_terms=list(all_technical_terms),
             required_knowledge=list(all_required),
             reasoning="Combined from chunk analyses",
@@ -398,15 +502,38 @@ class ChunkProcessor:
             "complexity_scores": [r["concepts"].complexity.score for r in results],
         }
 
-    def _are_concepts_similar(self, c1: Concept, c2: Concept) -> bool:
-        """Check if two concepts are similar enough to merge."""
+    def _find_similar_concepts(self, concepts: List[Concept]) -> Dict[str, List[int]]:
+        """Map each lowercased concept name to the indices of similar concepts.
+
+        Two concepts are similar when one name contains the other, ignoring
+        case. Every name is searched for all the others in one Aho-Corasick
+        pass instead of comparing each pair.
+        """
         # Simple name similarity for now
         # Could be enhanced with embedding similarity
-        return (
-            c1.name.lower() == c2.name.lower()
-            or c1.name.lower() in c2.name.lower()
-            or c2.name.lower() in c1.name.lower()
-        )
+        indices_by_name = defaultdict(list)
+        for i, concept in enumerate(concepts):
+            indices_by_name[concept.name.lower()].append(i)
+
+        if not any(indices_by_name):
+            return dict(indices_by_name)
+
+        automaton = ahocorasick.Automaton()
+        for name in indices_by_name:
+            if name:
+                automaton.add_word(name, name)
+        automaton.make_automaton()
+
+        related = {name: {name} for name in indices_by_name}
+        for name in indices_by_name:
+            for _, contained in automaton.iter(name):
+                related[name].add(contained)
+                related[contained].add(name)
+
+        return {
+            name: sorted(i for other in names for i in indices_by_name[other])
+            for name, names in related.items()
+        }
 
     def _merge_concept_info(self, similar_concepts: List[Concept]) -> Concept:
         """Merge information from similar concepts."""
@@ -434,5 +561,7 @@ class ChunkProcessor:
 
     async def close(self):
         """Cleanup resources."""
+        self.semantic_cache.close()
         await self.concept_extractor.close()
         await self.topic_analyzer.close()
+        await close_openai_client()
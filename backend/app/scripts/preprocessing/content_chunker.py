@@ -1,46 +1,120 @@
 import logging
-from dataclasses import dataclass
+from bisect import bisect_left
+from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import List
 
+import tiktoken
+
 logger = logging.getLogger(__name__)
 
+PARAGRAPH_BREAK = "\n\n"
+
+
+@lru_cache(maxsize=None)
+def _get_encoding(model: str) -> tiktoken.Encoding:
+    """Get the tokenizer for a model; building the BPE ranks is slow."""
+    return tiktoken.encoding_for_model(model)
+
 
 @dataclass
 class ContentChunk:
-    """A chunk of content that fits within API limits."""
+    """A chunk of content that fits within API limits.
+
+    Holds a reference to the original text rather than a copy of its slice, so
+    a document's chunks don't duplicate it in memory.
+    """
 
-    text: str
+    source: str = field(repr=False)
     start_index: int  # Position in original text
     end_index: int
+    token_start: int  # Position in the original text's token sequence
+    token_end: int
+
+    @property
+    def text(self) -> str:
+        return self.source[self.start_index : self.end_index]
 
 
 class ContentChunker:
-    """Break down content into chunks suitable for API processing."""
+    """Break down content into chunks suitable for API processing.
 
-    def __init__(self, max_chunk_size: int = 12000):
-        self.max_chunk_size = max_chunk_size
+    Chunks are sized in model tokens rather than characters and end on a
+    paragraph break where one falls in the back half of the window, so the same
+    document always splits at the same places and no chunk is cut mid-word.
+    """
+
+    def __init__(
+        self,
+        max_chunk_tokens: int = 3000,
+        overlap_tokens: int = 100,
+        model: str = "gpt-4o-mini",
+    ):
+        self.max_chunk_tokens = max_chunk_tokens
+        self.overlap_tokens = overlap_tokens
+        self.model = model
 
     def chunk_content(self, text: str) -> List[ContentChunk]:
         """
         Split content into chunks that stay within API limits.
         """
+        encoding = _get_encoding(self.model)
+        tokens = encoding.encode_ordinary(text)
+        # Character offset of each token, so chunks are sliced from the original
+        # text instead of decoding token windows
+        _, offsets = encoding.decode_with_offsets(tokens)
+        offsets.append(len(text))
+        num_tokens = len(tokens)
 
         chunks = []
-        current_pos = 0
-        text_length = len(text)
-
-        while current_pos < text_length:
-            chunk_end = min(text_length, current_pos + self.max_chunk_size)
+        token_start = 0
+        while token_start < num_tokens:
+            token_end = min(num_tokens, token_start + self.max_chunk_tokens)
+            if token_end < num_tokens:
+                token_end = self._paragraph_end(text, offsets, token_start, token_end)
 
             chunks.append(
                 ContentChunk(
-                    text=text[current_pos:chunk_end],
-                    start_index=current_pos,
-                    end_index=chunk_end,
+                    source=text,
+                    start_index=offsets[token_start],
+                    end_index=offsets[token_end],
+                    token_start=token_start,
+                    token_end=token_end,
                 )
             )
 
-            current_pos = chunk_end
+            if token_end >= num_tokens:
+                break
+            token_start = self._next_start(text, offsets, token_start, token_end)
 
-        logger.info(f"Split content into {len(chunks)} chunks")
+        logger.info("Split %s tokens into %s chunks", num_tokens, len(chunks))
         return chunks
+
+    @staticmethod
+    def _paragraph_end(
+        text: str, offsets: List[int], token_start: int, token_end: int
+    ) -> int:
+        """Pull a window's end back to the last paragraph break in its back half."""
+        midpoint = offsets[(token_start + token_end) // 2]
+        split = text.rfind(PARAGRAPH_BREAK, midpoint, offsets[token_end])
+        if split < 0:
+            return token_end
+
+        boundary = bisect_left(offsets, split + len(PARAGRAPH_BREAK), token_start)
+        return boundary if token_start < boundary < token_end else token_end
+
+    def _next_start(
+        self, text: str, offsets: List[int], token_start: int, token_end: int
+    ) -> int:
+        """Start the next window overlap_tokens back, at a paragraph if possible."""
+        overlap_start = max(token_start + 1, token_end - self.overlap_tokens)
+        split = text.find(
+            PARAGRAPH_BREAK,
+            offsets[overlap_start],
+            offsets[token_end] - len(PARAGRAPH_BREAK),
+        )
+        if split < 0:
+            return overlap_start
+
+        boundary = bisect_left(offsets, split + len(PARAGRAPH_BREAK), overlap_start)
+        return boundary if boundary < token_end else overlap_start
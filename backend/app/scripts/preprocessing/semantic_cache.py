@@ -0,0 +1,147 @@
+import logging
+import os
+import uuid
+from collections import OrderedDict
+from typing import List, Optional, Sequence, Tuple
+
+import hnswlib
+import numpy as np
+from app.models.recommendations.content_analysis import ContentAnalysis
+from app.models.topic_analysis import TopicAnalysis
+from app.scripts.preprocessing.analysis_cache import CACHE_DIR
+from diskcache import Cache
+
+logger = logging.getLogger(__name__)
+
+EMBEDDING_DIM = 1536  # text-embedding-3-small
+
+
+class SemanticCache:
+    """Nearest-neighbour cache of chunk analyses keyed by text embedding.
+
+    Sits in front of the exact-match AnalysisCache: a chunk whose embedding is
+    within `max_distance` (cosine) of one already analyzed reuses that chunk's
+    concept and topic analyses, so near-duplicates such as boilerplate with a
+    changed date skip the LLM entirely. The HNSW index is saved to disk on
+    close() and payloads live in a diskcache store next to it. Once
+    `max_elements` entries are stored the least recently used one is evicted.
+
+    Each process works on its own copy of the index and the last one to close
+    wins, while payloads are shared through the cache directory. Labels are
+    random 63-bit ids rather than a counter, so processes never hand out the
+    same label and overwrite each other's payloads; a label always maps to the
+    analyses of the vector it was added with. Vectors lost to another process's
+    save just leave their payloads to diskcache's eviction.
+    """
+
+    def __init__(
+        self,
+        name: str = "semantic",
+        max_distance: float = 0.08,
+        max_elements: int = 100_000,
+    ):
+        self.max_distance = max_distance
+        self.max_elements = max_elements
+        self.directory = CACHE_DIR / name
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._index_path = self.directory / "index.bin"
+
+        self._payloads = Cache(str(self.directory / "payloads"))
+        self._index = hnswlib.Index(space="cosine", dim=EMBEDDING_DIM)
+        if self._index_path.exists():
+            self._index.load_index(
+                str(self._index_path),
+                max_elements=max_elements,
+                allow_replace_deleted=True,
+            )
+        else:
+            self._index.init_index(
+                max_elements=max_elements,
+                ef_construction=200,
+                M=16,
+                allow_replace_deleted=True,
+            )
+        self._index.set_ef(50)
+
+        # Recency order is only tracked in memory; after a reload it starts in
+        # arbitrary order. Labels without a payload were evicted.
+        self._lru: OrderedDict = OrderedDict.fromkeys(
+            label for label in self._index.get_ids_list() if label in self._payloads
+        )
+
+    def lookup(
+        self, embeddings: np.ndarray
+    ) -> List[Optional[Tuple[ContentAnalysis, TopicAnalysis]]]:
+        """Return the cached analyses for each embedding, None where none is close."""
+        results: List[Optional[Tuple[ContentAnalysis, TopicAnalysis]]] = [None] * len(
+            embeddings
+        )
+        if not self._lru or not len(embeddings):
+            return results
+
+        labels, distances = self._index.knn_query(embeddings, k=1)
+        for i, (label, distance) in enumerate(zip(labels[:, 0], distances[:, 0])):
+            if distance >= self.max_distance:
+                continue
+
+            label = int(label)
+            payload = self._payloads.get(label)
+            if payload is None:
+                # Payload culled by diskcache; drop the orphaned vector too
+                self._evict(label)
+                continue
+
+            self._lru.move_to_end(label)
+            results[i] = (
+                ContentAnalysis.model_validate_json(payload["concepts"]),
+                TopicAnalysis.model_validate_json(payload["topics"]),
+            )
+
+        return results
+
+    def add(
+        self,
+        embedding: Sequence[float],
+        concepts: ContentAnalysis,
+        topics: TopicAnalysis,
+    ) -> None:
+        """Store analyses under an embedding, evicting the LRU entry if full."""
+        if len(self._lru) >= self.max_elements:
+            self._evict(next(iter(self._lru)))
+
+        # Random rather than sequential, see the class docstring
+        label = uuid.uuid4().int >> 65
+        self._payloads.set(
+            label,
+            {
+                "concepts": concepts.model_dump_json(),
+                "topics": topics.model_dump_json(),
+            },
+        )
+        try:
+            self._index.add_items(
+                np.asarray([embedding], dtype=np.float32),
+                [label],
+                replace_deleted=True,
+            )
+        except RuntimeError as e:
+            logger.warning("Could not add to semantic cache: %s", e)
+            self._payloads.delete(label)
+            return
+        self._lru[label] = None
+
+    def _evict(self, label: int) -> None:
+        """Remove an entry from the index and payload store."""
+        self._lru.pop(label, None)
+        self._payloads.delete(label)
+        self._index.mark_deleted(label)
+
+    def close(self) -> None:
+        """Persist the index and close the payload store."""
+        tmp_path = self._index_path.with_suffix(f".{os.getpid()}.tmp")
+        try:
+            self._index.save_index(str(tmp_path))
+            os.replace(tmp_path, self._index_path)
+        except (OSError, RuntimeError) as e:
+            logger.warning("Could not save semantic cache index: %s", e)
+        self._payloads.close()
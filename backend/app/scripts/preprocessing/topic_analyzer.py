@@ -1,44 +1,136 @@
-from typing import Optional
+import asyncio
+from typing import Dict, List, Optional, Type, TypeVar
 
 from app.models.topic_analysis import TopicAnalysis
 from app.prompts import PROMPTS
-from openai import AsyncOpenAI
+from app.scripts.preprocessing.analysis_cache import AnalysisCache
+from app.services.openai_client import get_openai_client
+from pydantic import BaseModel
 from tenacity import retry, stop_after_attempt, wait_exponential
 
 
+class _TopicAnalysisBatch(BaseModel):
+    """One TopicAnalysis per chunk of a batched request, in chunk order."""
+
+    analyses: List[TopicAnalysis]
+
+
+T = TypeVar("T", bound=BaseModel)
+
+
 class TopicAnalyzer:
     """Analyze topics and themes in financial content using LLM."""
 
     def __init__(self, model: str = "gpt-4o-mini"):
-        self.client = AsyncOpenAI()
+        self.client = get_openai_client()
         self.model = model
+        self.cache = AnalysisCache("topics")
+
+    async def analyze_topics(self, text: str) -> Optional[TopicAnalysis]:
+        """Analyze topics and themes in text, reusing cached results."""
+        messages = self._build_messages(text)
+        key = self.cache.key(self.model, messages)
+
+        # Checked outside the retried call so retries never repeat a cache hit
+        cached = self.cache.get(key, TopicAnalysis)
+        if cached is not None:
+            return cached
+
+        return await self._analyze_topics_uncached(messages, key)
+
+    async def _analyze_topics_uncached(
+        self, messages: List[Dict[str, str]], key: str
+    ) -> Optional[TopicAnalysis]:
+        """Send a request that missed the cache and cache its result."""
+        analysis = await self._analyze_topics(messages)
+        if analysis is not None:
+            self.cache.set(key, analysis)
+        return analysis
+
+    async def analyze_topics_batch(
+        self, texts: List[str]
+    ) -> List[Optional[TopicAnalysis]]:
+        """Run topic analysis for several texts in a single request.
+
+        Cached texts are skipped. If the batched response fails or doesn't have
+        one analysis per text, the remaining texts are sent one request each.
+        """
+        messages = [self._build_messages(text) for text in texts]
+        keys = [self.cache.key(self.model, m) for m in messages]
+        results = [self.cache.get(key, TopicAnalysis) for key in keys]
+        missing = [i for i, result in enumerate(results) if result is None]
+        if not missing:
+            return results
+
+        batch = await self._analyze_topics(
+            self._build_batch_messages([texts[i] for i in missing]),
+            response_format=_TopicAnalysisBatch,
+        )
+        if batch is None or len(batch.analyses) != len(missing):
+            # These texts were already looked up above, so skip the cache
+            # check to keep each miss counted once
+            fallback = await asyncio.gather(
+                *(self._analyze_topics_uncached(messages[i], keys[i]) for i in missing)
+            )
+            for i, analysis in zip(missing, fallback):
+                results[i] = analysis
+            return results
+
+        for i, analysis in zip(missing, batch.analyses):
+            results[i] = analysis
+            self.cache.set(keys[i], analysis)
+        return results
+
+    @staticmethod
+    def _build_messages(text: str) -> List[Dict[str, str]]:
+        """Build the chat messages for a topic analysis request."""
+        return [
+            {
+                "role": "system",
+                "content": PROMPTS["system"]["content_preprocessing"]["topic_analysis"],
+            },
+            {
+                "role": "user",
+                "content": PROMPTS["user"]["content_preprocessing"][
+                    "topic_analysis"
+                ].format(text=text),
+            },
+        ]
+
+    @staticmethod
+    def _build_batch_messages(texts: List[str]) -> List[Dict[str, str]]:
+        """Build the chat messages for a batched topic analysis request."""
+        chunks = "\n\n".join(f"### CHUNK {i}\n{text}" for i, text in enumerate(texts))
+        return [
+            {
+                "role": "system",
+                "content": PROMPTS["system"]["content_preprocessing"]["topic_analysis"],
+            },
+            {
+                "role": "user",
+                "content": PROMPTS["user"]["content_preprocessing"][
+                    "topic_analysis_batch"
+                ].format(count=len(texts), chunks=chunks),
+            },
+        ]
 
     @retry(
         stop=stop_after_attempt(3),
         wait=wait_exponential(multiplier=1, min=4, max=10),
         reraise=True,
     )
-    async def analyze_topics(self, text: str) -> Optional[TopicAnalysis]:
-        """Analyze topics and themes in text."""
+    async def _analyze_topics(
+        self,
+        messages: List[Dict[str, str]],
+        response_format: Type[T] = TopicAnalysis,
+    ) -> Optional[T]:
+        """Send a topic analysis request to the LLM."""
         try:
             response = await self.client.beta.chat.completions.parse(
                 model=self.model,
                 temperature=0,
-                messages=[
-                    {
-                        "role": "system",
-                        "content": PROMPTS["system"]["content_preprocessing"][
-                            "topic_analysis"
-                        ],
-                    },
-                    {
-                        "role": "user",
-                        "content": PROMPTS["user"]["content_preprocessing"][
-                            "topic_analysis"
-                        ].format(text=text),
-                    },
-                ],
-                response_format=TopicAnalysis,
+                messages=messages,
+                response_format=response_format,
             )
 
             return response.choices[0].message.parsed
@@ -48,5 +140,9 @@ class TopicAnalyzer:
             return None
 
     async def close(self):
-        """Cleanup resources."""
-        await self.client.close()
+        """Cleanup resources.
+
+        The OpenAI client is shared, so it is closed by whoever owns the
+        pipeline (ChunkProcessor.close) rather than here.
+        """
+        self.cache.close()
@@ -1,7 +1,8 @@
 import asyncio
 import logging
+import time
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 from collections import defaultdict
 
 logger = logging.getLogger(__name__)
@@ -22,17 +23,26 @@ class MultiKeyRateLimiter:
         self.daily_limit = calls_per_day
         self.monthly_limit = calls_per_month
 
-        # Create separate counters for each API key
-        self.last_request = {key: 0.0 for key in api_keys}
+        # Create separate counters for each API key. last_request is the
+        # event-loop (monotonic) time of each key's most recently granted slot.
+        self.last_request = {key: float("-inf") for key in api_keys}
         self.daily_requests = {key: 0 for key in api_keys}
         self.monthly_requests = {key: 0 for key in api_keys}
 
-        self.last_reset = {key: datetime.now() for key in api_keys}
-        self.monthly_reset = {key: datetime.now() for key in api_keys}
+        # Local day and month the counters belong to, as _day_and_month() ints
+        today, this_month = self._day_and_month()
+        self.last_reset = {key: today for key in api_keys}
+        self.monthly_reset = {key: this_month for key in api_keys}
 
         self.current_key_index = 0
         self.lock = asyncio.Lock()
 
+    @staticmethod
+    def _day_and_month() -> Tuple[int, int]:
+        """Current local day and month as ints that change at each boundary."""
+        now = time.localtime()
+        return now.tm_year * 366 + now.tm_yday, now.tm_year * 12 + now.tm_mon
+
     def _get_next_key(self) -> str:
         """Get next available API key using round-robin."""
         key = self.api_keys[self.current_key_index]
@@ -40,54 +50,56 @@ class MultiKeyRateLimiter:
         return key
 
     async def acquire(self) -> Optional[str]:
-        """Acquire rate limit slot and return the API key to use."""
+        """Acquire rate limit slot and return the API key to use.
+
+        Only picking a key and booking its next slot happens under the lock;
+        the wait for that slot does not, so callers using different keys wait
+        in parallel instead of queueing behind one another.
+        """
         async with self.lock:
+            loop = asyncio.get_running_loop()
+            today, this_month = self._day_and_month()
+
             # Try each API key until we find one that's available
-            keys_tried = 0
-            while keys_tried < len(self.api_keys):
+            for _ in range(len(self.api_keys)):
                 key = self._get_next_key()
-                now = datetime.now()
 
                 # Reset counters if needed
-                if now.date() > self.last_reset[key].date():
+                if today != self.last_reset[key]:
                     self.daily_requests[key] = 0
-                    self.last_reset[key] = now
+                    self.last_reset[key] = today
 
-                if now.month != self.monthly_reset[key].month:
+                if this_month != self.monthly_reset[key]:
                     self.monthly_requests[key] = 0
-                    self.monthly_reset[key] = now
+                    self.monthly_reset[key] = this_month
 
                 # Check limits
                 if self.daily_limit and self.daily_requests[key] >= self.daily_limit:
-                    keys_tried += 1
                     continue
 
                 if (
                     self.monthly_limit
                     and self.monthly_requests[key] >= self.monthly_limit
                 ):
-                    keys_tried += 1
                     continue
 
-                # Calculate wait time for rate limit
-                current = datetime.now().timestamp()
-                wait_time = max(
-                    0, (1 / self.rate) - (current - self.last_request[key])
-                )
-
-                if wait_time > 0:
-                    await asyncio.sleep(wait_time)
-
-                # Update counters
-                self.last_request[key] = datetime.now().timestamp()
+                # Book the key's next slot and update counters before waiting
+                slot = max(loop.time(), self.last_request[key] + 1 / self.rate)
+                self.last_request[key] = slot
                 self.daily_requests[key] += 1
                 self.monthly_requests[key] += 1
+                break
 
-                return key
+            else:
+                # If we get here, no keys are available
+                logger.warning("No API keys available within rate limits")
+                return None
 
-            # If we get here, no keys are available
-            logger.warning("No API keys available within rate limits")
-            return None
+        wait_time = slot - loop.time()
+        if wait_time > 0:
+            await asyncio.sleep(wait_time)
+
+        return key
 
 
 class MultiAPIRateLimiter:
@@ -130,7 +142,7 @@ class MultiAPIRateLimiter:
     async def acquire(self, api_name: str) -> Optional[str]:
         """Acquire rate limit slot for specific API and return API key to use."""
         if api_name not in self.limiters:
-            logger.warning(f"No rate limiter defined for {api_name}")
+            logger.warning("No rate limiter defined for %s", api_name)
             return None
 
         try:
@@ -147,7 +159,7 @@ class MultiAPIRateLimiter:
             return key
 
         except Exception as e:
-            logger.error(f"Error in rate limiter for {api_name}: {str(e)}")
+            logger.error("Error in rate limiter for %s: %s", api_name, e)
             return None
 
     def get_usage_stats(self) -> Dict:
@@ -1,39 +1,95 @@
+import asyncio
 import gzip
 import json
 import logging
 from collections import defaultdict
 from datetime import datetime
-from typing import Any, Dict, Optional
-
+from typing import Any, Dict, Optional, Set
+
+import orjson
+import zstandard
+from app.scripts.gcs_utils import (
+    JSON_SUFFIX,
+    ZSTD_MAGIC,
+    get_credentials,
+    strip_json_suffix,
+)
 from google.cloud import storage
 
 logger = logging.getLogger(__name__)
 
 
+def _serialize_and_compress(document: Dict) -> bytes:
+    """Encode a document as JSON and compress it.
+
+    zstd level 3 is both faster and smaller than gzip; readers tell the formats
+    apart by magic bytes.
+    """
+    # orjson produces UTF-8 bytes directly
+    return zstandard.ZstdCompressor(level=3).compress(
+        orjson.dumps(document, option=orjson.OPT_NON_STR_KEYS)
+    )
+
+
 class BaseScraper:
     """Base class for all scrapers with GCS integration."""
 
     def __init__(self, bucket_name: str = "scraped-financial-data"):
         self.bucket_name = bucket_name
         try:
-            self.storage_client = storage.Client()
+            credentials = get_credentials()
+            if credentials is None:
+                self.storage_client = storage.Client()
+            else:
+                self.storage_client = storage.Client(
+                    project=credentials.project_id, credentials=credentials
+                )
             self.bucket = self.storage_client.bucket(bucket_name)
-            logger.info(f"[GCS] Successfully initialized bucket: {bucket_name}")
+            logger.info("[GCS] Successfully initialized bucket: %s", bucket_name)
         except Exception as e:
-            logger.error(f"[GCS] Failed to initialize GCS client: {str(e)}")
+            logger.error("[GCS] Failed to initialize GCS client: %s", e)
             raise
 
         # Track successful uploads
         self.upload_stats = defaultdict(int)
 
+        # Documents already in each date partition, listed once per partition
+        # and stored without their suffix
+        self._existing: Dict[str, Set[str]] = {}
+
+    def _get_partition(self, content_type: str) -> str:
+        """Get today's GCS prefix for a content type."""
+        date = datetime.now()
+        return f"{content_type}/{date.year}/{date.month:02d}/{date.day:02d}/"
+
     def _get_storage_path(self, content_type: str, identifier: str) -> str:
         """Get GCS path for content."""
-        date = datetime.now()
-        return (
-            f"{content_type}/"
-            f"{date.year}/{date.month:02d}/{date.day:02d}/"
-            f"{identifier}.json.gz"
-        )
+        return f"{self._get_partition(content_type)}{identifier}{JSON_SUFFIX}"
+
+    def _existing_in_partition(self, partition: str) -> Set[str]:
+        """Get the documents under a partition, listing it on first use.
+
+        One paginated list call replaces an exists() round trip per upload.
+        Names are stripped of their suffix, so a document stored as .json.gz
+        before the switch to zstd still counts as existing.
+        """
+        existing = self._existing.get(partition)
+        if existing is None:
+            blobs = self.bucket.list_blobs(
+                prefix=partition, fields="items(name),nextPageToken"
+            )
+            # setdefault: another thread may have listed it in the meantime
+            existing = self._existing.setdefault(
+                partition, {strip_json_suffix(blob.name) for blob in blobs}
+            )
+            logger.info(
+                "[GCS] Found %s existing blobs under %s", len(existing), partition
+            )
+        return existing
+
+    def prefetch_existing(self, content_type: str) -> None:
+        """List today's partition for a content type ahead of a scrape."""
+        self._existing_in_partition(self._get_partition(content_type))
 
     async def store_raw_content(
         self, content_type: str, identifier: str, raw_content: Any, metadata: Dict
@@ -50,7 +106,9 @@ class BaseScraper:
         try:
             # Generate GCS path
             storage_path = self._get_storage_path(content_type, identifier)
-            logger.info(f"[GCS] Attempting to store {content_type} at {storage_path}")
+            logger.info(
+                "[GCS] Attempting to store %s at %s", content_type, storage_path
+            )
 
             # Prepare the full document
             document = {
@@ -65,21 +123,37 @@ class BaseScraper:
             }
 
             # Check if content already exists
-            blob = self.bucket.blob(storage_path)
-            if blob.exists():
-                logger.info(f"[GCS] Content already exists: {storage_path}")
+            existing = await asyncio.to_thread(
+                self._existing_in_partition, storage_path.rpartition("/")[0] + "/"
+            )
+            document_name = strip_json_suffix(storage_path)
+            if document_name in existing:
+                logger.info("[GCS] Content already exists: %s", storage_path)
                 self.upload_stats["skipped"] += 1
                 return True
 
-            # Compress the full document
-            content_str = json.dumps(document)
-            compressed = gzip.compress(content_str.encode("utf-8"))
-            logger.info(f"[GCS] Compressed content size: {len(compressed)} bytes")
+            # Claim the path first: the awaits below would otherwise let a
+            # concurrent store of the same content pass the check too
+            existing.add(document_name)
+            try:
+                # Serializing, compressing and uploading all block, so run them
+                # in a worker thread to keep other scrape tasks' requests moving
+                compressed = await asyncio.to_thread(_serialize_and_compress, document)
+                logger.info("[GCS] Compressed content size: %s bytes", len(compressed))
+
+                # Upload to GCS
+                blob = self.bucket.blob(storage_path)
+                await asyncio.to_thread(
+                    blob.upload_from_string,
+                    compressed,
+                    content_type="application/zstd",
+                )
+            except Exception:
+                existing.discard(document_name)
+                raise
 
-            # Upload to GCS
-            blob.upload_from_string(compressed, content_type="application/gzip")
             logger.info(
-                f"[GCS] Successfully uploaded {content_type} to {storage_path}"
+                "[GCS] Successfully uploaded %s to %s", content_type, storage_path
             )
             self.upload_stats["success"] += 1
 
@@ -87,8 +161,11 @@ class BaseScraper:
 
         except Exception as e:
             logger.error(
-                f"[GCS] Error storing {content_type} {identifier} at "
-                f"{storage_path}: {str(e)}"
+                "[GCS] Error storing %s %s at %s: %s",
+                content_type,
+                identifier,
+                storage_path,
+                e,
             )
             self.upload_stats["failed"] += 1
             return False
@@ -96,22 +173,30 @@ class BaseScraper:
     async def get_raw_content(self, storage_path: str) -> Optional[Dict]:
         """Retrieve stored raw content from GCS."""
         try:
-            logger.info(f"[GCS] Attempting to retrieve content from {storage_path}")
+            logger.info("[GCS] Attempting to retrieve content from %s", storage_path)
             blob = self.bucket.blob(storage_path)
             if not blob.exists():
-                logger.info(f"[GCS] Content not found at {storage_path}")
+                logger.info("[GCS] Content not found at %s", storage_path)
                 return None
 
             # Download and decompress
             compressed = blob.download_as_bytes()
-            content = json.loads(gzip.decompress(compressed).decode("utf-8"))
-            logger.info(f"[GCS] Successfully retrieved content from {storage_path}")
+            if compressed.startswith(ZSTD_MAGIC):
+                data = zstandard.ZstdDecompressor().decompress(compressed)
+            else:
+                # Uploaded before the switch to zstd
+                data = gzip.decompress(compressed)
+            try:
+                content = orjson.loads(data)
+            except orjson.JSONDecodeError:
+                # Documents written with json.dumps may contain NaN/Infinity,
+                # which only the stdlib parser accepts
+                content = json.loads(data)
+            logger.info("[GCS] Successfully retrieved content from %s", storage_path)
             return content
 
         except Exception as e:
-            logger.error(
-                f"[GCS] Error retrieving content from {storage_path}: {str(e)}"
-            )
+            logger.error("[GCS] Error retrieving content from %s: %s", storage_path, e)
             return None
 
     def get_upload_stats(self) -> Dict[str, int]:
@@ -1,16 +1,21 @@
 import asyncio
 import logging
+import re
 from collections import defaultdict
 from datetime import datetime
 from typing import Dict, List, Optional
 
 import aiohttp
+import orjson
 from app.scripts.companies import get_all_companies, get_company_by_symbol
 from app.scripts.rate_limiter import MultiAPIRateLimiter
 from app.scripts.scrapers.base import BaseScraper
 
 logger = logging.getLogger(__name__)
 
+# "Speaker Name: content", split at the first colon
+SPEAKER_LINE_RE = re.compile(r"([^:]*):(.*)")
+
 
 class EarningsCallScraper(BaseScraper):
     def __init__(
@@ -78,17 +83,18 @@ class EarningsCallScraper(BaseScraper):
                         else len(prioritize_sectors)
                     )
                 )
-                logger.info(f"[EARNINGS] Prioritizing sectors: {prioritize_sectors}")
+                logger.info("[EARNINGS] Prioritizing sectors: %s", prioritize_sectors)
             symbols = [company["symbol"] for company in companies]
             logger.info(
-                f"[EARNINGS] No symbols provided, using all {len(symbols)} companies"
+                "[EARNINGS] No symbols provided, using all %s companies", len(symbols)
             )
 
         results = defaultdict(int)
         company_assignments = self._assign_companies_to_keys(symbols)
         logger.info(
-            f"[EARNINGS] Processing {len(symbols)} companies with "
-            f"{len(self.rate_limiter.limiters['seeking_alpha'].api_keys)} API keys"
+            "[EARNINGS] Processing %s companies with %s API keys",
+            len(symbols),
+            len(self.rate_limiter.limiters["seeking_alpha"].api_keys),
         )
 
         async with aiohttp.ClientSession() as session:
@@ -115,11 +121,11 @@ class EarningsCallScraper(BaseScraper):
                     for category, count in result.items():
                         results[category] += count
                 elif isinstance(result, Exception):
-                    logger.error(f"[EARNINGS] Batch processing error: {str(result)}")
+                    logger.error("[EARNINGS] Batch processing error: %s", result)
 
         logger.info(
-            f"[EARNINGS] Scraping complete. Results by category: "
-            f"{', '.join(f'{k}={v}' for k, v in results.items())}"
+            "[EARNINGS] Scraping complete. Results by category: %s",
+            ", ".join(f"{k}={v}" for k, v in results.items()),
         )
         return dict(results)
 
@@ -159,30 +165,32 @@ class EarningsCallScraper(BaseScraper):
                 ) as response:
                     if response.status == 429:  # Rate limit
                         logger.warning(
-                            f"[EARNINGS] Rate limit hit for {symbol}, waiting..."
+                            "[EARNINGS] Rate limit hit for %s, waiting...", symbol
                         )
                         await asyncio.sleep(30)  # Wait 30 seconds on rate limit
                         continue
 
                     if response.status == 403:  # Auth issue
                         logger.error(
-                            f"[EARNINGS] Authentication failed for {symbol} - verify "
-                            "RapidAPI key"
+                            "[EARNINGS] Authentication failed for %s - verify "
+                            "RapidAPI key",
+                            symbol,
                         )
                         continue
 
                     if response.status == 204:  # No content
-                        logger.info(f"[EARNINGS] No transcripts found for {symbol}")
+                        logger.info("[EARNINGS] No transcripts found for %s", symbol)
                         continue
 
                     if response.status != 200:
                         logger.error(
-                            f"[EARNINGS] Error fetching transcript list for {symbol}: "
-                            f"{response.status}"
+                            "[EARNINGS] Error fetching transcript list for %s: %s",
+                            symbol,
+                            response.status,
                         )
                         continue
 
-                    transcript_list = await response.json()
+                    transcript_list = orjson.loads(await response.read())
 
                     # Sort by date and take most recent
                     available_transcripts = sorted(
@@ -215,7 +223,7 @@ class EarningsCallScraper(BaseScraper):
                     await asyncio.sleep(1)
 
             except Exception as e:
-                logger.error(f"[EARNINGS] Error processing {symbol}: {str(e)}")
+                logger.error("[EARNINGS] Error processing %s: %s", symbol, e)
                 continue
 
         return results
@@ -232,13 +240,14 @@ class EarningsCallScraper(BaseScraper):
             async with session.get(url, headers=headers, params=params) as response:
                 if response.status == 401:
                     logger.error(
-                        f"[EARNINGS] Authentication failed for {symbol} - verify "
-                        "RapidAPI key"
+                        "[EARNINGS] Authentication failed for %s - verify "
+                        "RapidAPI key",
+                        symbol,
                     )
                     return None
                 elif response.status == 429:
                     logger.warning(
-                        f"[EARNINGS] Rate limit hit for {symbol}, waiting..."
+                        "[EARNINGS] Rate limit hit for %s, waiting...", symbol
                     )
                     await asyncio.sleep(60)  # Wait for rate limit reset
                     return await self._fetch_transcript(
@@ -246,20 +255,21 @@ class EarningsCallScraper(BaseScraper):
                     )  # Retry
                 elif response.status != 200:
                     logger.error(
-                        f"[EARNINGS] Error fetching transcript for {symbol}: "
-                        f"{response.status}"
+                        "[EARNINGS] Error fetching transcript for %s: %s",
+                        symbol,
+                        response.status,
                     )
                     return None
 
-                data = await response.json()
+                data = orjson.loads(await response.read())
                 if not data or not data.get("data"):
-                    logger.warning(f"[EARNINGS] No transcript data found for {symbol}")
+                    logger.warning("[EARNINGS] No transcript data found for %s", symbol)
                     return None
 
                 return data
 
         except Exception as e:
-            logger.error(f"[EARNINGS] Error processing {symbol}: {str(e)}")
+            logger.error("[EARNINGS] Error processing %s: %s", symbol, e)
             return None
 
     async def _process_transcript(
@@ -276,7 +286,7 @@ class EarningsCallScraper(BaseScraper):
 
             company = get_company_by_symbol(symbol)
             if not company:
-                logger.error(f"[EARNINGS] Company not found for symbol {symbol}")
+                logger.error("[EARNINGS] Company not found for symbol %s", symbol)
                 return False
 
             # Store the transcript
@@ -303,9 +313,7 @@ class EarningsCallScraper(BaseScraper):
             return True
 
         except Exception as e:
-            logger.error(
-                f"[EARNINGS] Error processing transcript for {symbol}: {str(e)}"
-            )
+            logger.error("[EARNINGS] Error processing transcript for %s: %s", symbol, e)
             return False
 
     async def _make_request(
@@ -320,9 +328,7 @@ class EarningsCallScraper(BaseScraper):
 
         try:
             async with self.rate_limiter.limiters["seeking_alpha"].acquire(api_key):
-                async with session.get(
-                    url, headers=headers, params=params
-                ) as response:
+                async with session.get(url, headers=headers, params=params) as response:
                     if response.status == 401:
                         error_msg = (
                             "[EARNINGS] Authentication failed - verify RapidAPI key: "
@@ -343,18 +349,16 @@ class EarningsCallScraper(BaseScraper):
                         logger.error(error_msg)
                         raise RuntimeError(error_msg)
 
-                    return await response.json()
+                    return orjson.loads(await response.read())
 
         except aiohttp.ClientError as e:
-            logger.error(f"[EARNINGS] Network error: {str(e)}")
+            logger.error("[EARNINGS] Network error: %s", e)
             raise
         except asyncio.TimeoutError:
             logger.error("[EARNINGS] Request timed out")
             raise
         except Exception as e:
-            logger.error(
-                f"[EARNINGS] Unexpected error: {e.__class__.__name__}: {str(e)}"
-            )
+            logger.error("[EARNINGS] Unexpected error: %s: %s", e.__class__.__name__, e)
             raise
 
     async def _scrape_transcript(
@@ -396,8 +400,9 @@ class EarningsCallScraper(BaseScraper):
 
         except Exception as e:
             logger.error(
-                f"[EARNINGS] Error scraping transcript {transcript_meta.get('id')}: "
-                f"{str(e)}"
+                "[EARNINGS] Error scraping transcript %s: %s",
+                transcript_meta.get("id"),
+                e,
             )
             return False
 
@@ -408,21 +413,26 @@ class EarningsCallScraper(BaseScraper):
 
         # Simple speaker pattern: "Speaker Name:"
         for line in text.split("\n"):
-            if ":" in line and len(line.split(":")[0].split()) <= 5:
+            match = SPEAKER_LINE_RE.match(line)
+            if match and len(match.group(1).split()) <= 5:
                 # Likely a new speaker
                 if current_segment:
                     segments.append(current_segment)
 
-                speaker = line.split(":")[0].strip()
-                content = line.split(":", 1)[1].strip()
-                current_segment = {"speaker": speaker, "content": content}
+                speaker = match.group(1).strip()
+                content = match.group(2).strip()
+                # Content lines are collected and joined once at the end
+                current_segment = {"speaker": speaker, "content": [content]}
             elif current_segment:
-                current_segment["content"] += " " + line.strip()
+                current_segment["content"].append(line.strip())
 
         # Add the last segment
         if current_segment:
             segments.append(current_segment)
 
+        for segment in segments:
+            segment["content"] = " ".join(segment["content"])
+
         return segments
 
     def _extract_qa_segments(self, text: str) -> List[Dict]:
@@ -431,9 +441,10 @@ class EarningsCallScraper(BaseScraper):
         current_segment = None
 
         for line in text.split("\n"):
-            if ":" in line and len(line.split(":")[0].split()) <= 5:
-                speaker = line.split(":")[0].strip()
-                content = line.split(":", 1)[1].strip()
+            match = SPEAKER_LINE_RE.match(line)
+            if match and len(match.group(1).split()) <= 5:
+                speaker = match.group(1).strip()
+                content = match.group(2).strip()
 
                 # Check if this is a new question (usually from an analyst)
                 if "?" in content or speaker.lower().endswith("analyst"):
@@ -441,26 +452,31 @@ class EarningsCallScraper(BaseScraper):
                     if current_segment:
                         segments.append(current_segment)
 
+                    # Content lines are collected and joined once at the end
                     current_segment = {
-                        "question": {"speaker": speaker, "content": content},
+                        "question": {"speaker": speaker, "content": [content]},
                         "answers": [],
                     }
                 elif current_segment:
                     # This is an answer
                     current_segment["answers"].append(
-                        {"speaker": speaker, "content": content}
+                        {"speaker": speaker, "content": [content]}
                     )
             elif current_segment:
                 # Continue previous speaker's content
                 if current_segment["answers"]:
-                    current_segment["answers"][-1]["content"] += " " + line.strip()
+                    current_segment["answers"][-1]["content"].append(line.strip())
                 else:
-                    current_segment["question"]["content"] += " " + line.strip()
+                    current_segment["question"]["content"].append(line.strip())
 
         # Add the last segment
         if current_segment:
             segments.append(current_segment)
 
+        for segment in segments:
+            for turn in [segment["question"], *segment["answers"]]:
+                turn["content"] = " ".join(turn["content"])
+
         return segments
 
     async def _extract_sections(self, transcript_data: Dict) -> List[Dict]:
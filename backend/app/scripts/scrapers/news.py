@@ -145,7 +145,7 @@ class NewsAPIScraper(BaseScraper):
                     for category, count in result.items():
                         results[category] += count
                 elif isinstance(result, Exception):
-                    logger.error(f"[NEWS] Batch processing error: {str(result)}")
+                    logger.error("[NEWS] Batch processing error: %s", result)
 
         return dict(results)
 
@@ -195,8 +195,9 @@ class NewsAPIScraper(BaseScraper):
                 ) as response:
                     if response.status != 200:
                         logger.error(
-                            f"[NEWS] Error fetching news for {symbol}: "
-                            f"{response.status}"
+                            "[NEWS] Error fetching news for %s: %s",
+                            symbol,
+                            response.status,
                         )
                         continue
 
@@ -223,7 +224,7 @@ class NewsAPIScraper(BaseScraper):
                             self.processed_articles.add(article_id)
 
             except Exception as e:
-                logger.error(f"[NEWS] Error processing {symbol}: {str(e)}")
+                logger.error("[NEWS] Error processing %s: %s", symbol, e)
 
         return results
 
@@ -256,8 +257,9 @@ class NewsAPIScraper(BaseScraper):
                 ) as response:
                     if response.status != 200:
                         logger.error(
-                            f"[NEWS] Error fetching news for query '{query}': "
-                            f"{response.status}"
+                            "[NEWS] Error fetching news for query '%s': %s",
+                            query,
+                            response.status,
                         )
                         continue
 
@@ -278,7 +280,7 @@ class NewsAPIScraper(BaseScraper):
                             self.processed_articles.add(article_id)
 
             except Exception as e:
-                logger.error(f"[NEWS] Error processing query '{query}': {str(e)}")
+                logger.error("[NEWS] Error processing query '%s': %s", query, e)
 
         return results
 
@@ -338,7 +340,9 @@ class NewsAPIScraper(BaseScraper):
 
         except Exception as e:
             logger.error(
-                f"[NEWS] Error storing article {article.get('url')}: " f"{str(e)}"
+                "[NEWS] Error storing article %s: %s",
+                article.get("url"),
+                e,
             )
             return False
 
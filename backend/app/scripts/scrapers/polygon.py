@@ -81,14 +81,15 @@ class PolygonScraper(BaseScraper):
         if not symbols:
             symbols = [company["symbol"] for company in get_all_companies()]
             logger.info(
-                f"[POLYGON] No symbols provided, using all {len(symbols)} companies"
+                "[POLYGON] No symbols provided, using all %s companies", len(symbols)
             )
 
         results = defaultdict(int)
         company_assignments = self._assign_companies_to_keys(symbols)
         logger.info(
-            f"[POLYGON] Processing {len(symbols)} companies with "
-            f"{len(self.rate_limiter.limiters['polygon'].api_keys)} API keys"
+            "[POLYGON] Processing %s companies with %s API keys",
+            len(symbols),
+            len(self.rate_limiter.limiters["polygon"].api_keys),
         )
 
         async with aiohttp.ClientSession() as session:
@@ -116,11 +117,11 @@ class PolygonScraper(BaseScraper):
                     for category, count in result.items():
                         results[category] += count
                 elif isinstance(result, Exception):
-                    logger.error(f"[POLYGON] Batch processing error: {str(result)}")
+                    logger.error("[POLYGON] Batch processing error: %s", result)
 
         logger.info(
-            f"[POLYGON] Scraping complete. Results by category: "
-            f"{', '.join(f'{k}={v}' for k, v in results.items())}"
+            "[POLYGON] Scraping complete. Results by category: %s",
+            ", ".join(f"{k}={v}" for k, v in results.items()),
         )
         return dict(results)
 
@@ -166,7 +167,7 @@ class PolygonScraper(BaseScraper):
                 await asyncio.sleep(1)
 
             except Exception as e:
-                logger.error(f"[POLYGON] Error processing {symbol}: {str(e)}")
+                logger.error("[POLYGON] Error processing %s: %s", symbol, e)
                 continue
 
         return dict(results)
@@ -185,8 +186,9 @@ class PolygonScraper(BaseScraper):
             async with session.get(url, params={"apiKey": api_key}) as response:
                 if response.status != 200:
                     logger.error(
-                        f"[POLYGON] Error fetching details for {symbol}: "
-                        f"{response.status}"
+                        "[POLYGON] Error fetching details for %s: %s",
+                        symbol,
+                        response.status,
                     )
                     return False
 
@@ -235,7 +237,7 @@ class PolygonScraper(BaseScraper):
                 return True
 
         except Exception as e:
-            logger.error(f"[POLYGON] Error getting details for {symbol}: {str(e)}")
+            logger.error("[POLYGON] Error getting details for %s: %s", symbol, e)
             return False
 
     async def _get_financials(
@@ -278,7 +280,7 @@ class PolygonScraper(BaseScraper):
             return True
 
         except Exception as e:
-            logger.error(f"[POLYGON] Error getting financials for {symbol}: {str(e)}")
+            logger.error("[POLYGON] Error getting financials for %s: %s", symbol, e)
             return False
 
     async def _fetch_financials(
@@ -295,17 +297,17 @@ class PolygonScraper(BaseScraper):
 
             async with session.get(url, params=params) as response:
                 if response.status == 404:
-                    logger.error(f"[POLYGON] No financial data found for {symbol}")
+                    logger.error("[POLYGON] No financial data found for %s", symbol)
                     return None
                 elif response.status == 401:
                     logger.error(
-                        f"[POLYGON] Authentication failed for {symbol} - verify API "
-                        "key"
+                        "[POLYGON] Authentication failed for %s - verify API key",
+                        symbol,
                     )
                     return None
                 elif response.status == 429:
                     logger.warning(
-                        f"[POLYGON] Rate limit hit for {symbol}, waiting..."
+                        "[POLYGON] Rate limit hit for %s, waiting...", symbol
                     )
                     await asyncio.sleep(60)  # Wait for rate limit reset
                     return await self._fetch_financials(
@@ -313,20 +315,21 @@ class PolygonScraper(BaseScraper):
                     )  # Retry
                 elif response.status != 200:
                     logger.error(
-                        f"[POLYGON] Error fetching financials for {symbol}: "
-                        f"{response.status}"
+                        "[POLYGON] Error fetching financials for %s: %s",
+                        symbol,
+                        response.status,
                     )
                     return None
 
                 data = await response.json()
                 if not data.get("results"):
                     logger.warning(
-                        f"[POLYGON] No financial results found for {symbol}"
+                        "[POLYGON] No financial results found for %s", symbol
                     )
                     return None
                 return data
         except Exception as e:
-            logger.error(f"[POLYGON] Error processing {symbol}: {str(e)}")
+            logger.error("[POLYGON] Error processing %s: %s", symbol, e)
             return None
 
     async def close(self):
@@ -133,7 +133,7 @@ class RSSFeedScraper(BaseScraper):
                     for sector, count in result.items():
                         results[sector] += count
                 elif isinstance(result, Exception):
-                    logger.error(f"[RSS] Batch processing error: {str(result)}")
+                    logger.error("[RSS] Batch processing error: %s", result)
 
         return dict(results)
 
@@ -151,11 +151,11 @@ class RSSFeedScraper(BaseScraper):
             try:
                 company = get_company_by_symbol(symbol)
                 if not company:
-                    logger.error(f"[RSS] Company not found for symbol {symbol}")
+                    logger.error("[RSS] Company not found for symbol %s", symbol)
                     continue
 
                 base_url = f"https://{company['domain']}"
-                logger.info(f"[RSS] Processing {company['name']} ({base_url})")
+                logger.info("[RSS] Processing %s (%s)", company["name"], base_url)
 
                 # Try different feed patterns with timeout
                 for pattern in self.feed_patterns:
@@ -179,7 +179,7 @@ class RSSFeedScraper(BaseScraper):
                                 continue
                             elif response.status != 200:
                                 logger.warning(
-                                    f"[RSS] Status {response.status} for {feed_url}"
+                                    "[RSS] Status %s for %s", response.status, feed_url
                                 )
                                 continue
 
@@ -217,28 +217,26 @@ class RSSFeedScraper(BaseScraper):
                                 for result in entry_results:
                                     if isinstance(result, Exception):
                                         logger.warning(
-                                            "[RSS] Entry processing error: "
-                                            f"{str(result)}"
+                                            "[RSS] Entry processing error: %s",
+                                            result,
                                         )
                                     elif result:
                                         results[company.get("sector", "Unknown")] += 1
 
                     except asyncio.TimeoutError:
-                        logger.warning(f"[RSS] Timeout fetching {feed_url}")
+                        logger.warning("[RSS] Timeout fetching %s", feed_url)
                         continue
                     except aiohttp.ClientError as e:
-                        logger.warning(
-                            f"[RSS] Connection error for {feed_url}: {str(e)}"
-                        )
+                        logger.warning("[RSS] Connection error for %s: %s", feed_url, e)
                         continue
                     except Exception as e:
                         logger.error(
-                            f"[RSS] Unexpected error processing {feed_url}: {str(e)}"
+                            "[RSS] Unexpected error processing %s: %s", feed_url, e
                         )
                         continue
 
             except Exception as e:
-                logger.error(f"[RSS] Error processing {symbol}: {str(e)}")
+                logger.error("[RSS] Error processing %s: %s", symbol, e)
                 continue
 
         return results
@@ -347,7 +345,7 @@ class RSSFeedScraper(BaseScraper):
             return True
 
         except Exception as e:
-            logger.error(f"[RSS] Error storing entry {entry.get('link')}: {str(e)}")
+            logger.error("[RSS] Error storing entry %s: %s", entry.get("link"), e)
             return False
 
     def _extract_company_mentions(self, text: str) -> List[Dict]:
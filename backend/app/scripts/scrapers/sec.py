@@ -68,19 +68,20 @@ class SECFilingScraper(BaseScraper):
         if not symbols:
             symbols = [company["symbol"] for company in get_all_companies()]
             logger.info(
-                f"[SEC] No symbols provided, using all {len(symbols)} companies"
+                "[SEC] No symbols provided, using all %s companies", len(symbols)
             )
         if not filing_types:
             filing_types = self.filing_types
-            logger.info(f"[SEC] Using default filing types: {filing_types}")
+            logger.info("[SEC] Using default filing types: %s", filing_types)
         if not end_date:
             end_date = datetime.now()
 
         results = defaultdict(int)
         company_assignments = self._assign_companies_to_keys(symbols)
         logger.info(
-            f"[SEC] Processing {len(symbols)} companies with {len(self.user_agents)} "
-            "user agents"
+            "[SEC] Processing %s companies with %s user agents",
+            len(symbols),
+            len(self.user_agents),
         )
 
         async with aiohttp.ClientSession() as session:
@@ -109,11 +110,11 @@ class SECFilingScraper(BaseScraper):
                     for category, count in result.items():
                         results[category] += count
                 elif isinstance(result, Exception):
-                    logger.error(f"[SEC] Batch processing error: {str(result)}")
+                    logger.error("[SEC] Batch processing error: %s", result)
 
         logger.info(
-            f"[SEC] Scraping complete. Results by filing type: "
-            f"{', '.join(f'{k}={v}' for k, v in results.items())}"
+            "[SEC] Scraping complete. Results by filing type: %s",
+            ", ".join(f"{k}={v}" for k, v in results.items()),
         )
         return dict(results)
 
@@ -140,12 +141,12 @@ class SECFilingScraper(BaseScraper):
             try:
                 company = get_company_by_symbol(symbol)
                 if not company:
-                    logger.error(f"[SEC] Company not found for symbol {symbol}")
+                    logger.error("[SEC] Company not found for symbol %s", symbol)
                     continue
 
                 cik = company.get("cik")
                 if not cik:
-                    logger.error(f"[SEC] No CIK found for {symbol}")
+                    logger.error("[SEC] No CIK found for %s", symbol)
                     continue
 
                 # Pad CIK to 10 digits as required by SEC
@@ -158,24 +159,25 @@ class SECFilingScraper(BaseScraper):
                 async with session.get(url, headers=headers) as response:
                     if response.status == 404:
                         logger.error(
-                            f"[SEC] No filings found for {symbol} (CIK: {cik})"
+                            "[SEC] No filings found for %s (CIK: %s)", symbol, cik
                         )
                         continue
                     elif response.status == 403:
                         logger.error(
-                            f"[SEC] Access denied for {symbol} - check user agent"
+                            "[SEC] Access denied for %s - check user agent", symbol
                         )
                         continue
                     elif response.status != 200:
                         logger.error(
-                            f"[SEC] Error fetching filings for {symbol}: "
-                            f"{response.status}"
+                            "[SEC] Error fetching filings for %s: %s",
+                            symbol,
+                            response.status,
                         )
                         continue
 
                     data = await response.json()
                     if not data or not data.get("filings"):
-                        logger.error(f"[SEC] Empty or invalid response for {symbol}")
+                        logger.error("[SEC] Empty or invalid response for %s", symbol)
                         continue
 
                     # Process recent filings
@@ -231,7 +233,7 @@ class SECFilingScraper(BaseScraper):
                 await asyncio.sleep(1)
 
             except Exception as e:
-                logger.error(f"[SEC] Error processing {symbol}: {str(e)}")
+                logger.error("[SEC] Error processing %s: %s", symbol, e)
                 continue
 
         return dict(results)
@@ -265,8 +267,10 @@ class SECFilingScraper(BaseScraper):
             ) as response:
                 if response.status != 200:
                     logger.error(
-                        f"[SEC] Error fetching {form_type} {filing_url}: "
-                        f"{response.status}"
+                        "[SEC] Error fetching %s %s: %s",
+                        form_type,
+                        filing_url,
+                        response.status,
                     )
                     return form_type, False
 
@@ -295,13 +299,15 @@ class SECFilingScraper(BaseScraper):
 
                 self.processed_filings.add(filing_id)
                 logger.info(
-                    f"[SEC] Successfully processed {form_type} filing for "
-                    f"{company.get('name', '')} ({company.get('symbol', '')})"
+                    "[SEC] Successfully processed %s filing for %s (%s)",
+                    form_type,
+                    company.get("name", ""),
+                    company.get("symbol", ""),
                 )
                 return form_type, True
 
         except Exception as e:
-            logger.error(f"[SEC] Error scraping filing {filing_url}: {str(e)}")
+            logger.error("[SEC] Error scraping filing %s: %s", filing_url, e)
             return form_type, False
 
     async def close(self):
@@ -0,0 +1,14 @@
+from functools import lru_cache
+from typing import Optional
+
+from motor.motor_asyncio import AsyncIOMotorClient
+
+
+@lru_cache()
+def get_mongo_client(mongodb_uri: Optional[str]) -> AsyncIOMotorClient:
+    """Get the process-wide Motor client for a URI.
+
+    Every service talking to the same cluster shares one connection pool and one
+    set of server monitors instead of opening its own.
+    """
+    return AsyncIOMotorClient(mongodb_uri, maxPoolSize=50, compressors="zstd")
@@ -0,0 +1,20 @@
+from functools import lru_cache
+
+from openai import AsyncOpenAI
+
+
+@lru_cache(maxsize=1)
+def get_openai_client() -> AsyncOpenAI:
+    """Get the process-wide OpenAI client.
+
+    Callers share one HTTP connection pool, so keep-alive connections (and their
+    TLS sessions) are reused across calls instead of each client opening its own.
+    """
+    return AsyncOpenAI()
+
+
+async def close_openai_client() -> None:
+    """Close the shared client; the next get_openai_client() call makes a new one."""
+    if get_openai_client.cache_info().currsize:
+        await get_openai_client().close()
+        get_openai_client.cache_clear()
@@ -1,10 +1,12 @@
+import asyncio
 import logging
 from typing import Any, Dict, List, Optional
 
 import pymongo
 from app.models.database import QueryDocument, UserLearningProfileDocument
-from app.models.learning import LearningPath, TopicKnowledge, UserLearningProfile
+from app.models.learning import UserLearningProfile
 from app.models.query import Query
+from app.services.mongo import get_mongo_client
 from motor.motor_asyncio import AsyncIOMotorClient
 
 logging.basicConfig(level=logging.INFO)
@@ -12,32 +14,36 @@ logger = logging.getLogger(__name__)
 
 
 class DatabaseClient:
-    def __init__(self, mongo_uri: str, db_name: str = "query_suggestions"):
-        self.client = AsyncIOMotorClient(mongo_uri)
+    def __init__(
+        self,
+        mongo_uri: Optional[str] = None,
+        db_name: str = "query_suggestions",
+        client: Optional[AsyncIOMotorClient] = None,
+    ):
+        self.client = client or get_mongo_client(mongo_uri)
         self.db = self.client[db_name]
 
     async def init_indexes(self):
-        """Initialize database indexes."""
-
-        # Queries collection
-        await self.db.queries.create_index(
-            [("user_id", pymongo.ASCENDING), ("timestamp", pymongo.DESCENDING)]
-        )
-        await self.db.queries.create_index(
-            [("user_id", pymongo.ASCENDING), ("text", pymongo.ASCENDING)]
-        )
-
-        # Learning profiles collection
-        await self.db.learning_profiles.create_index("user_id", unique=True)
-
-        # Topics collection
-        await self.db.topics.create_index(
-            [("user_id", pymongo.ASCENDING), ("topic", pymongo.ASCENDING)]
-        )
-
-        # Learning paths collection
-        await self.db.learning_paths.create_index(
-            [("user_id", pymongo.ASCENDING), ("created_at", pymongo.DESCENDING)]
+        """Initialize database indexes concurrently."""
+
+        await asyncio.gather(
+            # Queries collection
+            self.db.queries.create_index(
+                [("user_id", pymongo.ASCENDING), ("timestamp", pymongo.DESCENDING)]
+            ),
+            self.db.queries.create_index(
+                [("user_id", pymongo.ASCENDING), ("text", pymongo.ASCENDING)]
+            ),
+            # Learning profiles collection
+            self.db.learning_profiles.create_index("user_id", unique=True),
+            # Topics collection
+            self.db.topics.create_index(
+                [("user_id", pymongo.ASCENDING), ("topic", pymongo.ASCENDING)]
+            ),
+            # Learning paths collection
+            self.db.learning_paths.create_index(
+                [("user_id", pymongo.ASCENDING), ("created_at", pymongo.DESCENDING)]
+            ),
         )
 
     # Topic group methods
@@ -58,7 +64,7 @@ class DatabaseClient:
             result = await self.db.topic_groups.insert_one(group)
             return str(result.inserted_id)
         except Exception as e:
-            logger.error(f"Error storing topic group: {str(e)}")
+            logger.error("Error storing topic group: %s", e)
             raise
 
     async def update_topic_group(self, group: Dict[str, Any]):
@@ -71,7 +77,7 @@ class DatabaseClient:
                 upsert=True,
             )
         except Exception as e:
-            logger.error(f"Error updating topic group: {str(e)}")
+            logger.error("Error updating topic group: %s", e)
             raise
 
     # Query methods
@@ -128,17 +134,8 @@ class DatabaseClient:
         if not doc:
             return None
 
-        return UserLearningProfile(
-            user_id=doc["user_id"],
-            topic_knowledge={
-                topic: TopicKnowledge(**knowledge)
-                for topic, knowledge in doc["topic_knowledge"].items()
-            },
-            active_learning_paths=[
-                LearningPath(**path) for path in doc["active_learning_paths"]
-            ],
-            recent_interests=doc["recent_interests"],
-        )
+        # Validates the nested topic knowledge and paths in a single pass
+        return UserLearningProfile.model_validate(doc)
 
     async def update_learning_profile(
         self, user_id: str, profile: UserLearningProfile
@@ -147,28 +144,21 @@ class DatabaseClient:
 
         # Log the profile state before conversion
         logger.info(
-            f"Updating profile for {user_id} - "
-            f"paths: {len(profile.active_learning_paths)}, "
-            f"topics: {len(profile.topic_knowledge)}"
+            "Updating profile for %s - paths: %s, topics: %s",
+            user_id,
+            len(profile.active_learning_paths),
+            len(profile.topic_knowledge),
         )
 
-        doc = UserLearningProfileDocument(
-            user_id=profile.user_id,
-            topic_knowledge={
-                topic: knowledge.model_dump()
-                for topic, knowledge in profile.topic_knowledge.items()
-            },
-            active_learning_paths=[
-                path.model_dump() for path in profile.active_learning_paths
-            ],
-            recent_interests=profile.recent_interests,
-        )
+        # Read the nested models' attributes directly rather than dumping each
+        # one to a dict first
+        doc = UserLearningProfileDocument.model_validate(profile, from_attributes=True)
 
         # Log the document state after conversion
         logger.info(
-            "Converted to document - "
-            f"paths: {len(doc.active_learning_paths)}, "
-            f"topics: {len(doc.topic_knowledge)}"
+            "Converted to document - paths: %s, topics: %s",
+            len(doc.active_learning_paths),
+            len(doc.topic_knowledge),
         )
 
         await self.db.learning_profiles.update_one(
@@ -179,9 +169,9 @@ class DatabaseClient:
         updated_doc = await self.db.learning_profiles.find_one({"user_id": user_id})
         if updated_doc:
             logger.info(
-                "Verified update - "
-                f"paths: {len(updated_doc['active_learning_paths'])}, "
-                f"topics: {len(updated_doc['topic_knowledge'])}"
+                "Verified update - paths: %s, topics: %s",
+                len(updated_doc["active_learning_paths"]),
+                len(updated_doc["topic_knowledge"]),
             )
         else:
-            logger.error(f"Failed to verify update for user {user_id}")
+            logger.error("Failed to verify update for user %s", user_id)
@@ -95,11 +95,12 @@ class LearningService:
             current_path.knowledge_gaps = response.knowledge_gaps
             current_path.next_suggested_topics = response.next_topics
             logger.info(
-                f"Updated learning path with {len(current_path.knowledge_gaps)} gaps "
-                f"and {len(current_path.next_suggested_topics)} next topics"
+                "Updated learning path with %s gaps and %s next topics",
+                len(current_path.knowledge_gaps),
+                len(current_path.next_suggested_topics),
             )
         except Exception as e:
-            logger.error(f"Error updating learning path: {str(e)}")
+            logger.error("Error updating learning path: %s", e)
             pass
 
     async def update_profile_with_query(
@@ -122,14 +123,16 @@ class LearningService:
                     break
 
             if not extracted_topic:
-                logger.warning(f"Could not extract topic from query: {current_query}")
+                logger.warning("Could not extract topic from query: %s", current_query)
                 return profile
 
         canonical_topic = await self.topic_consolidation.consolidate_topic(
             extracted_topic
         )
         logger.info(
-            f"Working with topic: {extracted_topic}, canonical form: {canonical_topic}"
+            "Working with topic: %s, canonical form: %s",
+            extracted_topic,
+            canonical_topic,
         )
 
         # Get recent queries only related to this topic
@@ -142,8 +145,9 @@ class LearningService:
         relevant_queries.append(current_query)  # Include current query
 
         logger.info(
-            f"Found {len(relevant_queries)} relevant queries for topic "
-            f"{canonical_topic}"
+            "Found %s relevant queries for topic %s",
+            len(relevant_queries),
+            canonical_topic,
         )
 
         # Get current knowledge state
@@ -158,8 +162,9 @@ class LearningService:
             )
 
             logger.info(
-                f"Assessed knowledge for {canonical_topic}: "
-                f"{len(topic_knowledge_response.known_concepts)} concepts"
+                "Assessed knowledge for %s: %s concepts",
+                canonical_topic,
+                len(topic_knowledge_response.known_concepts),
             )
 
             # Create new TopicKnowledge instance
@@ -172,7 +177,7 @@ class LearningService:
             profile.topic_knowledge[canonical_topic] = topic_knowledge
 
         except Exception as e:
-            logger.error(f"Error assessing topic knowledge: {str(e)}")
+            logger.error("Error assessing topic knowledge: %s", e)
             topic_knowledge = TopicKnowledge(topic=canonical_topic, known_concepts=[])
             profile.topic_knowledge[canonical_topic] = topic_knowledge
 
@@ -192,7 +197,7 @@ class LearningService:
             )
             profile.active_learning_paths.append(current_path)
 
-            logger.info(f"Created new learning path for topic: {canonical_topic}")
+            logger.info("Created new learning path for topic: %s", canonical_topic)
 
         # Update the path
         if canonical_topic not in current_path.topics:
@@ -212,8 +217,9 @@ class LearningService:
         # Store updated profile
         await self.db.update_learning_profile(user_id, profile)
         logger.info(
-            f"Updated profile - paths: {len(profile.active_learning_paths)}, "
-            f"topics: {len(profile.topic_knowledge)}"
+            "Updated profile - paths: %s, topics: %s",
+            len(profile.active_learning_paths),
+            len(profile.topic_knowledge),
         )
 
         return profile
@@ -269,7 +275,7 @@ class LearningService:
 
             return response.topic
         except Exception as e:
-            logger.error(f"Error extracting topic: {str(e)}")
+            logger.error("Error extracting topic: %s", e)
             return None
 
     async def _is_related_topic(self, query: str, topic: str) -> bool:
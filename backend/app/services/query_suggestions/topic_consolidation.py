@@ -32,7 +32,7 @@ class TopicConsolidationService:
         if not self.initialized:
             self.topic_groups = {}
             stored_groups = await self.db.get_topic_groups()
-            logger.info(f"Loading {len(stored_groups)} topic groups from database")
+            logger.info("Loading %s topic groups from database", len(stored_groups))
 
             for group_data in stored_groups:
                 try:
@@ -52,11 +52,12 @@ class TopicConsolidationService:
                     if canonical_topic:  # Only add if we have a valid topic
                         self.topic_groups[canonical_topic] = group
                         logger.debug(
-                            f"Loaded topic group: {group.canonical_topic} with "
-                            f"{len(group.variations)} variations"
+                            "Loaded topic group: %s with %s variations",
+                            group.canonical_topic,
+                            len(group.variations),
                         )
                 except Exception as e:
-                    logger.error(f"Error loading topic group: {str(e)}")
+                    logger.error("Error loading topic group: %s", e)
                     continue
 
             self.initialized = True
@@ -69,7 +70,7 @@ class TopicConsolidationService:
         if not self.initialized:
             await self.initialize()
 
-        logger.debug(f"Consolidating topic for query: {new_topic}")
+        logger.debug("Consolidating topic for query: %s", new_topic)
 
         # First check if we have this exact topic (case insensitive)
         for canonical, group in self.topic_groups.items():
@@ -120,21 +121,21 @@ class TopicConsolidationService:
                 )
                 self.topic_groups[selected_topic] = group
                 await self._store_group(group)
-                logger.info(f"Created new topic: {selected_topic}")
+                logger.info("Created new topic: %s", selected_topic)
             else:
                 # Add to existing group
                 group = self.topic_groups[selected_topic]
                 group.variations.add(new_topic)
                 group.last_updated = datetime.now()
                 await self._update_group(group)
-                logger.info(f"Added to existing topic: {selected_topic}")
+                logger.info("Added to existing topic: %s", selected_topic)
 
             return selected_topic
 
         except Exception as e:
-            logger.error(f"Error consolidating topic: {str(e)}")
+            logger.error("Error consolidating topic: %s", e)
             # Fallback to using the topic as is
-            logger.warning(f"Using fallback topic: {new_topic}")
+            logger.warning("Using fallback topic: %s", new_topic)
             # Create a new group for the fallback
             group = TopicGroup(
                 canonical_topic=new_topic,
@@ -155,7 +156,7 @@ class TopicConsolidationService:
         try:
             await self.db.store_topic_group(doc)
         except Exception as e:
-            logger.error(f"Error storing topic group: {str(e)}")
+            logger.error("Error storing topic group: %s", e)
 
     async def _update_group(self, group: TopicGroup):
         """Update existing topic group in database."""
@@ -168,4 +169,4 @@ class TopicConsolidationService:
                 }
             )
         except Exception as e:
-            logger.error(f"Error updating topic group: {str(e)}")
+            logger.error("Error updating topic group: %s", e)
@@ -3,7 +3,7 @@ from datetime import datetime
 from typing import List, Optional
 
 from app.models.recommendations.content import ProcessedContent
-from motor.motor_asyncio import AsyncIOMotorClient
+from app.services.mongo import get_mongo_client
 
 logger = logging.getLogger(__name__)
 
@@ -12,7 +12,7 @@ class ContentCache:
     """Cache for processed content."""
 
     def __init__(self, mongodb_uri: str, database: str = "content_cache"):
-        self.client = AsyncIOMotorClient(mongodb_uri)
+        self.client = get_mongo_client(mongodb_uri)
         self.db = self.client[database]
 
         # Ensure indexes
@@ -43,7 +43,7 @@ class ContentCache:
             return [ProcessedContent.model_validate(doc) for doc in cached]
 
         except Exception as e:
-            logger.error(f"Error retrieving from cache: {str(e)}")
+            logger.error("Error retrieving from cache: %s", e)
             return []
 
     async def store_content(self, content: List[ProcessedContent]):
@@ -69,11 +69,11 @@ class ContentCache:
                     {"url": item.url}, {"$set": content_dict}, upsert=True
                 )
 
-            logger.info(f"Cached {len(content)} items successfully")
+            logger.info("Cached %s items successfully", len(content))
 
         except Exception as e:
-            logger.error(f"Error caching content: {str(e)}")
-            logger.error(f"Content dict: {content_dict}")  # Log the problematic data
+            logger.error("Error caching content: %s", e)
+            logger.error("Content dict: %s", content_dict)  # Log the problematic data
             raise
 
     async def get_by_id(self, content_id: str) -> Optional[ProcessedContent]:
@@ -83,13 +83,13 @@ class ContentCache:
             return ProcessedContent.model_validate(doc) if doc else None
 
         except Exception as e:
-            logger.error(f"Error getting content by ID: {str(e)}")
+            logger.error("Error getting content by ID: %s", e)
             return None
 
     async def clear_all(self):
         """Clear all cached content."""
         try:
             result = await self.db.processed_content.delete_many({})
-            logger.info(f"Cleared {result.deleted_count} items from cache")
+            logger.info("Cleared %s items from cache", result.deleted_count)
         except Exception as e:
-            logger.error(f"Error clearing cache: {str(e)}")
+            logger.error("Error clearing cache: %s", e)
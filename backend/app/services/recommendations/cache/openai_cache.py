@@ -4,7 +4,7 @@ import logging
 from datetime import datetime
 from typing import Any, Dict, List, Optional
 
-from motor.motor_asyncio import AsyncIOMotorClient
+from app.services.mongo import get_mongo_client
 from pydantic import BaseModel
 
 logger = logging.getLogger(__name__)
@@ -27,7 +27,7 @@ class OpenAICache:
     """Persistent cache for OpenAI API calls and processed results."""
 
     def __init__(self, mongodb_uri: str, database: str = "openai_cache"):
-        self.client = AsyncIOMotorClient(mongodb_uri)
+        self.client = get_mongo_client(mongodb_uri)
         self.db = self.client[database]
 
         # Ensure indexes
@@ -67,14 +67,14 @@ class OpenAICache:
             record = await self.db.calls.find_one({"call_id": call_id})
 
             if record:
-                logger.info(f"Cache hit for call_id: {call_id}")
+                logger.info("Cache hit for call_id: %s", call_id)
                 return record["response"]
 
-            logger.info(f"Cache miss for call_id: {call_id}")
+            logger.info("Cache miss for call_id: %s", call_id)
             return None
 
         except Exception as e:
-            logger.error(f"Error retrieving from cache: {str(e)}")
+            logger.error("Error retrieving from cache: %s", e)
             return None
 
     async def store_call(
@@ -107,13 +107,14 @@ class OpenAICache:
             )
 
             logger.info(
-                f"Stored call {call_id} - "
-                f"Duration: {duration_ms}ms, "
-                f"Error: {'Yes' if error else 'No'}"
+                "Stored call %s - Duration: %sms, Error: %s",
+                call_id,
+                duration_ms,
+                "Yes" if error else "No",
             )
 
         except Exception as e:
-            logger.error(f"Error storing call: {str(e)}")
+            logger.error("Error storing call: %s", e)
             raise
 
     async def get_cached_embedding(
@@ -127,14 +128,14 @@ class OpenAICache:
             )
 
             if record:
-                logger.info(f"Cache hit for embedding hash: {content_hash[:8]}")
+                logger.info("Cache hit for embedding hash: %s", content_hash[:8])
                 return record["embedding"]
 
-            logger.info(f"Cache miss for embedding hash: {content_hash[:8]}")
+            logger.info("Cache miss for embedding hash: %s", content_hash[:8])
             return None
 
         except Exception as e:
-            logger.error(f"Error retrieving embedding from cache: {str(e)}")
+            logger.error("Error retrieving embedding from cache: %s", e)
             return None
 
     async def store_embedding(
@@ -165,13 +166,14 @@ class OpenAICache:
             )
 
             logger.info(
-                f"Stored embedding {content_hash[:8]} - "
-                f"Duration: {duration_ms}ms, "
-                f"Error: {'Yes' if error else 'No'}"
+                "Stored embedding %s - Duration: %sms, Error: %s",
+                content_hash[:8],
+                duration_ms,
+                "Yes" if error else "No",
             )
 
         except Exception as e:
-            logger.error(f"Error storing embedding: {str(e)}")
+            logger.error("Error storing embedding: %s", e)
             raise
 
     async def get_stats(
@@ -217,7 +219,7 @@ class OpenAICache:
             }
 
         except Exception as e:
-            logger.error(f"Error getting stats: {str(e)}")
+            logger.error("Error getting stats: %s", e)
             return {}
 
     async def clear_all(self) -> None:
@@ -226,5 +228,5 @@ class OpenAICache:
             await self.db.calls.delete_many({})
             logger.info("Cleared all cached OpenAI calls")
         except Exception as e:
-            logger.error(f"Error clearing cache: {str(e)}")
+            logger.error("Error clearing cache: %s", e)
             raise
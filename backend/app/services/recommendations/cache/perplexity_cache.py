@@ -4,7 +4,7 @@ import logging
 from datetime import datetime
 from typing import Any, Dict, List, Optional
 
-from motor.motor_asyncio import AsyncIOMotorClient
+from app.services.mongo import get_mongo_client
 from pydantic import BaseModel
 
 logger = logging.getLogger(__name__)
@@ -27,7 +27,7 @@ class PerplexityCache:
     """Cache for Perplexity API calls."""
 
     def __init__(self, mongodb_uri: str, database: str = "perplexity_cache"):
-        self.client = AsyncIOMotorClient(mongodb_uri)
+        self.client = get_mongo_client(mongodb_uri)
         self.db = self.client[database]
 
         # Ensure indexes
@@ -61,14 +61,14 @@ class PerplexityCache:
             record = await self.db.calls.find_one({"call_id": call_id})
 
             if record:
-                logger.info(f"Cache hit for call_id: {call_id}")
+                logger.info("Cache hit for call_id: %s", call_id)
                 return record["response"]
 
-            logger.info(f"Cache miss for call_id: {call_id}")
+            logger.info("Cache miss for call_id: %s", call_id)
             return None
 
         except Exception as e:
-            logger.error(f"Error retrieving from cache: {str(e)}")
+            logger.error("Error retrieving from cache: %s", e)
             return None
 
     async def store_call(
@@ -103,13 +103,14 @@ class PerplexityCache:
             )
 
             logger.info(
-                f"Stored call {call_id} - "
-                f"Duration: {duration_ms}ms, "
-                f"Error: {'Yes' if error else 'No'}"
+                "Stored call %s - Duration: %sms, Error: %s",
+                call_id,
+                duration_ms,
+                "Yes" if error else "No",
             )
 
         except Exception as e:
-            logger.error(f"Error storing call: {str(e)}")
+            logger.error("Error storing call: %s", e)
             raise
 
     async def clear_all(self):
@@ -118,5 +119,5 @@ class PerplexityCache:
             await self.db.calls.delete_many({})
             logger.info("Cleared all cached Perplexity calls")
         except Exception as e:
-            logger.error(f"Error clearing cache: {str(e)}")
+            logger.error("Error clearing cache: %s", e)
             raise
@@ -54,7 +54,7 @@ class ContentDiscovery:
             return await self._process_content(list(discovered_urls))
 
         except Exception as e:
-            logger.error(f"Error executing search strategy: {str(e)}")
+            logger.error("Error executing search strategy: %s", e)
             return []
 
     async def _get_search_urls(self, queries: List[str]) -> set[str]:
@@ -74,11 +74,11 @@ class ContentDiscovery:
             if not discovered_urls:
                 logger.warning("No URLs found for any search query")
 
-            logger.info(f"Discovered {len(discovered_urls)} URLs")
+            logger.info("Discovered %s URLs", len(discovered_urls))
             return discovered_urls
 
         except Exception as e:
-            logger.error(f"Error getting search URLs: {str(e)}")
+            logger.error("Error getting search URLs: %s", e)
             return set()
 
     @retry(
@@ -94,11 +94,11 @@ class ContentDiscovery:
                 # Skip videos (YouTube)
                 urls = [url for url in urls if "youtube.com" not in url]
 
-                logger.info(f"Found {len(urls)} sources for '{query}'")
+                logger.info("Found %s sources for '%s'", len(urls), query)
                 return urls
 
         except Exception as e:
-            logger.error(f"Error executing search for '{query}': {str(e)}")
+            logger.error("Error executing search for '%s': %s", query, e)
             return []
 
     async def _process_content(self, urls: List[str]) -> List[ProcessedContent]:
@@ -127,7 +127,7 @@ class ContentDiscovery:
             return [*cached_content, *new_content]
 
         except Exception as e:
-            logger.error(f"Error processing content: {str(e)}")
+            logger.error("Error processing content: %s", e)
             return cached_content if "cached_content" in locals() else []
 
     async def _process_batch(self, urls: List[str]) -> List[ProcessedContent]:
@@ -138,7 +138,7 @@ class ContentDiscovery:
             return [r for r in results if r is not None]
 
         except Exception as e:
-            logger.error(f"Error processing batch: {str(e)}")
+            logger.error("Error processing batch: %s", e)
             return []
 
     async def _process_url(self, url: str) -> Optional[ProcessedContent]:
@@ -148,7 +148,9 @@ class ContentDiscovery:
                 async with aiohttp.ClientSession() as session:
                     async with session.get(url, timeout=self.timeout) as response:
                         if response.status != 200:
-                            logger.warning(f"Failed to fetch {url}: {response.status}")
+                            logger.warning(
+                                "Failed to fetch %s: %s", url, response.status
+                            )
                             return None
 
                         html = await response.text()
@@ -159,10 +161,10 @@ class ContentDiscovery:
                         )
 
         except asyncio.TimeoutError:
-            logger.warning(f"Timeout fetching {url}")
+            logger.warning("Timeout fetching %s", url)
             return None
         except Exception as e:
-            logger.error(f"Error processing {url}: {str(e)}")
+            logger.error("Error processing %s: %s", url, e)
             return None
 
     def _generate_content_id(self, url: str) -> str:
@@ -69,8 +69,9 @@ class ContentFilterer:
 
                 if evaluation.is_valuable:
                     logger.info(
-                        f"Found valuable content {content.content_id} "
-                        f"(score: {evaluation.value_score})"
+                        "Found valuable content %s (score: %s)",
+                        content.content_id,
+                        evaluation.value_score,
                     )
 
                     valuable_content.append(
@@ -90,8 +91,9 @@ class ContentFilterer:
                     )
                 else:
                     logger.info(
-                        f"Content {content.content_id} not considered valuable. "
-                        f"Reason: {evaluation.explanation}"
+                        "Content %s not considered valuable. Reason: %s",
+                        content.content_id,
+                        evaluation.explanation,
                     )
 
             # Sort by value score
@@ -103,7 +105,7 @@ class ContentFilterer:
             )
 
         except Exception as e:
-            logger.error(f"Error filtering content: {str(e)}")
+            logger.error("Error filtering content: %s", e)
             raise
 
     async def _evaluate_content(
@@ -173,7 +175,7 @@ class ContentFilterer:
             return response.choices[0].message.parsed
 
         except Exception as e:
-            logger.error(f"Error evaluating content: {str(e)}")
+            logger.error("Error evaluating content: %s", e)
             raise
 
     def _format_knowledge_state(self, knowledge_state: KnowledgeState) -> str:
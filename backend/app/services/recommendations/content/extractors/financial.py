@@ -32,13 +32,13 @@ class FinancialContentExtractor:
         """Extract financial insights from content."""
         try:
             # Get clean text and basic metadata
-            logger.info(f"Extracting content from {url}")
+            logger.info("Extracting content from %s", url)
             clean_text, metadata = await self._prepare_content(html, url)
             if not clean_text:
                 return None
 
             # Extract all insights in single call
-            logger.info(f"Analyzing content from {url}")
+            logger.info("Analyzing content from %s", url)
             analysis = await self._analyze_content(clean_text)
 
             return ProcessedContent(
@@ -52,7 +52,7 @@ class FinancialContentExtractor:
             )
 
         except Exception as e:
-            logger.error(f"Error extracting content from {url}: {str(e)}")
+            logger.error("Error extracting content from %s: %s", url, e)
             return None
 
     async def _prepare_content(
@@ -83,7 +83,7 @@ class FinancialContentExtractor:
             return clean_text, metadata
 
         except Exception as e:
-            logger.error(f"Error preparing content: {str(e)}")
+            logger.error("Error preparing content: %s", e)
             raise e
 
     async def _analyze_content(self, text: str) -> ContentAnalysisResponse:
@@ -134,5 +134,5 @@ class FinancialContentExtractor:
             return response.choices[0].message.parsed
 
         except Exception as e:
-            logger.error(f"Error analyzing content: {str(e)}")
+            logger.error("Error analyzing content: %s", e)
             raise e
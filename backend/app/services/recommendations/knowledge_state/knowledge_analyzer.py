@@ -114,7 +114,7 @@ class KnowledgeAnalyzer:
             return state
 
         except Exception as e:
-            logger.error(f"Error analyzing knowledge state: {str(e)}")
+            logger.error("Error analyzing knowledge state: %s", e)
             raise
 
     async def _extract_response_concepts(self, response: str) -> List[str]:
@@ -164,7 +164,7 @@ class KnowledgeAnalyzer:
             return concepts
 
         except Exception as e:
-            logger.error(f"Error extracting response concepts: {str(e)}")
+            logger.error("Error extracting response concepts: %s", e)
             return []
 
     def _format_interactions(self, interactions: List[Dict]) -> str:
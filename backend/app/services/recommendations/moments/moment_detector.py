@@ -86,17 +86,18 @@ class MomentDetector:
 
             if detection.is_moment:
                 logger.info(
-                    f"Detected {detection.moment_type} moment. "
-                    f"Confidence: {detection.confidence}. "
-                    f"Reasoning: {detection.reasoning}"
+                    "Detected %s moment. Confidence: %s. Reasoning: %s",
+                    detection.moment_type,
+                    detection.confidence,
+                    detection.reasoning,
                 )
                 return detection.moment_type
 
-            logger.info(f"No learning moment detected for query '{query}'")
+            logger.info("No learning moment detected for query '%s'", query)
             return None
 
         except Exception as e:
-            logger.error(f"Error detecting moment: {str(e)}")
+            logger.error("Error detecting moment: %s", e)
             raise
 
     def _format_topic_knowledge(self, topic: TopicKnowledge) -> str:
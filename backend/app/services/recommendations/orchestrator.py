@@ -1,5 +1,5 @@
 import logging
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional
 
 from app.models.recommendations.content_filtering import ContentValue
@@ -7,6 +7,7 @@ from app.models.recommendations.interactions import ContentInteraction
 from app.models.recommendations.knowledge_state import KnowledgeState
 from app.models.recommendations.moments import LearningMoment
 from app.models.recommendations.query_lines import LineAnalysis, QueryLine
+from app.services.mongo import get_mongo_client
 from app.services.recommendations.cache.content_cache import ContentCache
 from app.services.recommendations.content.content_discovery import ContentDiscovery
 from app.services.recommendations.content.content_filterer import ContentFilterer
@@ -15,13 +16,13 @@ from app.services.recommendations.knowledge_state.knowledge_analyzer import (
 )
 from app.services.recommendations.moments.moment_detector import MomentDetector
 from app.services.recommendations.perplexity.client import PerplexityClient
+from app.services.recommendations.progress import BatchingSender
 from app.services.recommendations.query_lines.grouper import QueryLineGrouper
 from app.services.recommendations.query_lines.line_manager import QueryLineManager
 from app.services.recommendations.strategy.strategy_generator import StrategyGenerator
 from app.services.recommendations.tracking.interaction_processor import (
     InteractionProcessor,
 )
-from fastapi import WebSocket
 from motor.motor_asyncio import AsyncIOMotorClient
 from pydantic import BaseModel, Field
 from app.models.page_rendering import ProcessStep
@@ -58,9 +59,12 @@ class RecommendationOrchestrator:
         perplexity_api_key: str,
         model: str = "gpt-4o-mini",
         max_attempts: int = 3,
+        mongo_client: Optional[AsyncIOMotorClient] = None,
     ):
-        # Initialize MongoDB
-        self.db = AsyncIOMotorClient(mongodb_uri).recommendations
+        # Initialize MongoDB; services built from the URI below share the same
+        # cached client
+        self.mongo_client = mongo_client or get_mongo_client(mongodb_uri)
+        self.db = self.mongo_client.recommendations
 
         # Initialize services
         self.perplexity_client = PerplexityClient(perplexity_api_key, mongodb_uri)
@@ -82,22 +86,24 @@ class RecommendationOrchestrator:
         # Configuration
         self.max_attempts = max_attempts
 
-    async def get_initial_response(self, user_id: str, query: str) -> InitialResponse:
+    async def get_initial_response(
+        self, user_id: str, query: str, at: Optional[datetime] = None
+    ) -> InitialResponse:
         """Get initial Perplexity response and process query line."""
         try:
             # First determine query line
             query_line, line_analysis = (
                 await self.query_line_manager.get_or_update_line(
-                    user_id=user_id, query=query
+                    user_id=user_id, query=query, at=at
                 )
             )
-            logger.info(f"Processed query into line: {query_line.line_topic}")
-            logger.info(f"Line analysis: {line_analysis}")
+            logger.info("Processed query into line: %s", query_line.line_topic)
+            logger.info("Line analysis: %s", line_analysis)
 
             # Get Perplexity response and update line
             perplexity_response, _, updated_line = (
                 await self.perplexity_client.get_response(
-                    query=query, query_line=query_line
+                    query=query, query_line=query_line, at=at
                 )
             )
 
@@ -111,7 +117,7 @@ class RecommendationOrchestrator:
             )
 
         except Exception as e:
-            logger.error(f"Error getting initial response: {str(e)}")
+            logger.error("Error getting initial response: %s", e)
             raise
 
     async def get_recommendations(
@@ -126,7 +132,7 @@ class RecommendationOrchestrator:
             related_lines = await self.query_line_grouper.get_related_lines(
                 current_line=initial_response.query_line, all_lines=all_lines
             )
-            logger.info(f"Found {len(related_lines)} related query lines")
+            logger.info("Found %s related query lines", len(related_lines))
 
             # Analyze knowledge state across related lines
             knowledge_state = await self.knowledge_analyzer.analyze_knowledge(
@@ -150,8 +156,8 @@ class RecommendationOrchestrator:
 
             if not moment:
                 logger.info(
-                    "No learning moment detected for query: "
-                    f"{initial_response.query_line.queries[-1]}"
+                    "No learning moment detected for query: %s",
+                    initial_response.query_line.queries[-1],
                 )
                 return RecommendationResult(
                     perplexity_response=initial_response.perplexity_response,
@@ -171,15 +177,16 @@ class RecommendationOrchestrator:
             attempt = 0
             while strategy and attempt < self.max_attempts:
                 logger.info(
-                    f"Attempt {attempt + 1} for query: "
-                    f"{initial_response.query_line.queries[-1]}"
+                    "Attempt %s for query: %s",
+                    attempt + 1,
+                    initial_response.query_line.queries[-1],
                 )
 
                 # Find content
                 content = await self.content_discovery.execute_search(strategy)
 
                 # Filter content using knowledge state
-                logger.info(f"Filtering {len(content)} candidates")
+                logger.info("Filtering %s candidates", len(content))
                 filtered = await self.content_filter.filter_content(
                     candidates=content,
                     moment=moment,
@@ -225,7 +232,7 @@ class RecommendationOrchestrator:
 
                 attempt += 1
 
-            logger.info(f"Failed to find valuable content after {attempt} attempts")
+            logger.info("Failed to find valuable content after %s attempts", attempt)
             return RecommendationResult(
                 perplexity_response=initial_response.perplexity_response,
                 moment=moment,
@@ -233,17 +240,25 @@ class RecommendationOrchestrator:
             )
 
         except Exception as e:
-            logger.error(f"Error getting recommendations: {str(e)}")
+            logger.error("Error getting recommendations: %s", e)
             raise
 
     async def process_with_progress(
-        self, user_id: str, query: str, websocket: WebSocket
+        self,
+        user_id: str,
+        query: str,
+        websocket: BatchingSender,
+        at: Optional[datetime] = None,
     ) -> Dict[str, Any]:
-        """Process query and send progress updates via WebSocket."""
+        """Process query and send progress updates via WebSocket.
+
+        Everything recorded for the request is stamped with `at` (default: now).
+        """
+        at = at or datetime.now(timezone.utc)
         try:
             # Getting initial response
             await websocket.send_json({"step": ProcessStep.INITIAL})
-            initial_response = await self.get_initial_response(user_id, query)
+            initial_response = await self.get_initial_response(user_id, query, at=at)
 
             # Analyzing lines
             await websocket.send_json({"step": ProcessStep.ANALYZING})
@@ -314,6 +329,7 @@ class RecommendationOrchestrator:
                             moment=moment,
                             line_analysis=initial_response.line_analysis,
                             knowledge_state=knowledge_state,
+                            at=at,
                         )
 
                         recommendations = filtered.valuable_content
@@ -354,7 +370,7 @@ class RecommendationOrchestrator:
             }
 
         except Exception as e:
-            logger.error(f"Error in recommendation process: {str(e)}")
+            logger.error("Error in recommendation process: %s", e)
             raise
 
     async def _store_recommendations(
@@ -365,6 +381,7 @@ class RecommendationOrchestrator:
         moment: LearningMoment,
         line_analysis: LineAnalysis,
         knowledge_state: KnowledgeState,
+        at: Optional[datetime] = None,
     ):
         """Store recommendations for analysis."""
         try:
@@ -375,11 +392,11 @@ class RecommendationOrchestrator:
                 "line_analysis": line_analysis.model_dump(),
                 "knowledge_state": knowledge_state.model_dump(),
                 "recommendations": [r.model_dump() for r in recommendations],
-                "timestamp": datetime.now(),
+                "timestamp": at or datetime.now(timezone.utc),
             }
             await self.db.recommendations.insert_one(doc)
         except Exception as e:
-            logger.error(f"Error storing recommendations: {str(e)}")
+            logger.error("Error storing recommendations: %s", e)
 
     async def track_interaction(self, user_id: str, interaction: ContentInteraction):
         """Track user interaction with recommended content."""
@@ -388,4 +405,8 @@ class RecommendationOrchestrator:
                 user_id=user_id, interaction=interaction
             )
         except Exception as e:
-            logger.error(f"Error tracking interaction: {str(e)}")
+            logger.error("Error tracking interaction: %s", e)
+
+    async def close(self):
+        """Flush pending writes before shutdown."""
+        await self.interaction_processor.close()
@@ -1,6 +1,6 @@
 import logging
 import time
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import List, Optional, Tuple
 
 import aiohttp
@@ -26,7 +26,10 @@ class PerplexityClient:
         self.cache = PerplexityCache(mongodb_uri)
 
     async def get_response(
-        self, query: str, query_line: Optional[QueryLine] = None
+        self,
+        query: str,
+        query_line: Optional[QueryLine] = None,
+        at: Optional[datetime] = None,
     ) -> Tuple[str, List[str], Optional[QueryLine]]:
         """
         Get response from Perplexity and optionally update query line.
@@ -34,6 +37,7 @@ class PerplexityClient:
         Args:
             query: The user's query
             query_line: QueryLine to update with response (if provided)
+            at: Timestamp recorded on the query line (defaults to now)
 
         Returns:
             Tuple of (response_text, updated_query_line)
@@ -112,19 +116,20 @@ class PerplexityClient:
                         )
 
                         logger.info(
-                            f"Got new Perplexity response with {len(citations)} "
-                            "citations"
+                            "Got new Perplexity response with %s citations",
+                            len(citations),
                         )
 
             # Update query line if provided
             if query_line is not None:
                 query_line.responses.append(answer)
-                query_line.timestamps.append(datetime.now())
-                query_line.last_updated = datetime.now()
-                logger.info(f"Updated query line {query_line.line_topic}")
+                now = at or datetime.now(timezone.utc)
+                query_line.timestamps.append(now)
+                query_line.last_updated = now
+                logger.info("Updated query line %s", query_line.line_topic)
 
             return answer, citations, query_line
 
         except Exception as e:
-            logger.error(f"Error getting Perplexity response: {str(e)}")
+            logger.error("Error getting Perplexity response: %s", e)
             raise
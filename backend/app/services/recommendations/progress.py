@@ -0,0 +1,74 @@
+import asyncio
+import logging
+import zlib
+from contextlib import suppress
+from typing import Any, Dict, List, Optional
+
+import orjson
+from fastapi import WebSocket
+
+logger = logging.getLogger(__name__)
+
+
+class BatchingSender:
+    """Coalesces WebSocket messages sent within a short window into one frame.
+
+    Frames larger than `compress_threshold` bytes are zlib-compressed and sent as
+    binary; smaller ones (progress updates) go out as plain text, where
+    compression would cost more than it saves.
+    """
+
+    def __init__(
+        self,
+        websocket: WebSocket,
+        batch_interval: float = 0.03,
+        compress_threshold: int = 1024,
+    ):
+        self.websocket = websocket
+        self.batch_interval = batch_interval
+        self.compress_threshold = compress_threshold
+
+        self._pending: List[Dict[str, Any]] = []
+        self._flush_task: Optional[asyncio.Task] = None
+        self._send_lock = asyncio.Lock()
+
+    async def send_json(self, message: Dict[str, Any]) -> None:
+        """Queue a message; it is sent with anything else queued in the window."""
+        self._pending.append(message)
+        if self._flush_task is None:
+            self._flush_task = asyncio.create_task(self._flush_after_interval())
+
+    async def flush(self) -> None:
+        """Send all queued messages immediately."""
+        task, self._flush_task = self._flush_task, None
+        if task is not None:
+            task.cancel()
+            with suppress(asyncio.CancelledError):
+                await task
+
+        await self._send_pending()
+
+    async def _flush_after_interval(self) -> None:
+        """Wait for the batch window to close, then send what was queued."""
+        await asyncio.sleep(self.batch_interval)
+        self._flush_task = None
+        try:
+            await self._send_pending()
+        except Exception as e:
+            logger.error("Error sending progress batch: %s", e)
+
+    async def _send_pending(self) -> None:
+        """Send queued messages as a single batch frame."""
+        async with self._send_lock:
+            if not self._pending:
+                return
+
+            batch, self._pending = self._pending, []
+
+            # orjson encodes the nested recommendation payloads far faster than
+            # the stdlib encoder behind WebSocket.send_json
+            payload = orjson.dumps({"batch": batch})
+            if len(payload) > self.compress_threshold:
+                await self.websocket.send_bytes(zlib.compress(payload))
+            else:
+                await self.websocket.send_text(payload.decode())
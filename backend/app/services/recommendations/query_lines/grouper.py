@@ -98,12 +98,13 @@ class QueryLineGrouper:
                 related_lines.append(current_line)
 
             logger.info(
-                f"Found {len(related_lines)} related lines for topic "
-                f"{current_line.line_topic}"
+                "Found %s related lines for topic %s",
+                len(related_lines),
+                current_line.line_topic,
             )
 
             return related_lines
 
         except Exception as e:
-            logger.error(f"Error grouping query lines: {str(e)}")
+            logger.error("Error grouping query lines: %s", e)
             return [current_line]
@@ -1,8 +1,8 @@
 import logging
 import time
 import uuid
-from datetime import datetime
-from typing import List, Tuple
+from datetime import datetime, timezone
+from typing import List, Optional, Tuple
 
 from app.models.recommendations.query_lines import (
     LineAnalysis,
@@ -11,8 +11,8 @@ from app.models.recommendations.query_lines import (
     QueryLineContext,
 )
 from app.prompts import PROMPTS
+from app.services.mongo import get_mongo_client
 from app.services.recommendations.cache.openai_cache import OpenAICache
-from motor.motor_asyncio import AsyncIOMotorClient
 from openai import AsyncOpenAI
 
 logger = logging.getLogger(__name__)
@@ -23,7 +23,7 @@ class QueryLineManager:
 
     def __init__(self, mongodb_uri: str, model: str = "gpt-4o"):
         """Initialize with database and LLM configuration."""
-        self.client = AsyncIOMotorClient(mongodb_uri)
+        self.client = get_mongo_client(mongodb_uri)
         self.db = self.client.recommendations
         self.llm_client = AsyncOpenAI()
         self.model = model
@@ -39,9 +39,14 @@ class QueryLineManager:
         self.db.query_lines.create_index([("user_id", 1), ("line_topic", 1)])
 
     async def get_or_update_line(
-        self, user_id: str, query: str
+        self, user_id: str, query: str, at: Optional[datetime] = None
     ) -> Tuple[QueryLine, LineAnalysis]:
-        """Get existing line or create new one, then analyze it."""
+        """Get existing line or create new one, then analyze it.
+
+        `at` is the request timestamp; it defaults to now.
+        """
+        now = at or datetime.now(timezone.utc)
+
         # Get existing lines for user
         existing_lines = await self._get_user_lines(user_id, limit=100)
 
@@ -53,18 +58,18 @@ class QueryLineManager:
             line = existing_lines[line_context.line_index]
             original_topic = line.line_topic  # Store original topic
             line.queries.append(query)
-            line.timestamps.append(datetime.now())
-            line.last_updated = datetime.now()
+            line.timestamps.append(now)
+            line.last_updated = now
             await self._update_line(line, original_topic)
         else:
             line = QueryLine(
                 user_id=user_id,
                 line_id=str(uuid.uuid4()),  # Generate UUID for new lines
                 queries=[query],
-                timestamps=[datetime.now()],
+                timestamps=[now],
                 responses=[],
                 line_topic=query,  # Initial topic, will be refined
-                last_updated=datetime.now(),
+                last_updated=now,
             )
             await self._store_line(line)
             logger.info("Created new query line")
@@ -78,7 +83,7 @@ class QueryLineManager:
             line.line_topic = refined_topic
             await self._update_line(line, original_topic)
             logger.info(
-                f"Updated line topic from '{original_topic}' to '{refined_topic}'"
+                "Updated line topic from '%s' to '%s'", original_topic, refined_topic
             )
 
         return line, analysis
@@ -142,7 +147,7 @@ class QueryLineManager:
             return result
 
         except Exception as e:
-            logger.error(f"Error detecting line context: {e}")
+            logger.error("Error detecting line context: %s", e)
             raise
 
     async def analyze_line(self, line: QueryLine) -> Tuple[LineAnalysis, str]:
@@ -197,7 +202,7 @@ class QueryLineManager:
             return result.analysis, result.refined_topic
 
         except Exception as e:
-            logger.error(f"Error analyzing line: {e}")
+            logger.error("Error analyzing line: %s", e)
             raise
 
     async def _get_user_lines(self, user_id: str, limit: int = 5) -> List[QueryLine]:
@@ -212,7 +217,7 @@ class QueryLineManager:
             try:
                 lines.append(QueryLine(**doc))
             except Exception as e:
-                logger.error(f"Error parsing query line: {e}")
+                logger.error("Error parsing query line: %s", e)
         return lines
 
     async def _store_line(self, line: QueryLine) -> None:
@@ -220,17 +225,19 @@ class QueryLineManager:
         try:
             await self.db.query_lines.insert_one(line.model_dump())
             logger.info(
-                f"Stored new line for user {line.user_id} with topic {line.line_topic}"
+                "Stored new line for user %s with topic %s",
+                line.user_id,
+                line.line_topic,
             )
         except Exception as e:
-            logger.error(f"Error storing line: {e}")
+            logger.error("Error storing line: %s", e)
             raise
 
     async def _update_line(self, line: QueryLine, original_topic: str = None) -> None:
         """Update an existing query line."""
         try:
             # Add debug logging
-            logger.info(f"Updating line with topic {line.line_topic}...")
+            logger.info("Updating line with topic %s...", line.line_topic)
 
             # Use user_id and line_id for updates, not topic
             query = {"user_id": line.user_id}
@@ -243,11 +250,11 @@ class QueryLineManager:
             result = await self.db.query_lines.replace_one(query, line.model_dump())
 
             if result.matched_count == 0:
-                logger.error(f"No line found to update for user {line.user_id}")
+                logger.error("No line found to update for user %s", line.user_id)
             else:
                 logger.info(
-                    f"Updated line for user {line.user_id} topic {line.line_topic}"
+                    "Updated line for user %s topic %s", line.user_id, line.line_topic
                 )
         except Exception as e:
-            logger.error(f"Error updating line: {e}")
+            logger.error("Error updating line: %s", e)
             raise
@@ -118,7 +118,7 @@ class StrategyGenerator:
             return result
 
         except Exception as e:
-            logger.error(f"Error generating strategy: {str(e)}")
+            logger.error("Error generating strategy: %s", e)
             raise
 
     def _format_current_knowledge(self, knowledge_state: KnowledgeState) -> str:
@@ -280,7 +280,7 @@ class StrategyGenerator:
             return result
 
         except Exception as e:
-            logger.error(f"Error analyzing previous attempts: {str(e)}")
+            logger.error("Error analyzing previous attempts: %s", e)
             # Conservative fallback: keep successful queries, add original
             successful_queries = [
                 attempt.query
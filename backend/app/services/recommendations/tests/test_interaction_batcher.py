@@ -0,0 +1,82 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from app.models.recommendations.interactions import (
+    ContentInteraction,
+    InteractionType,
+    ReadStartData,
+)
+from app.services.recommendations.tracking.interaction_batcher import (
+    InteractionBatcher,
+)
+
+
+def _interaction(content_id: str) -> ContentInteraction:
+    return ContentInteraction(
+        content_id=content_id,
+        content_url=f"https://example.com/{content_id}",
+        interaction_type=InteractionType.read_start,
+        interaction_data=ReadStartData(section="introduction"),
+    )
+
+
+@pytest.mark.asyncio
+async def test_interactions_are_written_in_one_batch():
+    """Interactions submitted within the flush interval share one insert_many."""
+    collection = MagicMock()
+    collection.insert_many = AsyncMock()
+    batcher = InteractionBatcher(collection, flush_interval=0.01)
+
+    await batcher.submit("user_1", _interaction("a"))
+    await batcher.submit("user_1", _interaction("b"))
+    await asyncio.sleep(0.05)
+
+    collection.insert_many.assert_awaited_once()
+    docs = collection.insert_many.await_args.args[0]
+    assert [d["content_id"] for d in docs] == ["a", "b"]
+    assert all(d["user_id"] == "user_1" for d in docs)
+    assert collection.insert_many.await_args.kwargs == {"ordered": False}
+
+
+@pytest.mark.asyncio
+async def test_batches_respect_max_size_and_close_flushes():
+    """Full batches are written right away and close() writes the remainder."""
+    collection = MagicMock()
+    collection.insert_many = AsyncMock()
+    batcher = InteractionBatcher(collection, max_batch_size=2, flush_interval=10)
+
+    for content_id in ["a", "b", "c"]:
+        await batcher.submit("user_1", _interaction(content_id))
+    await batcher.close()
+
+    batches = [
+        [d["content_id"] for d in call.args[0]]
+        for call in collection.insert_many.await_args_list
+    ]
+    assert batches == [["a", "b"], ["c"]]
+
+
+@pytest.mark.asyncio
+async def test_submit_waits_while_the_queue_is_full():
+    """A stalled write blocks submit() once the bounded queue fills up."""
+    released = asyncio.Event()
+
+    async def stalled_insert(*args, **kwargs):
+        await released.wait()
+
+    collection = MagicMock()
+    collection.insert_many = AsyncMock(side_effect=stalled_insert)
+    batcher = InteractionBatcher(collection, max_batch_size=1, flush_interval=0)
+
+    # One interaction is taken into the stalled write, four fill the queue
+    for content_id in "abcde":
+        await batcher.submit("user_1", _interaction(content_id))
+    blocked = asyncio.create_task(batcher.submit("user_1", _interaction("f")))
+    await asyncio.sleep(0.01)
+    assert not blocked.done()
+
+    released.set()
+    await asyncio.wait_for(blocked, 1)
+    await batcher.close()
+    assert collection.insert_many.await_count == 6
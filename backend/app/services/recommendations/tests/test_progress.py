@@ -0,0 +1,58 @@
+import asyncio
+import zlib
+from unittest.mock import AsyncMock
+
+import orjson
+import pytest
+from app.services.recommendations.progress import BatchingSender
+
+
+@pytest.mark.asyncio
+async def test_messages_within_window_are_batched():
+    """Messages queued inside one window go out as a single frame."""
+    websocket = AsyncMock()
+    sender = BatchingSender(websocket, batch_interval=0.01)
+
+    await sender.send_json({"step": "initial"})
+    await sender.send_json({"step": "analyzing"})
+    await asyncio.sleep(0.05)
+
+    websocket.send_text.assert_awaited_once()
+    assert orjson.loads(websocket.send_text.await_args.args[0]) == {
+        "batch": [{"step": "initial"}, {"step": "analyzing"}]
+    }
+
+
+@pytest.mark.asyncio
+async def test_flush_sends_pending_immediately():
+    """Flushing sends queued messages without waiting for the window."""
+    websocket = AsyncMock()
+    sender = BatchingSender(websocket, batch_interval=10)
+
+    await sender.send_json({"step": "suggestions"})
+    await sender.send_json({"type": "complete", "data": {}})
+    await sender.flush()
+
+    websocket.send_text.assert_awaited_once()
+    assert orjson.loads(websocket.send_text.await_args.args[0]) == {
+        "batch": [{"step": "suggestions"}, {"type": "complete", "data": {}}]
+    }
+
+    # Nothing left to send
+    await sender.flush()
+    assert websocket.send_text.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_large_batches_are_compressed():
+    """Batches above the threshold go out as zlib-compressed binary frames."""
+    websocket = AsyncMock()
+    sender = BatchingSender(websocket, compress_threshold=64)
+
+    message = {"type": "complete", "data": {"summary": "x" * 1000}}
+    await sender.send_json(message)
+    await sender.flush()
+
+    websocket.send_text.assert_not_awaited()
+    payload = zlib.decompress(websocket.send_bytes.await_args.args[0])
+    assert orjson.loads(payload) == {"batch": [message]}
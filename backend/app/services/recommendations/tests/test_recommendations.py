@@ -1,6 +1,5 @@
 import asyncio
 import logging
-import os
 from typing import List
 
 import pytest
@@ -53,7 +52,7 @@ class TestHarness:
         settings = Settings()
         self.orchestrator = RecommendationOrchestrator(
             mongodb_uri=settings.mongodb_uri,
-            perplexity_api_key=os.getenv("PERPLEXITY_API_KEY"),
+            perplexity_api_key=settings.perplexity_api_key,
             model="gpt-4o",
             max_attempts=3,
         )
@@ -161,7 +160,7 @@ class TestHarness:
                     content_id=selected.content_id,
                     content_url=selected.url,
                     interaction_type=InteractionType.read_start,
-                    interaction_data={"section": "introduction"},
+                    interaction_data={"kind": "read_start", "section": "introduction"},
                     query_context=selected.relevance_context,
                 )
 
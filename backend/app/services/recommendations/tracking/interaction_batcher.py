@@ -0,0 +1,84 @@
+import asyncio
+import logging
+from typing import Any, Dict, List, Optional
+
+from app.models.recommendations.interactions import ContentInteraction
+
+logger = logging.getLogger(__name__)
+
+# Queued by close() to tell the worker to write what it has and stop
+_STOP = object()
+
+
+class InteractionBatcher:
+    """Buffer interactions in memory and write them to MongoDB in batches."""
+
+    def __init__(
+        self,
+        collection,
+        max_batch_size: int = 500,
+        flush_interval: float = 0.1,
+    ):
+        self.collection = collection
+        self.max_batch_size = max_batch_size
+        self.flush_interval = flush_interval
+
+        # Bounded so a slow or unavailable database pushes back on submit()
+        # instead of letting the queue grow without limit
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=4 * max_batch_size)
+        self._worker: Optional[asyncio.Task] = None
+
+    async def submit(self, user_id: str, interaction: ContentInteraction) -> None:
+        """Queue an interaction; it is written with the next batch.
+
+        Returns right away unless the queue is full, in which case it waits for
+        the worker to take a batch off it.
+        """
+        if self._worker is None:
+            self._worker = asyncio.create_task(self._run())
+
+        await self._queue.put({"user_id": user_id, **interaction.model_dump()})
+
+    async def close(self) -> None:
+        """Write everything still queued and stop the worker."""
+        if self._worker is None:
+            return
+
+        await self._queue.put(_STOP)
+        await self._worker
+        self._worker = None
+
+    async def _run(self) -> None:
+        """Collect up to max_batch_size docs or flush_interval seconds, then write."""
+        loop = asyncio.get_running_loop()
+        while True:
+            first = await self._queue.get()
+            if first is _STOP:
+                return
+
+            batch = [first]
+            stopping = False
+            deadline = loop.time() + self.flush_interval
+            while len(batch) < self.max_batch_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    doc = await asyncio.wait_for(self._queue.get(), timeout)
+                except asyncio.TimeoutError:
+                    break
+                if doc is _STOP:
+                    stopping = True
+                    break
+                batch.append(doc)
+
+            await self._write(batch)
+            if stopping:
+                return
+
+    async def _write(self, batch: List[Dict[str, Any]]) -> None:
+        """Insert a batch; unordered so one bad doc doesn't block the rest."""
+        try:
+            await self.collection.insert_many(batch, ordered=False)
+        except Exception as e:
+            logger.error("Error storing %s interactions: %s", len(batch), e)
@@ -7,6 +7,9 @@ from app.models.recommendations.interactions import (
     ContentSelection,
     HighlightedContent,
 )
+from app.services.recommendations.tracking.interaction_batcher import (
+    InteractionBatcher,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -21,6 +24,7 @@ class InteractionProcessor:
         self.interactions_collection = self.db.interactions
         self.engagements_collection = self.db.engagements
         self.selections_collection = self.db.selections
+        self.interaction_batcher = InteractionBatcher(self.interactions_collection)
 
         self._ensure_indexes()
 
@@ -47,29 +51,24 @@ class InteractionProcessor:
 
             logger.info("Successfully created MongoDB indexes")
         except Exception as e:
-            logger.error(f"Error creating indexes: {str(e)}")
+            logger.error("Error creating indexes: %s", e)
 
     async def track_interaction(
         self, user_id: str, interaction: ContentInteraction
     ) -> None:
-        """Store raw interaction data."""
-        try:
-            await self.interactions_collection.insert_one(
-                {
-                    "user_id": user_id,
-                    **interaction.model_dump(),
-                }
-            )
-        except Exception as e:
-            logger.error(f"Error storing interaction: {str(e)}")
-            raise
+        """Queue raw interaction data; it is written with the next batch."""
+        await self.interaction_batcher.submit(user_id, interaction)
+
+    async def close(self) -> None:
+        """Flush interactions that haven't been written yet."""
+        await self.interaction_batcher.close()
 
     async def track_selection(self, selection: ContentSelection) -> None:
         """Track content selection with full context."""
         try:
             await self.selections_collection.insert_one(selection.model_dump())
         except Exception as e:
-            logger.error(f"Error storing selection: {str(e)}")
+            logger.error("Error storing selection: %s", e)
             raise
 
     async def get_content_engagement(
@@ -100,7 +99,7 @@ class InteractionProcessor:
             return engagement
 
         except Exception as e:
-            logger.error(f"Error getting content engagement: {str(e)}")
+            logger.error("Error getting content engagement: %s", e)
             raise
 
     async def get_interactions(
@@ -121,7 +120,12 @@ class InteractionProcessor:
                     content_id=interaction["content_id"],
                     content_url=interaction["content_url"],
                     interaction_type=interaction["interaction_type"],
-                    interaction_data=interaction["interaction_data"],
+                    # Older documents predate the `kind` tag, so derive it from
+                    # the interaction type
+                    interaction_data={
+                        "kind": interaction["interaction_type"],
+                        **interaction["interaction_data"],
+                    },
                     query_context=interaction.get("query_context"),
                     moment_context=interaction.get("moment_context"),
                 )
@@ -129,7 +133,7 @@ class InteractionProcessor:
             ]
 
         except Exception as e:
-            logger.error(f"Error getting user interactions: {str(e)}")
+            logger.error("Error getting user interactions: %s", e)
             raise
 
     async def get_selections(
@@ -156,7 +160,7 @@ class InteractionProcessor:
             ]
 
         except Exception as e:
-            logger.error(f"Error getting user selections: {str(e)}")
+            logger.error("Error getting user selections: %s", e)
             raise
 
     async def get_user_history(
@@ -169,7 +173,7 @@ class InteractionProcessor:
             return interactions, selections
 
         except Exception as e:
-            logger.error(f"Error getting user history: {str(e)}")
+            logger.error("Error getting user history: %s", e)
             raise
 
     async def _process_engagement_metrics(
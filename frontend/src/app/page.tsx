@@ -40,10 +40,7 @@ export default function Home() {
             // Create WebSocket connection
             const ws = new WebSocket(`ws://localhost:8000/ws/query?user_id=${TEST_USER_ID}&query=${encodeURIComponent(queryText)}`);
 
-            ws.onmessage = (event) => {
-                const data = JSON.parse(event.data);
-                console.log('Received websocket message:', data);
-
+            const handleMessage = (data: any) => {
                 if (data.type === 'complete') {
                     setResponse({
                         perplexity_response: data.data.recommendations.perplexity_response,
@@ -63,6 +60,28 @@ export default function Home() {
                 }
             };
 
+            // Large frames arrive zlib-compressed as binary; small ones as plain text
+            const decodeMessage = async (payload: string | Blob): Promise<string> => {
+                if (typeof payload === 'string') {
+                    return payload;
+                }
+                const stream = payload.stream().pipeThrough(new DecompressionStream('deflate'));
+                return new Response(stream).text();
+            };
+
+            // Decoding is async, so chain messages to keep them in order
+            let pending = Promise.resolve();
+            ws.onmessage = (event) => {
+                pending = pending.then(async () => {
+                    const data = JSON.parse(await decodeMessage(event.data));
+                    console.log('Received websocket message:', data);
+
+                    // The backend coalesces messages sent close together into a batch
+                    const messages = Array.isArray(data.batch) ? data.batch : [data];
+                    messages.forEach(handleMessage);
+                });
+            };
+
             ws.onerror = (error) => {
                 console.error('WebSocket error:', error);
                 setError('Connection error');